@@ -0,0 +1,43 @@
+"""conference_keyset_pagination_index
+
+Revision ID: 0c147a6ef23d
+Revises: 60e29a2f7742
+Create Date: 2026-10-17 09:12:05.418263
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0c147a6ef23d'
+down_revision = '60e29a2f7742'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keyset pagination compares (created_at, id); a NULL created_at would fall off every page
+    op.execute("UPDATE conferences SET created_at = now() WHERE created_at IS NULL")
+    op.execute("ALTER TABLE conferences ALTER COLUMN created_at SET NOT NULL")
+
+    # Built concurrently so existing conference tables stay writable
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_conferences_host_created_id',
+            'conferences',
+            ['host_id', 'created_at', 'id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_conferences_host_created_id',
+            table_name='conferences',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute("ALTER TABLE conferences ALTER COLUMN created_at DROP NOT NULL")
@@ -0,0 +1,51 @@
+"""hot_path_indexes
+
+Revision ID: 9b3e5d21c7a4
+Revises: 0c147a6ef23d
+Create Date: 2026-10-17 11:40:27.903114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b3e5d21c7a4'
+down_revision = '0c147a6ef23d'
+branch_labels = None
+depends_on = None
+
+
+# (name, table, columns, partial predicate)
+INDEXES = [
+    # ConferenceService._live_conference_stmt: host_id = ? AND status IN ('STARTED', 'PAUSED')
+    ('ix_conferences_host_live', 'conferences', ['host_id'], "status IN ('STARTED', 'PAUSED')"),
+    # Foreign key lookups, cascade deletes and the stats join
+    ('ix_conference_participants_conference_id', 'conference_participants', ['conference_id'], None),
+    # Active participant counts: conference_id = ? AND left_at IS NULL
+    ('ix_conference_participants_active', 'conference_participants', ['conference_id'], 'left_at IS NULL'),
+    # Transcript of a conference in time order
+    ('ix_translations_conference_created', 'translations', ['conference_id', 'created_at'], None),
+    # Cascade deletes from conference_participants
+    ('ix_translations_speaker_id', 'translations', ['speaker_id'], None),
+]
+
+
+def upgrade() -> None:
+    # Built concurrently so the tables stay writable while indexing
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,64 @@
+"""translation_full_text_search
+
+Revision ID: a8d4c61e0f52
+Revises: f3a81c5d27b9
+Create Date: 2026-10-17 18:02:44.730519
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8d4c61e0f52'
+down_revision = 'f3a81c5d27b9'
+branch_labels = None
+depends_on = None
+
+
+# Language code -> text search config, as of this revision
+TEXT_SEARCH_CONFIGS = {
+    "ar": "arabic", "ca": "catalan", "da": "danish", "de": "german", "el": "greek",
+    "en": "english", "es": "spanish", "eu": "basque", "fi": "finnish", "fr": "french",
+    "ga": "irish", "hi": "hindi", "hu": "hungarian", "hy": "armenian", "id": "indonesian",
+    "it": "italian", "lt": "lithuanian", "nb": "norwegian", "ne": "nepali", "nl": "dutch",
+    "no": "norwegian", "pt": "portuguese", "ro": "romanian", "ru": "russian", "sr": "serbian",
+    "sv": "swedish", "ta": "tamil", "tr": "turkish", "yi": "yiddish",
+}
+
+# (column, text column, language column)
+VECTORS = [
+    ('original_tsv', 'original_text', 'language_from'),
+    ('translated_tsv', 'translated_text', 'language_to'),
+]
+
+
+def upgrade() -> None:
+    # Only configs this server ships (several arrived in PostgreSQL 13); the rest use 'simple'
+    available = set(op.get_bind().execute(sa.text("SELECT cfgname FROM pg_ts_config")).scalars())
+    cases = " ".join(
+        f"WHEN '{code}' THEN '{config}'"
+        for code, config in sorted(TEXT_SEARCH_CONFIGS.items())
+        if config in available
+    )
+    op.execute(
+        "CREATE OR REPLACE FUNCTION translation_ts_config(language text) RETURNS regconfig "
+        "LANGUAGE sql IMMUTABLE PARALLEL SAFE AS "
+        f"$$ SELECT (CASE split_part(lower(language), '-', 1) {cases} ELSE 'simple' END)::regconfig $$"
+    )
+
+    # Stored generated columns rewrite every partition once; the GIN indexes cascade to them
+    for column, source, language in VECTORS:
+        op.add_column(
+            'translations',
+            sa.Column(column, postgresql.TSVECTOR(), sa.Computed(f"to_tsvector(translation_ts_config({language}), {source})", persisted=True)),
+        )
+        op.create_index(f'ix_translations_{column}', 'translations', [column], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    for column, _, _ in reversed(VECTORS):
+        op.drop_index(f'ix_translations_{column}', table_name='translations')
+        op.drop_column('translations', column)
+    op.execute("DROP FUNCTION IF EXISTS translation_ts_config(text)")
@@ -0,0 +1,59 @@
+"""unique_live_conference_per_host
+
+Revision ID: e41f0a9c6b58
+Revises: 9b3e5d21c7a4
+Create Date: 2026-10-17 14:05:51.270846
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e41f0a9c6b58'
+down_revision = '9b3e5d21c7a4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Hosts that raced into several live conferences keep only the most recently started one
+    op.execute(
+        """
+        UPDATE conferences c
+        SET status = 'ENDED', ended_at = COALESCE(c.ended_at, now())
+        WHERE c.status IN ('STARTED', 'PAUSED')
+          AND EXISTS (
+              SELECT 1 FROM conferences o
+              WHERE o.host_id = c.host_id
+                AND o.status IN ('STARTED', 'PAUSED')
+                AND (COALESCE(o.started_at, o.created_at), o.id) > (COALESCE(c.started_at, c.created_at), c.id)
+          )
+        """
+    )
+
+    # The unique index replaces the plain partial index from hot_path_indexes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_conferences_host_live',
+            'conferences',
+            ['host_id'],
+            unique=True,
+            postgresql_where=sa.text("status IN ('STARTED', 'PAUSED')"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index('ix_conferences_host_live', table_name='conferences', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_conferences_host_live',
+            'conferences',
+            ['host_id'],
+            postgresql_where=sa.text("status IN ('STARTED', 'PAUSED')"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index('uq_conferences_host_live', table_name='conferences', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,105 @@
+"""partition_translations_by_month
+
+Revision ID: f3a81c5d27b9
+Revises: e41f0a9c6b58
+Create Date: 2026-10-17 16:20:13.415082
+
+"""
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a81c5d27b9'
+down_revision = 'e41f0a9c6b58'
+branch_labels = None
+depends_on = None
+
+
+COLUMNS = "id, conference_id, speaker_id, original_text, translated_text, language_from, language_to, translation_status, created_at"
+# Monthly partitions created up front past the current month; the app keeps this many ahead afterwards
+MONTHS_AHEAD = 2
+
+
+def _months(first: datetime, last: datetime):
+    index, end = first.year * 12 + first.month - 1, last.year * 12 + last.month - 1
+    while index <= end:
+        yield datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+        index += 1
+
+
+def _next_month(month: datetime) -> datetime:
+    return datetime(month.year + month.month // 12, month.month % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def _create_translations(primary_key, created_at_nullable: bool, **kw) -> None:
+    op.create_table(
+        'translations',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('conference_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('conferences.id', name='translations_conference_id_fkey'), nullable=False),
+        sa.Column('speaker_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('conference_participants.id', name='translations_speaker_id_fkey'), nullable=False),
+        sa.Column('original_text', sa.Text(), nullable=False),
+        sa.Column('translated_text', sa.Text(), nullable=True),
+        sa.Column('language_from', sa.String(length=10), nullable=False),
+        sa.Column('language_to', sa.String(length=10), nullable=False),
+        sa.Column('translation_status', sa.String(length=20), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=created_at_nullable),
+        sa.PrimaryKeyConstraint(*primary_key),
+        **kw,
+    )
+    op.create_index('ix_translations_id', 'translations', ['id'])
+    op.create_index('ix_translations_conference_created', 'translations', ['conference_id', 'created_at'])
+    op.create_index('ix_translations_speaker_id', 'translations', ['speaker_id'])
+
+
+def _rename_old(suffix: str) -> None:
+    # Index and constraint names are per schema, so the old ones move out of the way first
+    op.execute(f"ALTER TABLE translations RENAME TO translations_{suffix}")
+    op.execute(f"ALTER TABLE translations_{suffix} RENAME CONSTRAINT translations_pkey TO translations_{suffix}_pkey")
+    op.execute(f"ALTER TABLE translations_{suffix} RENAME CONSTRAINT translations_conference_id_fkey TO translations_{suffix}_conference_id_fkey")
+    op.execute(f"ALTER TABLE translations_{suffix} RENAME CONSTRAINT translations_speaker_id_fkey TO translations_{suffix}_speaker_id_fkey")
+    for index in ('ix_translations_id', 'ix_translations_conference_created', 'ix_translations_speaker_id'):
+        op.execute(f"ALTER INDEX IF EXISTS {index} RENAME TO {index.replace('translations', f'translations_{suffix}')}")
+
+
+def upgrade() -> None:
+    # Rows are copied in this transaction while writers are blocked by the rename: fine
+    # for the sizes this runs against. A very large table would be attached instead
+    # (ALTER TABLE translations ATTACH PARTITION translations_old DEFAULT after a
+    # CHECK constraint) and drained into the monthly partitions in batches.
+    _rename_old('unpartitioned')
+    _create_translations(
+        ('id', 'created_at'),
+        created_at_nullable=False,
+        postgresql_partition_by='RANGE (created_at)',
+    )
+    op.execute("CREATE TABLE translations_default PARTITION OF translations DEFAULT")
+
+    bind = op.get_bind()
+    now = datetime.now(timezone.utc)
+    first = bind.execute(sa.text("SELECT min(created_at) FROM translations_unpartitioned")).scalar() or now
+    last = now
+    for _ in range(MONTHS_AHEAD):
+        last = _next_month(last.replace(day=1))
+    for month in _months(first.astimezone(timezone.utc), last):
+        op.execute(
+            f"CREATE TABLE translations_y{month.year:04d}m{month.month:02d} PARTITION OF translations "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_next_month(month).isoformat()}')"
+        )
+
+    op.execute(
+        f"INSERT INTO translations ({COLUMNS}) "
+        f"SELECT {COLUMNS.replace('created_at', 'COALESCE(created_at, now())')} FROM translations_unpartitioned"
+    )
+    op.drop_table('translations_unpartitioned')
+
+
+def downgrade() -> None:
+    _rename_old('partitioned')
+    _create_translations(('id',), created_at_nullable=True)
+    op.execute(f"INSERT INTO translations ({COLUMNS}) SELECT {COLUMNS} FROM translations_partitioned")
+    # Drops every partition with it
+    op.drop_table('translations_partitioned')
@@ -1,40 +1,53 @@
+from typing import Optional
+from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from app.core.database import get_db
+from app.core.database import AsyncSessionLocal, get_db
 from app.core.security import verify_token
 from app.models.user import User
+from app.services.auth_cache import Principal, auth_cache
 
 security = HTTPBearer()
 
+def _credentials_exception(detail: str = "Could not validate credentials") -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+def token_user_id(token: str) -> Optional[UUID]:
+    """User id from a bearer token; verified claims are cached until the token expires"""
+    payload = auth_cache.get_claims(token)
+    if payload is None:
+        payload = verify_token(token)
+        if payload is not None:
+            auth_cache.set_claims(token, payload)
+    user_id = payload.get("sub") if payload else None
+    try:
+        return UUID(str(user_id)) if user_id is not None else None
+    except ValueError:
+        return None
+
+def _principal(user) -> Principal:
+    return Principal(user.id, bool(user.is_active), bool(user.is_superuser))
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
-    token = credentials.credentials
-    payload = verify_token(token)
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    user_id: int = payload.get("sub")
+    user_id = token_user_id(credentials.credentials)
     if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _credentials_exception()
     
+    generation = auth_cache.generation
     user = db.query(User).filter(User.id == user_id).first()
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _credentials_exception("User not found")
+    # Warm the principal for the id-only endpoints
+    auth_cache.set_principal(_principal(user), generation)
     
     return user
 
@@ -43,7 +56,35 @@ def get_current_active_user(current_user: User = Depends(get_current_user)) -> U
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
-def get_current_superuser(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> Principal:
+    """Caller's id and flags; only a principal cache miss reads the database"""
+    user_id = token_user_id(credentials.credentials)
+    if user_id is None:
+        raise _credentials_exception()
+    
+    principal = auth_cache.get_principal(user_id)
+    if principal is None:
+        generation = auth_cache.generation
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(User.id, User.is_active, User.is_superuser).where(User.id == user_id)
+            )
+            row = result.first()
+        if row is None:
+            raise _credentials_exception("User not found")
+        principal = _principal(row)
+        auth_cache.set_principal(principal, generation)
+    
+    return principal
+
+async def get_current_active_principal(current_user: Principal = Depends(get_current_principal)) -> Principal:
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
+def get_current_superuser(current_user: Principal = Depends(get_current_principal)) -> Principal:
     if not current_user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -1,7 +1,9 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, conferences
+from app.api.v1.endpoints import auth, conferences, metrics, realtime
 
 api_router = APIRouter()
 
 api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
 api_router.include_router(conferences.router, prefix="/conferences", tags=["conferences"])
+api_router.include_router(realtime.router, prefix="/realtime", tags=["realtime"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
-from app.core.database import get_db
-from app.core.security import verify_password, create_access_token, get_password_hash
+from app.core.database import get_async_db
+from app.core.security import create_access_token, get_password_hash_async, verify_password_async
 from app.core.config import settings
 from app.models.user import User
 from app.schemas.user import UserCreate, User as UserSchema, UserLogin
@@ -12,9 +13,9 @@ from app.api.deps import get_current_active_user
 router = APIRouter()
 
 @router.post("/signup", response_model=UserSchema)
-def register(user: UserCreate, db: Session = Depends(get_db)):
+async def register(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
     # Check if user already exists
-    db_user = db.query(User).filter(User.email == user.email).first()
+    db_user = (await db.execute(select(User).where(User.email == user.email))).scalars().first()
     if db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -25,15 +26,16 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
     if not user.username:
         user.username = user.email.split('@')[0]
     
-    db_user = db.query(User).filter(User.username == user.username).first()
+    db_user = (await db.execute(select(User).where(User.username == user.username))).scalars().first()
     if db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already taken"
         )
     
-    # Create new user
-    hashed_password = get_password_hash(user.password)
+    # Create new user (connection released while bcrypt runs)
+    await db.commit()
+    hashed_password = await get_password_hash_async(user.password)
     db_user = User(
         email=user.email,
         username=user.username,
@@ -44,15 +46,22 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
     )
     
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     
     return db_user
 
 @router.post("/signin")
-def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == user_credentials.email).first()
-    if not user or not verify_password(user_credentials.password, user.hashed_password):
+async def login(user_credentials: UserLogin, db: AsyncSession = Depends(get_async_db)):
+    user = (await db.execute(select(User).where(User.email == user_credentials.email))).scalars().first()
+    # End the read transaction so no pool connection is held while bcrypt runs
+    await db.commit()
+    
+    # Guest users have no password to sign in with
+    valid, new_hash = (False, None)
+    if user and user.hashed_password:
+        valid, new_hash = await verify_password_async(user_credentials.password, user.hashed_password)
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -65,6 +74,12 @@ def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
             detail="Inactive user"
         )
     
+    if new_hash is not None:
+        # Stored with another bcrypt cost (BCRYPT_ROUNDS changed): upgrade it now we know the password
+        user.hashed_password = new_hash
+        await db.commit()
+        await db.refresh(user)
+    
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data={"sub": str(user.id)}, expires_delta=access_token_expires
@@ -1,22 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Optional
 from uuid import UUID
-from app.core.database import get_db
-from app.api.deps import get_current_active_user
-from app.models.user import User
+from app.core.database import get_db, get_async_db
+from app.api.deps import get_current_active_principal
+from app.services.auth_cache import Principal
 from app.schemas.conference import (
     ConferenceCreate, 
     ConferenceUpdate, 
     Conference, 
     ConferenceList,
-    ConferenceWithParticipants,
     ConferenceStartRequest,
     ConferencePauseRequest,
     ConferenceEndRequest,
-    ConferenceResumeRequest
+    ConferenceResumeRequest,
+    TranscriptFormat,
+    TranscriptSearchResults
 )
+from app.services.conference_cache import conference_cache
 from app.services.conference_service import ConferenceService
+from app.services.transcript_export import MEDIA_TYPES, export_filename, stream_transcript
+from app.services.transcript_search import search_transcripts
 from app.models.conference import ConferenceType
 
 router = APIRouter()
@@ -25,7 +31,7 @@ router = APIRouter()
 def create_conference(
     conference_data: ConferenceCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_principal)
 ):
     """Create a new conference (authenticated users only)"""
     try:
@@ -70,14 +76,14 @@ def create_guest_conference(
 
 # Conference Status Management Endpoints
 @router.post("/{conference_id}/start", response_model=Conference)
-def start_conference(
+async def start_conference(
     conference_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_active_principal)
 ):
     """Start a pending conference"""
     try:
-        conference = ConferenceService.start_conference(
+        conference = await ConferenceService.start_conference_async(
             db=db, 
             conference_id=conference_id, 
             host_id=current_user.id
@@ -95,14 +101,14 @@ def start_conference(
         )
 
 @router.post("/{conference_id}/pause", response_model=Conference)
-def pause_conference(
+async def pause_conference(
     conference_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_active_principal)
 ):
     """Pause a started conference"""
     try:
-        conference = ConferenceService.pause_conference(
+        conference = await ConferenceService.pause_conference_async(
             db=db, 
             conference_id=conference_id, 
             host_id=current_user.id
@@ -120,14 +126,14 @@ def pause_conference(
         )
 
 @router.post("/{conference_id}/resume", response_model=Conference)
-def resume_conference(
+async def resume_conference(
     conference_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_active_principal)
 ):
     """Resume a paused conference"""
     try:
-        conference = ConferenceService.resume_conference(
+        conference = await ConferenceService.resume_conference_async(
             db=db, 
             conference_id=conference_id, 
             host_id=current_user.id
@@ -145,14 +151,14 @@ def resume_conference(
         )
 
 @router.post("/{conference_id}/end", response_model=Conference)
-def end_conference(
+async def end_conference(
     conference_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_active_principal)
 ):
     """End a conference"""
     try:
-        conference = ConferenceService.end_conference(
+        conference = await ConferenceService.end_conference_async(
             db=db, 
             conference_id=conference_id, 
             host_id=current_user.id
@@ -169,36 +175,80 @@ def end_conference(
             detail=f"Failed to end conference: {str(e)}"
         )
 
-@router.get("/", response_model=List[ConferenceWithParticipants])
-def get_my_conferences(
+@router.get("/", response_model=ConferenceList)
+async def get_my_conferences(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    cursor: Optional[str] = Query(None, max_length=200),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_active_principal)
 ):
-    """Get conferences where current user is host"""
-    conferences = ConferenceService.get_conferences_with_participant_count(
-        db=db, 
-        user_id=current_user.id, 
-        skip=skip, 
-        limit=limit
-    )
-    return conferences
+    """
+    Get a page of conferences where current user is host, newest first.
+    Pass the returned next_cursor to fetch the following page; skip is
+    still honoured when no cursor is given.
+    """
+    try:
+        return await ConferenceService.get_conferences_with_participant_count_async(
+            db=db, 
+            user_id=current_user.id, 
+            skip=skip, 
+            limit=limit,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
 @router.get("/stats")
 def get_conference_stats(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_principal)
 ):
     """Get conference statistics for current user"""
     stats = ConferenceService.get_conference_stats(db=db, user_id=current_user.id)
     return stats
 
+@router.get("/transcripts/search", response_model=TranscriptSearchResults)
+async def search_conference_transcripts(
+    q: str = Query(..., min_length=1, max_length=200),
+    language: str = Query(..., min_length=2, max_length=10),
+    conference_id: Optional[UUID] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, max_length=300),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_active_principal)
+):
+    """
+    Full-text search over the transcripts of the current user's conferences,
+    best match first with the hits highlighted. `q` takes web search syntax
+    ("quoted phrases", OR, -exclusions) in `language`: original text spoken
+    in it and translations into it are searched. Pass the returned
+    next_cursor to fetch the following page.
+    """
+    try:
+        return await search_transcripts(
+            db=db,
+            user_id=current_user.id,
+            query=q,
+            language=language,
+            conference_id=conference_id,
+            limit=limit,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
 @router.get("/{conference_id}", response_model=Conference)
 def get_conference(
     conference_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_principal)
 ):
     """Get conference by ID (only host can access)"""
     conference = ConferenceService.get_conference_by_id(db=db, conference_id=conference_id)
@@ -216,53 +266,78 @@ def get_conference(
     
     return conference
 
-@router.get("/code/{conference_code}", response_model=Conference)
-def get_conference_by_code(
-    conference_code: str,
-    db: Session = Depends(get_db)
+@router.get("/{conference_id}/transcript")
+async def export_transcript(
+    conference_id: UUID,
+    export_format: TranscriptFormat = Query(TranscriptFormat.NDJSON, alias="format"),
+    language: Optional[str] = Query(None, max_length=10),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_active_principal)
 ):
-    """Get conference by conference code (public access)"""
-    conference = ConferenceService.get_conference_by_code(db=db, conference_code=conference_code)
+    """
+    Download the conference transcript (only host can access) as NDJSON, CSV,
+    SRT or WebVTT, optionally for one target language. Streamed from a
+    server-side cursor, so long conferences do not grow memory.
+    """
+    conference = await ConferenceService.get_conference_by_id_async(db=db, conference_id=conference_id)
     if not conference:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="NOT_FOUND"
+            detail="Conference not found"
         )
-
-    # Return explicit errors by status per frontend join rules
-    if conference.status.name == "ENDED":
+    
+    if conference.host_id != current_user.id:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="ENDED"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this conference"
         )
-    if conference.status.name == "PAUSED":
+    
+    return StreamingResponse(
+        stream_transcript(conference, export_format, language),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{export_filename(conference, export_format)}"'}
+    )
+
+@router.get("/code/{conference_code}", response_model=Conference)
+async def get_conference_by_code(conference_code: str):
+    """Get conference by conference code (public access)"""
+    snapshot = await ConferenceService.get_join_snapshot_async(conference_code=conference_code)
+    if snapshot is None:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="PAUSED"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="NOT_FOUND"
         )
-    if conference.status.name == "CANCELLED":
+
+    # Return explicit errors by status per frontend join rules
+    if snapshot.status in ("ENDED", "PAUSED", "CANCELLED"):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="CANCELLED"
+            detail=snapshot.status
         )
 
-    # Allow join for PENDING or STARTED
-    return conference
+    # Allow join for PENDING or STARTED; the cached bytes are already the response body
+    return Response(content=snapshot.body, media_type="application/json")
 
 @router.put("/{conference_id}", response_model=Conference)
 def update_conference(
     conference_id: UUID,
     conference_data: ConferenceUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_principal)
 ):
     """Update conference (only host can update)"""
-    conference = ConferenceService.update_conference(
-        db=db, 
-        conference_id=conference_id, 
-        conference_data=conference_data, 
-        user_id=current_user.id
-    )
+    try:
+        conference = ConferenceService.update_conference(
+            db=db, 
+            conference_id=conference_id, 
+            conference_data=conference_data, 
+            user_id=current_user.id
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
     if not conference:
         raise HTTPException(
@@ -276,7 +351,7 @@ def update_conference(
 def delete_conference(
     conference_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_principal)
 ):
     """Delete conference (only host can delete)"""
     success = ConferenceService.delete_conference(
@@ -297,7 +372,7 @@ def delete_conference(
 def toggle_conference_status(
     conference_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_principal)
 ):
     """Toggle conference active status (only host can toggle)"""
     conference = ConferenceService.get_conference_by_id(db=db, conference_id=conference_id)
@@ -316,5 +391,7 @@ def toggle_conference_status(
     conference.is_active = not conference.is_active
     db.commit()
     db.refresh(conference)
+    # is_active is part of the cached join snapshot
+    conference_cache.invalidate(conference.conference_code)
     
     return conference
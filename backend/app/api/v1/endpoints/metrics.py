@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends
+from app.api.deps import get_current_superuser
+from app.core.database import get_pool_stats
+from app.services.auth_cache import Principal, auth_cache
+from app.services.conference_cache import conference_cache
+from app.services.realtime_service import room_manager
+from app.services.translation_partitions import translation_partitions
+from app.services.translation_service import translation_service
+
+router = APIRouter()
+
+@router.get("/")
+async def get_metrics(current_user: Principal = Depends(get_current_superuser)):
+    """
+    Runtime pool/queue statistics for capacity sizing (superusers only).
+    Runs on the event loop: the rooms and stats it walks are mutated there.
+    """
+    return {
+        "database_pool": get_pool_stats(),
+        "auth_cache": auth_cache.get_stats(),
+        "conference_cache": conference_cache.get_stats(),
+        "realtime": room_manager.get_stats(),
+        "translation_pool": translation_service.get_pool_stats(),
+        "translation_cache": translation_service.cache.get_stats() if translation_service.cache else None,
+        "translation_single_flight": translation_service.get_single_flight_stats(),
+        "translation_providers": translation_service.get_provider_stats(),
+        "translation_batching": translation_service.batcher.get_stats() if translation_service.batcher else None,
+        "translation_partitions": translation_partitions.get_stats(),
+    }
+
+@router.get("/realtime/{conference_code}")
+async def get_room_metrics(conference_code: str, current_user: Principal = Depends(get_current_superuser)):
+    """Per-connection send queue depth and drop counters for one room"""
+    return room_manager.get_connection_stats(conference_code)
@@ -0,0 +1,163 @@
+import base64
+import binascii
+import json
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect, status
+
+from app.api.deps import token_user_id
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.conference import ConferenceStatus
+from app.services.conference_service import ConferenceService
+from app.services.realtime_service import RoomConnection, room_manager
+
+router = APIRouter()
+
+CLOSED_STATUSES = {ConferenceStatus.ENDED, ConferenceStatus.CANCELLED}
+# Longest client-chosen id (segment_id, chunk_id) that is kept
+MAX_CLIENT_ID_LENGTH = 64
+MAX_LANGUAGE_LENGTH = 10
+
+
+async def _load_conference(conference_code: str, participant_id: Optional[UUID], user_id: Optional[UUID]):
+    """The conference and the caller's active participant in it, if any"""
+    async with AsyncSessionLocal() as db:
+        conference = await ConferenceService.get_conference_by_code_async(db=db, conference_code=conference_code)
+        participant = None
+        if conference is not None:
+            participant = await ConferenceService.get_active_participant_async(
+                db=db, conference_id=conference.id, participant_id=participant_id, user_id=user_id
+            )
+        return conference, participant
+
+
+def _can_speak(participant, user_id: Optional[UUID]) -> bool:
+    """
+    Whether the connecting client may publish: an active participant with
+    can_speak, and for a registered user's participant a token of that user
+    """
+    if participant is None or not participant.can_speak:
+        return False
+    return participant.user_id is None or participant.user_id == user_id
+
+
+def _client_id(message: dict, key: str) -> Optional[str]:
+    """A client-chosen id as a capped string; None when missing or not a string or integer"""
+    value = message.get(key)
+    if isinstance(value, bool) or not isinstance(value, (str, int)) or value == "":
+        return None
+    return str(value)[:MAX_CLIENT_ID_LENGTH]
+
+
+def _language(message: dict, default: str) -> str:
+    """The message's source language, or default when missing or not a short string"""
+    language = message.get("language")
+    if isinstance(language, str) and 0 < len(language) <= MAX_LANGUAGE_LENGTH:
+        return language
+    return default
+
+
+@router.websocket("/conferences/{conference_code}")
+async def conference_socket(
+    websocket: WebSocket,
+    conference_code: str,
+    lang: Optional[str] = Query(None, max_length=MAX_LANGUAGE_LENGTH),
+    participant_id: Optional[UUID] = Query(None),
+    name: Optional[str] = Query(None, max_length=100),
+    token: Optional[str] = Query(None),
+):
+    """
+    Realtime transcript/translation stream for a conference room.
+
+    Clients receive transcripts translated into `lang` (defaults to the
+    conference's language_to) and may publish their own transcripts:
+    {"type": "transcript", "text": "...", "is_final": true, "segment_id": "...", "language": "en"}
+    or, when the worker pipeline is enabled, audio to be transcribed:
+    {"type": "audio", "data": "<base64>", "chunk_id": "...", "language": "en"}
+    A chunk_id is the idempotency key of a final transcript or audio chunk:
+    resending the same one is not processed twice. Ids are cut to 64
+    characters; a language or id of the wrong type is ignored.
+
+    participant_id is checked against the conference's active participants
+    when the socket connects; an unknown one is ignored, so transcripts are
+    only attributed (and saved to history) under a verified participant.
+    Anyone with the code may listen, but only a participant with can_speak
+    may publish; a registered user's participant also needs the user's
+    access token (`token`, as browsers cannot set headers on a WebSocket),
+    which on its own also selects that user's participant.
+    """
+    user_id = token_user_id(token) if token else None
+    conference, participant = await _load_conference(conference_code, participant_id, user_id)
+    if conference is None or conference.status in CLOSED_STATUSES:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    verified_id = participant.id if participant is not None else None
+    display_name = name or (participant.guest_name if participant is not None else None)
+    connection = RoomConnection(
+        websocket=websocket,
+        conference_code=conference_code,
+        language=lang or conference.language_to or "en",
+        participant_id=verified_id,
+        display_name=display_name,
+    )
+    await room_manager.join(conference.id, connection)
+    default_source = conference.language_from or "en"
+    can_speak = _can_speak(participant, user_id)
+    speaker = {
+        "participant_id": str(verified_id) if verified_id else None,
+        "name": display_name,
+    }
+
+    try:
+        while True:
+            raw = await websocket.receive_text()
+            try:
+                message = json.loads(raw)
+            except ValueError:
+                continue
+            if not isinstance(message, dict):
+                continue
+
+            message_type = message.get("type")
+            if message_type in ("transcript", "audio") and not can_speak:
+                connection.enqueue('{"type":"error","detail":"not allowed to speak"}')
+                continue
+            if message_type == "transcript":
+                await room_manager.publish_transcript(
+                    conference_code=conference_code,
+                    text=str(message.get("text") or "").strip(),
+                    source_language=_language(message, default_source),
+                    is_final=bool(message.get("is_final", True)),
+                    segment_id=_client_id(message, "segment_id"),
+                    speaker=speaker,
+                    chunk_id=_client_id(message, "chunk_id"),
+                )
+            elif message_type == "audio":
+                try:
+                    audio = base64.b64decode(str(message.get("data") or ""), validate=True)
+                except binascii.Error:
+                    continue
+                if len(audio) > settings.PIPELINE_MAX_AUDIO_BYTES:
+                    connection.enqueue('{"type":"error","detail":"audio chunk too large"}')
+                    continue
+                accepted = await room_manager.publish_audio(
+                    conference_code=conference_code,
+                    audio=audio,
+                    source_language=_language(message, default_source),
+                    is_final=bool(message.get("is_final", True)),
+                    segment_id=_client_id(message, "segment_id"),
+                    speaker=speaker,
+                    chunk_id=_client_id(message, "chunk_id"),
+                )
+                if not accepted:
+                    connection.enqueue('{"type":"error","detail":"audio not accepted"}')
+            elif message_type == "ping":
+                connection.enqueue('{"type":"pong"}')
+    except WebSocketDisconnect:
+        pass
+    finally:
+        await room_manager.leave(connection)
@@ -0,0 +1,60 @@
+"""
+Celery app of the realtime pipeline. Tasks live in app.tasks; a worker
+serves the language queues passed with -Q, e.g.
+
+    celery -A app.celery_app worker -Q audio.en,text.en-vi,text.en-fr --concurrency 8
+"""
+import re
+
+from celery import Celery
+
+from app.core.config import settings
+
+TRANSCRIBE_TASK = "pipeline.transcribe_chunk"
+TRANSLATE_TASK = "pipeline.translate_segment"
+
+
+def _queue_part(language: str) -> str:
+    return re.sub(r"[^a-z0-9-]", "", (language or "").lower())[:10] or "und"
+
+
+def audio_queue(source_language: str) -> str:
+    """Speech-to-text only depends on the spoken language"""
+    return f"audio.{_queue_part(source_language)}"
+
+
+def text_queue(source_language: str, target_language: str) -> str:
+    return f"text.{_queue_part(source_language)}-{_queue_part(target_language)}"
+
+
+def idempotency_key(conference_code: str, chunk_id: str, stage: str) -> str:
+    """Redis key claiming one stage of one chunk (shared by the gateway and the workers)"""
+    return f"pipeline:chunk:{conference_code}:{chunk_id}:{stage}"
+
+
+celery_app = Celery(
+    "realtime_translator",
+    broker=settings.CELERY_BROKER_URL or settings.REDIS_URL,
+    include=["app.tasks"],
+)
+
+celery_app.conf.update(
+    task_serializer="json",
+    accept_content=["json"],
+    # Results are published to the room over Redis pub/sub, never stored
+    task_ignore_result=True,
+    # Acked once the task ran: a chunk on a worker that dies is redelivered, and the
+    # chunk's idempotency key keeps the redelivery from being published twice
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=settings.PIPELINE_PREFETCH_MULTIPLIER,
+    task_time_limit=settings.PIPELINE_TASK_TIME_LIMIT_SECONDS,
+    # Unacked tasks return to the queue after this; longer than a reserved task can wait and run
+    broker_transport_options={
+        "visibility_timeout": int(2 * (settings.PIPELINE_TASK_EXPIRES_SECONDS + settings.PIPELINE_TASK_TIME_LIMIT_SECONDS)),
+    },
+    # The gateway falls back to translating in process rather than wait for a broker that is down
+    task_publish_retry_policy={"max_retries": 1, "interval_start": 0, "interval_step": 0.1},
+    broker_connection_retry_on_startup=True,
+    worker_send_task_events=False,
+)
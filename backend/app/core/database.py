@@ -1,13 +1,51 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from .config import settings
+from .db_pool import PoolMetrics, instrumented_pool
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+def _async_database_url(url: str) -> str:
+    """Same database through the asyncpg driver"""
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+def _pool_options() -> dict:
+    """Pool sizing shared by both engines (each engine gets its own pool)"""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+pool_metrics = {
+    "sync": PoolMetrics("sync", settings.DB_SLOW_QUERY_MS),
+    "async": PoolMetrics("async", settings.DB_SLOW_QUERY_MS),
+}
+
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    poolclass=instrumented_pool(QueuePool, pool_metrics["sync"]),
+    **_pool_options(),
+)
+pool_metrics["sync"].attach(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for hot endpoints served on the event loop (no threadpool hop)
+async_engine = create_async_engine(
+    _async_database_url(SQLALCHEMY_DATABASE_URL),
+    poolclass=instrumented_pool(AsyncAdaptedQueuePool, pool_metrics["async"]),
+    **_pool_options(),
+)
+pool_metrics["async"].attach(async_engine.sync_engine)
+# expire_on_commit=False: committed objects stay readable without implicit async IO
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 def get_db():
@@ -16,3 +54,10 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def get_pool_stats() -> dict:
+    return {name: metrics.get_stats() for name, metrics in pool_metrics.items()}
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,103 @@
+import logging
+import time
+from typing import Optional, Type
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool
+
+logger = logging.getLogger(__name__)
+
+
+class PoolMetrics:
+    """Checkout wait time, pool occupancy and slow queries for one engine"""
+
+    def __init__(self, name: str, slow_query_ms: float = 0.0):
+        self.name = name
+        self.slow_query_ms = slow_query_ms
+        self.engine: Optional[Engine] = None
+        self.stats = {
+            "checkouts": 0,
+            "checkout_timeouts": 0,
+            "wait_total_ms": 0.0,
+            "wait_max_ms": 0.0,
+            "invalidated": 0,
+            "slow_queries": 0,
+        }
+
+    def record_checkout(self, waited: float, timed_out: bool = False) -> None:
+        waited_ms = waited * 1000
+        self.stats["wait_total_ms"] += waited_ms
+        self.stats["wait_max_ms"] = max(self.stats["wait_max_ms"], waited_ms)
+        if timed_out:
+            self.stats["checkout_timeouts"] += 1
+        else:
+            self.stats["checkouts"] += 1
+
+    def attach(self, engine: Engine) -> None:
+        """Hook invalidation counting and the slow-query log on a (sync) engine"""
+        self.engine = engine
+
+        @event.listens_for(engine, "invalidate")
+        def _on_invalidate(dbapi_connection, connection_record, exception):
+            self.stats["invalidated"] += 1
+
+        if self.slow_query_ms <= 0:
+            return
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def _before_execute(conn, cursor, statement, parameters, context, executemany):
+            # Per-execution context: a failed statement leaves nothing behind
+            context._query_started = time.perf_counter()
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def _after_execute(conn, cursor, statement, parameters, context, executemany):
+            started = getattr(context, "_query_started", None)
+            if started is None:
+                return
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if elapsed_ms >= self.slow_query_ms:
+                self.stats["slow_queries"] += 1
+                logger.warning(
+                    "Slow query on %s engine (%.1f ms): %s",
+                    self.name, elapsed_ms, " ".join(statement.split())[:500],
+                )
+
+    def get_stats(self) -> dict:
+        stats = dict(self.stats)
+        attempts = stats["checkouts"] + stats["checkout_timeouts"]
+        stats["wait_avg_ms"] = round(stats["wait_total_ms"] / attempts, 3) if attempts else 0.0
+        stats["wait_total_ms"] = round(stats["wait_total_ms"], 3)
+        stats["wait_max_ms"] = round(stats["wait_max_ms"], 3)
+        # engine.dispose() swaps in a fresh pool, so always read the current one
+        pool = self.engine.pool if self.engine is not None else None
+        if pool is not None and hasattr(pool, "checkedout"):
+            stats["size"] = pool.size()
+            stats["in_use"] = pool.checkedout()
+            stats["idle"] = pool.checkedin()
+            # QueuePool counts negative overflow while the base pool is still filling
+            stats["overflow"] = max(pool.overflow(), 0)
+        return stats
+
+
+def instrumented_pool(pool_class: Type[Pool], metrics: PoolMetrics) -> Type[Pool]:
+    """
+    Subclass of pool_class that times every checkout into metrics.
+
+    The pool emits no event before a checkout starts waiting, so the wait is
+    measured around _do_get. Pool.recreate() (engine.dispose()) instantiates
+    self.__class__, which keeps the instrumentation.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = pool_class._do_get(self)
+        except PoolTimeoutError:
+            metrics.record_checkout(time.perf_counter() - started, timed_out=True)
+            raise
+        metrics.record_checkout(time.perf_counter() - started)
+        return connection
+
+    return type(f"Instrumented{pool_class.__name__}", (pool_class,), {"_do_get": _do_get})
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Text, Integer, ForeignKey, Enum
+from sqlalchemy import Column, String, Boolean, DateTime, Text, Integer, ForeignKey, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -34,11 +34,24 @@ class Conference(Base):
     scheduled_at = Column(DateTime(timezone=True), nullable=True)  # Thời gian dự kiến bắt đầu
     started_at = Column(DateTime(timezone=True), nullable=True)    # Thời gian thực tế bắt đầu
     ended_at = Column(DateTime(timezone=True), nullable=True)     # Thời gian kết thúc
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     host = relationship("User", back_populates="hosted_conferences")
     participants = relationship("ConferenceParticipant", back_populates="conference", cascade="all, delete-orphan")
-    translations = relationship("Translation", back_populates="conference", cascade="all, delete-orphan")
+    # Bulk-deleted by ConferenceService.delete_conference, never loaded for the cascade
+    translations = relationship("Translation", back_populates="conference", cascade="all, delete-orphan", passive_deletes=True)
     settings = relationship("ConferenceSettings", back_populates="conference", uselist=False, cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # Keyset pagination of a host's conferences by (created_at, id)
+        Index("ix_conferences_host_created_id", "host_id", "created_at", "id"),
+        # At most one live (STARTED/PAUSED) conference per host; also serves the live lookup
+        Index(
+            "uq_conferences_host_live",
+            "host_id",
+            unique=True,
+            postgresql_where=status.in_([ConferenceStatus.STARTED, ConferenceStatus.PAUSED]),
+        ),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -21,4 +21,10 @@ class ConferenceParticipant(Base):
     # Relationships
     conference = relationship("Conference", back_populates="participants")
     user = relationship("User", back_populates="conference_participations")
-    translations = relationship("Translation", back_populates="speaker", cascade="all, delete-orphan")
+    translations = relationship("Translation", back_populates="speaker", cascade="all, delete-orphan", passive_deletes=True)
+    
+    __table_args__ = (
+        Index("ix_conference_participants_conference_id", "conference_id"),
+        # Active participant counts only touch people still in the room
+        Index("ix_conference_participants_active", "conference_id", postgresql_where=left_at.is_(None)),
+    )
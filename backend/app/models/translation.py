@@ -1,10 +1,38 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import DDL, Column, Computed, String, Text, DateTime, ForeignKey, Index, event, text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from app.core.database import Base
 import uuid
 
+# Catches rows outside every monthly partition (see services/translation_partitions.py)
+DEFAULT_PARTITION = "translations_default"
+
+# Language code -> PostgreSQL text search config; other languages (and configs
+# the server lacks) fall back to 'simple', which only lowercases
+TEXT_SEARCH_CONFIGS = {
+    "ar": "arabic", "ca": "catalan", "da": "danish", "de": "german", "el": "greek",
+    "en": "english", "es": "spanish", "eu": "basque", "fi": "finnish", "fr": "french",
+    "ga": "irish", "hi": "hindi", "hu": "hungarian", "hy": "armenian", "id": "indonesian",
+    "it": "italian", "lt": "lithuanian", "nb": "norwegian", "ne": "nepali", "nl": "dutch",
+    "no": "norwegian", "pt": "portuguese", "ro": "romanian", "ru": "russian", "sr": "serbian",
+    "sv": "swedish", "ta": "tamil", "tr": "turkish", "yi": "yiddish",
+}
+
+
+def ts_config_function_sql(available) -> str:
+    """translation_ts_config(language): IMMUTABLE, so generated columns and GIN indexes can use it"""
+    cases = " ".join(
+        f"WHEN '{code}' THEN '{config}'"
+        for code, config in sorted(TEXT_SEARCH_CONFIGS.items())
+        if config in available
+    )
+    return (
+        "CREATE OR REPLACE FUNCTION translation_ts_config(language text) RETURNS regconfig "
+        "LANGUAGE sql IMMUTABLE PARALLEL SAFE AS "
+        f"$$ SELECT (CASE split_part(lower(language), '-', 1) {cases} ELSE 'simple' END)::regconfig $$"
+    )
+
 class Translation(Base):
     __tablename__ = "translations"
     
@@ -16,8 +44,38 @@ class Translation(Base):
     language_from = Column(String(10), nullable=False)
     language_to = Column(String(10), nullable=False)
     translation_status = Column(String(20), default="pending")  # pending, processing, completed, failed
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Partition key, so part of the primary key
+    created_at = Column(DateTime(timezone=True), primary_key=True, nullable=False, server_default=func.now())
+    # Full-text search, each text in its own language's config; only read inside queries
+    original_tsv = deferred(Column(
+        TSVECTOR, Computed("to_tsvector(translation_ts_config(language_from), original_text)", persisted=True)
+    ))
+    translated_tsv = deferred(Column(
+        TSVECTOR, Computed("to_tsvector(translation_ts_config(language_to), translated_text)", persisted=True)
+    ))
     
     # Relationships
     conference = relationship("Conference", back_populates="translations")
     speaker = relationship("ConferenceParticipant", back_populates="translations")
+    
+    __table_args__ = (
+        # A conference's transcript in time order
+        Index("ix_translations_conference_created", "conference_id", "created_at"),
+        Index("ix_translations_speaker_id", "speaker_id"),
+        Index("ix_translations_original_tsv", "original_tsv", postgresql_using="gin"),
+        Index("ix_translations_translated_tsv", "translated_tsv", postgresql_using="gin"),
+        # Monthly partitions: retention drops whole months
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+@event.listens_for(Translation.__table__, "before_create")
+def _create_ts_config_function(target, connection, **kw):
+    available = set(connection.execute(text("SELECT cfgname FROM pg_ts_config")).scalars())
+    connection.execute(text(ts_config_function_sql(available)))
+
+# create_all() makes only the parent; rows need somewhere to go until the monthly partitions exist
+event.listen(
+    Translation.__table__,
+    "after_create",
+    DDL(f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF translations DEFAULT"),
+)
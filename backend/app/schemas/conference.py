@@ -61,10 +61,11 @@ class ConferenceWithParticipants(Conference):
     participant_count: int = 0
 
 class ConferenceList(BaseModel):
-    conferences: List[Conference] = []
+    conferences: List[ConferenceWithParticipants] = []
     total: int
     page: int
     size: int
+    next_cursor: Optional[str] = None
 
 # New schemas for conference management
 class ConferenceStartRequest(BaseModel):
@@ -78,3 +79,29 @@ class ConferenceEndRequest(BaseModel):
 
 class ConferenceResumeRequest(BaseModel):
     conference_id: UUID
+
+class TranscriptFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+    SRT = "srt"
+    VTT = "vtt"
+
+class TranscriptSearchHit(BaseModel):
+    id: UUID
+    conference_id: UUID
+    conference_title: str
+    created_at: datetime
+    speaker: Optional[str] = None
+    language_from: str
+    language_to: str
+    original_text: str
+    translated_text: Optional[str] = None
+    # Matching fragments with <mark> around the hits (HTML-escaped); None when that side is in another language
+    original_highlight: Optional[str] = None
+    translated_highlight: Optional[str] = None
+    rank: float
+
+class TranscriptSearchResults(BaseModel):
+    hits: List[TranscriptSearchHit] = []
+    size: int
+    next_cursor: Optional[str] = None
@@ -0,0 +1,132 @@
+import threading
+import time
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import settings
+from app.models.user import User
+from app.services.ttl_cache import TTLCache
+
+
+class Principal(NamedTuple):
+    """The part of a user that authorization needs"""
+    id: UUID
+    is_active: bool
+    is_superuser: bool
+
+
+class AuthCache:
+    """
+    In-process cache for the authentication fast path: decoded JWT claims by
+    token and the Principal by user id, so a request that only needs the
+    caller's id does not touch the database.
+
+    Claims never outlive the token's own exp. Principals are dropped when the
+    User row is updated or deleted through the ORM (see the session hooks
+    below); changes made elsewhere, or on another node, show up within
+    ttl_seconds.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, enabled: bool = True):
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self._claims = TTLCache(max_entries)
+        self._principals = TTLCache(max_entries)
+        # Bumped by every invalidation so a load that raced one does not store what it read.
+        # Sync endpoints and session hooks run in the threadpool, hence the lock
+        self.generation = 0
+        self._lock = threading.Lock()
+        self.stats = {
+            "claims_hits": 0,
+            "claims_misses": 0,
+            "principal_hits": 0,
+            "principal_misses": 0,
+            "invalidations": 0,
+            "evictions": 0,
+        }
+
+    def get_claims(self, token: str) -> Optional[dict]:
+        if not self.enabled:
+            return None
+        claims = self._claims.get(token)
+        self.stats["claims_hits" if claims is not None else "claims_misses"] += 1
+        return claims
+
+    def set_claims(self, token: str, claims: dict) -> None:
+        """Cache valid claims; only tokens that verified are ever stored"""
+        if not self.enabled:
+            return
+        ttl = self.ttl_seconds
+        if "exp" in claims:
+            ttl = min(ttl, float(claims["exp"]) - time.time())
+        if ttl > 0:
+            self.stats["evictions"] += self._claims.set(token, claims, ttl)
+
+    def get_principal(self, user_id: UUID) -> Optional[Principal]:
+        if not self.enabled:
+            return None
+        principal = self._principals.get(user_id)
+        self.stats["principal_hits" if principal is not None else "principal_misses"] += 1
+        return principal
+
+    def set_principal(self, principal: Principal, generation: int) -> None:
+        """Store a principal read from the database, unless a user changed meanwhile"""
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            self.stats["evictions"] += self._principals.set(principal.id, principal, self.ttl_seconds)
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        with self._lock:
+            self.generation += 1
+            self.stats["invalidations"] += 1
+            self._principals.pop(user_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._claims.clear()
+            self._principals.clear()
+
+    def get_stats(self) -> dict:
+        stats = dict(self.stats)
+        stats["enabled"] = self.enabled
+        stats["claims_size"] = len(self._claims)
+        stats["principals_size"] = len(self._principals)
+        return stats
+
+
+auth_cache = AuthCache(
+    max_entries=settings.AUTH_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_CACHE_TTL_SECONDS,
+    enabled=settings.AUTH_CACHE_ENABLED,
+)
+
+_PENDING_KEY = "auth_cache_invalidate"
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _user_changed(mapper, connection, target):
+    # Drop now so this node stops trusting the old row, and again after
+    # commit in case a concurrent request re-read it before the commit
+    auth_cache.invalidate_user(target.id)
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session):
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        auth_cache.invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session):
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,126 @@
+import logging
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one upstream.
+
+    Failed calls and calls slower than `slow_call_ms` count against the
+    upstream; `failure_threshold` in a row trip it open, and calls are then
+    refused without touching the network. After `open_seconds` it half-opens
+    and lets `half_open_probes` calls through: a healthy probe closes it, a
+    failed or slow one opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        slow_call_ms: float = 1000.0,
+        open_seconds: float = 15.0,
+        half_open_probes: int = 1,
+    ):
+        self.name = name
+        self.failure_threshold = max(failure_threshold, 1)
+        self.slow_call_ms = slow_call_ms
+        self.open_seconds = open_seconds
+        self.half_open_probes = max(half_open_probes, 1)
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._probes_in_flight = 0
+        self.stats = {
+            "calls": 0,
+            "failures": 0,
+            "slow_calls": 0,
+            "rejected": 0,
+            "trips": 0,
+            "probes": 0,
+        }
+
+    @property
+    def is_open(self) -> bool:
+        """Open and not yet due for a probe (checking does not use up a probe)"""
+        return self.state == self.OPEN and time.monotonic() - self._opened_at < self.open_seconds
+
+    def allow(self) -> bool:
+        """
+        Whether a call may go upstream now. Every allowed call must be
+        followed by record_success(), record_failure() or release().
+        """
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.open_seconds:
+                self.stats["rejected"] += 1
+                return False
+            self.state = self.HALF_OPEN
+            self.consecutive_failures = 0
+            self._probes_in_flight = 0
+
+        if self.state == self.HALF_OPEN:
+            if self._probes_in_flight >= self.half_open_probes:
+                self.stats["rejected"] += 1
+                return False
+            self._probes_in_flight += 1
+            self.stats["probes"] += 1
+
+        self.stats["calls"] += 1
+        return True
+
+    def record_success(self, elapsed_ms: float) -> None:
+        if elapsed_ms > self.slow_call_ms:
+            # Answered, but too late to be useful: counts against the upstream
+            self.stats["slow_calls"] += 1
+            self._failed()
+            return
+        if self.state == self.OPEN:
+            # A call that started before the trip; only probes may close the circuit
+            return
+        if self.state == self.HALF_OPEN:
+            logger.info("Circuit %s closed after a healthy probe", self.name)
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._probes_in_flight = 0
+
+    def record_failure(self) -> None:
+        self.stats["failures"] += 1
+        self._failed()
+
+    def release(self) -> None:
+        """An allowed call was abandoned without an answer (e.g. cancelled): no verdict"""
+        if self.state == self.HALF_OPEN and self._probes_in_flight > 0:
+            self._probes_in_flight -= 1
+
+    def get_stats(self) -> dict:
+        stats = dict(self.stats)
+        stats["state"] = self.state
+        stats["consecutive_failures"] = self.consecutive_failures
+        stats["retry_in_seconds"] = (
+            round(max(self.open_seconds - (time.monotonic() - self._opened_at), 0.0), 3)
+            if self.state == self.OPEN else None
+        )
+        return stats
+
+    def _failed(self) -> None:
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or (
+            self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold
+        ):
+            self._trip()
+
+    def _trip(self) -> None:
+        logger.warning(
+            "Circuit %s open for %.1fs after %d failed or slow calls",
+            self.name, self.open_seconds, self.consecutive_failures,
+        )
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._probes_in_flight = 0
+        self.stats["trips"] += 1
@@ -0,0 +1,265 @@
+import asyncio
+import threading
+from typing import Awaitable, Callable, Dict, NamedTuple, Optional, Tuple
+
+import redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.services.ttl_cache import RedisTier, TTLCache
+
+
+class ConferenceSnapshot(NamedTuple):
+    """Serialized public view of a conference plus the status the join rules check"""
+    status: str
+    body: bytes
+
+
+class ConferenceSnapshotCache:
+    """
+    Read-through cache of join-by-code snapshots: a bounded in-process LRU
+    with a short TTL, optionally backed by the shared Redis instance.
+
+    Status transitions invalidate the local entry and the Redis key. Other
+    backend nodes only see the Redis delete, so the local TTL bounds how long
+    they can serve a stale status.
+
+    Each code also has a version counter in Redis, bumped by every
+    invalidation. A snapshot is written back only if the version is still
+    the one seen before the database read, so a node whose load raced an
+    invalidation on another node cannot put the old status back.
+    """
+
+    REDIS_PREFIX = "conference-code:"
+    VERSION_PREFIX = "conference-code-version:"
+    # Outlives any load in flight; an expired counter reads as version 0 again
+    VERSION_TTL_SECONDS = 86400
+    # Compare-and-set: store the snapshot only if no invalidation bumped the version meanwhile
+    STORE_SCRIPT = """
+        if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+            return 0
+        end
+        redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+        return 1
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        redis_url: Optional[str] = None,
+        redis_ttl_seconds: int = 30,
+        redis_timeout: float = 0.1,
+        enabled: bool = True,
+    ):
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self._local = TTLCache(max_entries)
+        self._redis = RedisTier("Conference cache", redis_url, redis_timeout)
+        self._sync_redis: Optional[redis.Redis] = None
+        # code -> (generation, Redis version, load task) shared by concurrent misses
+        self._loading: Dict[str, Tuple[int, Optional[int], asyncio.Task]] = {}
+        # Bumped by every invalidation so a lookup that raced one does not store what it read.
+        # Invalidations also come from threadpool endpoints, hence the lock
+        self.generation = 0
+        self._lock = threading.Lock()
+        self.stats = {
+            "local_hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "loads": 0,
+            "coalesced": 0,
+            "invalidations": 0,
+            "stale_sets_skipped": 0,
+        }
+
+    async def get(self, code: str) -> Optional[ConferenceSnapshot]:
+        if not self.enabled:
+            return None
+        snapshot, _ = await self._lookup(code)
+        return snapshot
+
+    async def _lookup(self, code: str) -> Tuple[Optional[ConferenceSnapshot], Optional[int]]:
+        """Cached snapshot, and on a miss the Redis version (None without Redis)"""
+        snapshot = self._local.get(code)
+        if snapshot is not None:
+            self.stats["local_hits"] += 1
+            return snapshot, None
+
+        version = None
+        client = self._redis.client()
+        if client is not None:
+            try:
+                value, version = await client.mget(self.REDIS_PREFIX + code, self.VERSION_PREFIX + code)
+                version = int(version or 0)
+            except (RedisError, OSError) as exc:
+                self._redis.failed(exc)
+                value = version = None
+            if value is not None:
+                status, _, body = value.partition(b"\n")
+                snapshot = ConferenceSnapshot(status.decode(), body)
+                self.stats["redis_hits"] += 1
+                self._local.set(code, snapshot, self.ttl_seconds)
+                return snapshot, None
+
+        self.stats["misses"] += 1
+        return None, version
+
+    async def get_or_load(
+        self,
+        code: str,
+        load: Callable[[], Awaitable[Optional[ConferenceSnapshot]]],
+    ) -> Optional[ConferenceSnapshot]:
+        """Cached snapshot, else one shared load per code for a burst of concurrent misses"""
+        if not self.enabled:
+            return await load()
+        snapshot, version = await self._lookup(code)
+        if snapshot is not None:
+            return snapshot
+
+        loading = self._loading.get(code)
+        # A load started before an invalidation (here or on another node) may return the old status: do not join it
+        if loading is None or loading[:2] != (self.generation, version):
+            self.stats["loads"] += 1
+            task = asyncio.create_task(self._load(code, load, self.generation, version))
+            self._loading[code] = (self.generation, version, task)
+            task.add_done_callback(lambda done: self._forget_loading(code, done))
+        else:
+            self.stats["coalesced"] += 1
+            task = loading[2]
+
+        # Shielded: a cancelled waiter must not cancel the load the others share
+        return await asyncio.shield(task)
+
+    async def set(
+        self, code: str, snapshot: ConferenceSnapshot, generation: int, version: Optional[int] = None
+    ) -> None:
+        """
+        Store a snapshot read from the database, unless it was invalidated
+        meanwhile: locally since generation, or on any node since the Redis
+        version (None: the version is unknown and Redis is not written)
+        """
+        if not self.enabled:
+            return
+        if generation != self.generation:
+            self.stats["stale_sets_skipped"] += 1
+            return
+        client = self._redis.client() if version is not None else None
+        if client is not None:
+            try:
+                stored = await client.eval(
+                    self.STORE_SCRIPT,
+                    2,
+                    self.REDIS_PREFIX + code,
+                    self.VERSION_PREFIX + code,
+                    version,
+                    snapshot.status.encode() + b"\n" + snapshot.body,
+                    self.redis_ttl_seconds,
+                )
+            except (RedisError, OSError) as exc:
+                self._redis.failed(exc)
+                stored = True
+            if not stored:
+                self.stats["stale_sets_skipped"] += 1
+                return
+        with self._lock:
+            if generation != self.generation:
+                self.stats["stale_sets_skipped"] += 1
+                return
+            self._local.set(code, snapshot, self.ttl_seconds)
+
+    async def invalidate_async(self, code: str) -> None:
+        if not self._invalidate_local(code):
+            return
+        client = self._redis.client()
+        if client is None:
+            return
+        try:
+            async with client.pipeline(transaction=True) as pipe:
+                self._queue_invalidation(pipe, code)
+                await pipe.execute()
+        except (RedisError, OSError) as exc:
+            self._redis.failed(exc)
+
+    def invalidate(self, code: str) -> None:
+        """Invalidate from synchronous code (threadpool endpoints, scripts)"""
+        if not self._invalidate_local(code):
+            return
+        if self._redis.client() is None:
+            return
+        if self._sync_redis is None:
+            self._sync_redis = redis.Redis.from_url(
+                self._redis.url,
+                socket_timeout=self._redis.timeout,
+                socket_connect_timeout=self._redis.timeout,
+            )
+        try:
+            with self._sync_redis.pipeline(transaction=True) as pipe:
+                self._queue_invalidation(pipe, code)
+                pipe.execute()
+        except (RedisError, OSError) as exc:
+            self._redis.failed(exc)
+
+    def _queue_invalidation(self, pipe, code: str) -> None:
+        """Bump the code's version, then drop its snapshot (one MULTI/EXEC)"""
+        pipe.incr(self.VERSION_PREFIX + code)
+        pipe.expire(self.VERSION_PREFIX + code, self.VERSION_TTL_SECONDS)
+        pipe.delete(self.REDIS_PREFIX + code)
+
+    async def close(self) -> None:
+        await self._redis.close()
+        if self._sync_redis is not None:
+            self._sync_redis.close()
+            self._sync_redis = None
+
+    def get_stats(self) -> dict:
+        stats = dict(self.stats)
+        lookups = stats["local_hits"] + stats["redis_hits"] + stats["misses"]
+        stats["evictions"] = self._local.evictions
+        stats["expirations"] = self._local.expirations
+        stats["redis_errors"] = self._redis.errors
+        stats["enabled"] = self.enabled
+        stats["size"] = len(self._local)
+        stats["loading"] = len(self._loading)
+        stats["max_entries"] = self.max_entries
+        stats["hit_ratio"] = (
+            round((stats["local_hits"] + stats["redis_hits"]) / lookups, 4) if lookups else 0.0
+        )
+        return stats
+
+    async def _load(
+        self,
+        code: str,
+        load: Callable[[], Awaitable[Optional[ConferenceSnapshot]]],
+        generation: int,
+        version: Optional[int],
+    ) -> Optional[ConferenceSnapshot]:
+        snapshot = await load()
+        if snapshot is not None:
+            await self.set(code, snapshot, generation, version)
+        return snapshot
+
+    def _forget_loading(self, code: str, task: asyncio.Task) -> None:
+        loading = self._loading.get(code)
+        if loading is not None and loading[2] is task:
+            del self._loading[code]
+
+    def _invalidate_local(self, code: str) -> bool:
+        if not self.enabled:
+            return False
+        with self._lock:
+            self.generation += 1
+            self.stats["invalidations"] += 1
+            self._local.pop(code)
+        return True
+
+
+conference_cache = ConferenceSnapshotCache(
+    max_entries=settings.CONFERENCE_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.CONFERENCE_CACHE_TTL_SECONDS,
+    redis_url=settings.REDIS_URL if settings.CONFERENCE_CACHE_REDIS_ENABLED else None,
+    redis_ttl_seconds=settings.CONFERENCE_CACHE_REDIS_TTL_SECONDS,
+    enabled=settings.CONFERENCE_CACHE_ENABLED,
+)
@@ -1,29 +1,59 @@
+import base64
 import random
 import string
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from app.core.database import AsyncSessionLocal
 from app.models.conference import Conference, ConferenceStatus, ConferenceType
 from app.models.conference_participant import ConferenceParticipant
 from app.models.conference_settings import ConferenceSettings
-from app.schemas.conference import ConferenceCreate, ConferenceUpdate
-from typing import List, Optional
+from app.models.translation import Translation
+from app.schemas.conference import Conference as ConferenceSchema, ConferenceCreate, ConferenceUpdate, ConferenceWithParticipants
+from app.services.conference_cache import ConferenceSnapshot, conference_cache
+from app.services.translation_partitions import conference_window
+from typing import List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime, timezone
 
+# Partial unique index: at most one STARTED/PAUSED conference per host
+LIVE_CONFERENCE_INDEX = "uq_conferences_host_live"
+
+# Fresh codes tried before giving up (26^10 codes: a collision is already rare)
+CODE_ALLOCATION_ATTEMPTS = 8
+
 class ConferenceService:
     
     @staticmethod
     def generate_conference_code() -> str:
-        """Generate unique conference code in format: xxx-xxxx-xxx"""
-        while True:
-            # Generate 3-4-3 format: cqx-jhyz-ive
-            part1 = ''.join(random.choices(string.ascii_lowercase, k=3))
-            part2 = ''.join(random.choices(string.ascii_lowercase, k=4))
-            part3 = ''.join(random.choices(string.ascii_lowercase, k=3))
-            code = f"{part1}-{part2}-{part3}"
-            
-            # Check if code already exists
-            return code
+        """Generate a random conference code in format: xxx-xxxx-xxx (uniqueness is enforced on insert)"""
+        # Generate 3-4-3 format: cqx-jhyz-ive
+        part1 = ''.join(random.choices(string.ascii_lowercase, k=3))
+        part2 = ''.join(random.choices(string.ascii_lowercase, k=4))
+        part3 = ''.join(random.choices(string.ascii_lowercase, k=3))
+        return f"{part1}-{part2}-{part3}"
+    
+    @staticmethod
+    def _insert_with_unique_code(db: Session, **values) -> Conference:
+        """
+        Insert a conference under a fresh random code. A taken code makes the
+        INSERT a no-op (ON CONFLICT on conference_code only, so the transaction
+        stays usable and other constraints still raise) and another code is tried.
+        """
+        for _ in range(CODE_ALLOCATION_ATTEMPTS):
+            stmt = insert(Conference).values(
+                conference_code=ConferenceService.generate_conference_code(),
+                **values
+            ).on_conflict_do_nothing(
+                index_elements=[Conference.conference_code]
+            ).returning(Conference)
+            conference = db.execute(stmt).scalars().first()
+            if conference is not None:
+                return conference
+        
+        raise RuntimeError("Could not allocate a unique conference code")
     
     @staticmethod
     def check_host_has_live_conference(db: Session, host_id: UUID) -> Optional[Conference]:
@@ -40,42 +70,37 @@ class ConferenceService:
         """Create a new conference. If type is INSTANT, start immediately."""
         # Determine intent
         is_instant = conference_data.type == ConferenceType.INSTANT
-
-        # Check if host already has a live conference
-        live_conference = ConferenceService.check_host_has_live_conference(db, host_id)
-        # Only block if creating INSTANT while already having a live one
-        if is_instant and live_conference:
-            # Include some human-friendly info for frontend
-            raise ValueError(
-                f"Host already has a live conference: {getattr(live_conference, 'title', 'Untitled')} ({live_conference.conference_code})"
-            )
-        
-        # Generate unique conference code
-        conference_code = ConferenceService.generate_conference_code()
         
         # Determine initial status based on type
         # If scheduled, create as PENDING and do not start
         initial_status = ConferenceStatus.STARTED if is_instant else ConferenceStatus.PENDING
         started_at = datetime.now(timezone.utc) if is_instant else None
 
-        # Create conference
-        db_conference = Conference(
-            conference_code=conference_code,
-            title=conference_data.title,
-            description=conference_data.description,
-            host_id=host_id,
-            status=initial_status,
-            type=conference_data.type,
-            scheduled_at=conference_data.scheduled_at,
-            started_at=started_at,
-            max_participants=conference_data.max_participants,
-            language_from=conference_data.language_from,
-            language_to=conference_data.language_to
-        )
-        
-        db.add(db_conference)
-        db.commit()
-        db.refresh(db_conference)
+        # Create conference under a unique code
+        try:
+            db_conference = ConferenceService._insert_with_unique_code(
+                db,
+                title=conference_data.title,
+                description=conference_data.description,
+                host_id=host_id,
+                status=initial_status,
+                type=conference_data.type,
+                scheduled_at=conference_data.scheduled_at,
+                started_at=started_at,
+                max_participants=conference_data.max_participants,
+                language_from=conference_data.language_from,
+                language_to=conference_data.language_to
+            )
+        except IntegrityError as e:
+            # Only INSTANT conferences are created live; the index rejects a second one
+            db.rollback()
+            if not ConferenceService._is_live_conflict(e):
+                raise
+            live_conference = ConferenceService.check_host_has_live_conference(db, host_id)
+            # Include some human-friendly info for frontend
+            raise ValueError(
+                f"Host already has a live conference: {getattr(live_conference, 'title', 'Untitled')} ({getattr(live_conference, 'conference_code', '')})"
+            )
         
         # Create default conference settings
         default_settings = ConferenceSettings(
@@ -115,9 +140,6 @@ class ConferenceService:
     @staticmethod
     def create_guest_conference(db: Session, conference_data: ConferenceCreate, is_instant: bool = False) -> Conference:
         """Create a new conference for guest users (no authentication required)"""
-        # Generate unique conference code
-        conference_code = ConferenceService.generate_conference_code()
-        
         # Create a temporary guest user for the conference
         from app.models.user import User
         import uuid
@@ -139,9 +161,9 @@ class ConferenceService:
         conference_type = ConferenceType.INSTANT if is_instant else ConferenceType.SCHEDULED
         started_at = datetime.now(timezone.utc) if is_instant else None
         
-        # Create conference
-        db_conference = Conference(
-            conference_code=conference_code,
+        # Create conference under a unique code
+        db_conference = ConferenceService._insert_with_unique_code(
+            db,
             title=conference_data.title,
             description=conference_data.description,
             host_id=guest_user.id,
@@ -154,10 +176,6 @@ class ConferenceService:
             language_to=conference_data.language_to
         )
         
-        db.add(db_conference)
-        db.commit()
-        db.refresh(db_conference)
-        
         # Create default conference settings
         default_settings = ConferenceSettings(
             conference_id=db_conference.id,
@@ -183,86 +201,130 @@ class ConferenceService:
         return db_conference
     
     @staticmethod
-    def start_conference(db: Session, conference_id: UUID, host_id: UUID) -> Conference:
-        """Start a pending conference"""
-        conference = db.query(Conference).filter(
+    def _owned_conference_stmt(conference_id: UUID, host_id: UUID):
+        return select(Conference).where(
             and_(Conference.id == conference_id, Conference.host_id == host_id)
-        ).first()
-        
+        )
+    
+    @staticmethod
+    def _live_conference_stmt(host_id: UUID):
+        return select(Conference).where(
+            and_(
+                Conference.host_id == host_id,
+                Conference.status.in_([ConferenceStatus.STARTED, ConferenceStatus.PAUSED])
+            )
+        ).limit(1)
+    
+    @staticmethod
+    def _ensure_transition(conference: Optional[Conference], allowed: List[ConferenceStatus], action: str) -> Conference:
+        """Validate a status transition (shared by the sync and async paths)"""
         if not conference:
             raise ValueError("Conference not found or not authorized")
         
-        if conference.status != ConferenceStatus.PENDING:
-            raise ValueError(f"Cannot start conference with status: {conference.status}")
-        
-        # Check if host already has a live conference
-        live_conference = ConferenceService.check_host_has_live_conference(db, host_id)
-        if live_conference and live_conference.id != conference_id:
-            raise ValueError(f"Host already has a live conference: {live_conference.conference_code}")
+        if conference.status not in allowed:
+            raise ValueError(f"Cannot {action} conference with status: {conference.status}")
         
-        # Start the conference
-        conference.status = ConferenceStatus.STARTED
-        conference.started_at = datetime.now(timezone.utc)
+        return conference
+    
+    @staticmethod
+    def _start_not_applied(conference: Optional[Conference]) -> ValueError:
+        """The error for a start that matched no row, worded from a re-read of the conference"""
+        try:
+            ConferenceService._ensure_transition(conference, [ConferenceStatus.PENDING], "start")
+        except ValueError as e:
+            return e
+        # Pending again by the time of the re-read; still, nothing was started
+        return ValueError("Conference status changed while starting, try again")
+    
+    @staticmethod
+    def _is_live_conflict(exc: IntegrityError) -> bool:
+        """True if the one-live-conference-per-host index rejected the write"""
+        return LIVE_CONFERENCE_INDEX in str(exc.orig)
+    
+    @staticmethod
+    def _live_conflict_error(live_conference: Optional[Conference]) -> ValueError:
+        return ValueError(f"Host already has a live conference: {getattr(live_conference, 'conference_code', '')}")
+    
+    @staticmethod
+    def _start_stmt(conference_id: UUID, host_id: UUID):
+        """PENDING -> STARTED in one statement; the unique index guards concurrent starts"""
+        return update(Conference).where(
+            Conference.id == conference_id,
+            Conference.host_id == host_id,
+            Conference.status == ConferenceStatus.PENDING
+        ).values(
+            status=ConferenceStatus.STARTED,
+            started_at=datetime.now(timezone.utc)
+        ).returning(Conference)
+    
+    @staticmethod
+    def _apply_end(conference: Conference) -> None:
+        conference.status = ConferenceStatus.ENDED
+        conference.ended_at = datetime.now(timezone.utc)
+    
+    @staticmethod
+    def start_conference(db: Session, conference_id: UUID, host_id: UUID) -> Conference:
+        """Start a pending conference"""
+        try:
+            conference = db.execute(ConferenceService._start_stmt(conference_id, host_id)).scalars().first()
+        except IntegrityError as e:
+            db.rollback()
+            if not ConferenceService._is_live_conflict(e):
+                raise
+            live_conference = db.execute(ConferenceService._live_conference_stmt(host_id)).scalars().first()
+            raise ConferenceService._live_conflict_error(live_conference)
+        
+        if conference is None:
+            raise ConferenceService._start_not_applied(
+                db.execute(ConferenceService._owned_conference_stmt(conference_id, host_id)).scalars().first()
+            )
         db.commit()
-        db.refresh(conference)
+        conference_cache.invalidate(conference.conference_code)
         
         return conference
     
     @staticmethod
     def pause_conference(db: Session, conference_id: UUID, host_id: UUID) -> Conference:
         """Pause a started conference"""
-        conference = db.query(Conference).filter(
-            and_(Conference.id == conference_id, Conference.host_id == host_id)
-        ).first()
-        
-        if not conference:
-            raise ValueError("Conference not found or not authorized")
-        
-        if conference.status != ConferenceStatus.STARTED:
-            raise ValueError(f"Cannot pause conference with status: {conference.status}")
+        conference = ConferenceService._ensure_transition(
+            db.execute(ConferenceService._owned_conference_stmt(conference_id, host_id)).scalars().first(),
+            [ConferenceStatus.STARTED], "pause"
+        )
         
         conference.status = ConferenceStatus.PAUSED
         db.commit()
         db.refresh(conference)
+        conference_cache.invalidate(conference.conference_code)
         
         return conference
     
     @staticmethod
     def resume_conference(db: Session, conference_id: UUID, host_id: UUID) -> Conference:
         """Resume a paused conference"""
-        conference = db.query(Conference).filter(
-            and_(Conference.id == conference_id, Conference.host_id == host_id)
-        ).first()
-        
-        if not conference:
-            raise ValueError("Conference not found or not authorized")
-        
-        if conference.status != ConferenceStatus.PAUSED:
-            raise ValueError(f"Cannot resume conference with status: {conference.status}")
+        conference = ConferenceService._ensure_transition(
+            db.execute(ConferenceService._owned_conference_stmt(conference_id, host_id)).scalars().first(),
+            [ConferenceStatus.PAUSED], "resume"
+        )
         
         conference.status = ConferenceStatus.STARTED
         db.commit()
         db.refresh(conference)
+        conference_cache.invalidate(conference.conference_code)
         
         return conference
     
     @staticmethod
     def end_conference(db: Session, conference_id: UUID, host_id: UUID) -> Conference:
         """End a conference (STARTED or PAUSED)"""
-        conference = db.query(Conference).filter(
-            and_(Conference.id == conference_id, Conference.host_id == host_id)
-        ).first()
-        
-        if not conference:
-            raise ValueError("Conference not found or not authorized")
-        
-        if conference.status not in [ConferenceStatus.STARTED, ConferenceStatus.PAUSED]:
-            raise ValueError(f"Cannot end conference with status: {conference.status}")
+        conference = ConferenceService._ensure_transition(
+            db.execute(ConferenceService._owned_conference_stmt(conference_id, host_id)).scalars().first(),
+            [ConferenceStatus.STARTED, ConferenceStatus.PAUSED], "end"
+        )
         
-        conference.status = ConferenceStatus.ENDED
-        conference.ended_at = datetime.now(timezone.utc)
+        ConferenceService._apply_end(conference)
         db.commit()
         db.refresh(conference)
+        conference_cache.invalidate(conference.conference_code)
         
         return conference
     
@@ -277,32 +339,120 @@ class ConferenceService:
         return db.query(Conference).filter(Conference.id == conference_id).first()
     
     @staticmethod
-    def get_user_conferences(db: Session, user_id: UUID, skip: int = 0, limit: int = 100) -> List[Conference]:
+    def encode_cursor(conference: Conference) -> str:
+        """Opaque keyset cursor pointing just after the given conference"""
+        raw = f"{conference.created_at.isoformat()}|{conference.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+    
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+        """Decode a cursor from encode_cursor into (created_at, id)"""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+            created_at, conference_id = raw.split("|")
+            return datetime.fromisoformat(created_at), UUID(conference_id)
+        except ValueError:
+            raise ValueError("Invalid cursor")
+    
+    @staticmethod
+    def _host_conferences_stmt(user_id: UUID, after: Optional[Tuple[datetime, UUID]] = None):
+        """Host's conferences newest first; `after` continues from a cursor"""
+        stmt = select(Conference).where(Conference.host_id == user_id)
+        if after is not None:
+            # Row comparison walks ix_conferences_host_created_id backwards from the cursor
+            stmt = stmt.where(tuple_(Conference.created_at, Conference.id) < after)
+        return stmt.order_by(Conference.created_at.desc(), Conference.id.desc())
+    
+    @staticmethod
+    def get_user_conferences(
+        db: Session, user_id: UUID, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> List[Conference]:
         """Get conferences where user is host"""
-        return db.query(Conference).filter(
-            Conference.host_id == user_id
-        ).offset(skip).limit(limit).all()
+        if cursor:
+            stmt = ConferenceService._host_conferences_stmt(user_id, ConferenceService.decode_cursor(cursor))
+        else:
+            stmt = ConferenceService._host_conferences_stmt(user_id).offset(skip)
+        return db.execute(stmt.limit(limit)).scalars().all()
     
     @staticmethod
-    def get_conferences_with_participant_count(db: Session, user_id: UUID, skip: int = 0, limit: int = 100):
-        """Get conferences with participant count"""
-        conferences = db.query(Conference).filter(
-            Conference.host_id == user_id
-        ).offset(skip).limit(limit).all()
-        
-        result = []
-        for conference in conferences:
-            participant_count = db.query(ConferenceParticipant).filter(
-                ConferenceParticipant.conference_id == conference.id,
-                ConferenceParticipant.left_at.is_(None)
-            ).count()
-            
-            result.append({
-                **conference.__dict__,
-                'participant_count': participant_count
-            })
-        
-        return result
+    def _participant_page_stmt(user_id: UUID, skip: int, limit: int, after: Optional[Tuple[datetime, UUID]] = None):
+        """Host's conferences with active participant counts and the total in one query"""
+        # Pick the page first so participants are only counted for its rows
+        page = ConferenceService._host_conferences_stmt(user_id, after).with_only_columns(
+            Conference.id,
+            func.count().over().label('matched')
+        )
+        if after is None:
+            # Window runs before OFFSET, so it counts all of the host's conferences
+            page = page.offset(skip).limit(limit).subquery()
+            total = page.c.matched
+        else:
+            # Window only sees rows past the cursor; the total is counted separately
+            page = page.limit(limit).subquery()
+            total = ConferenceService._host_conference_count_stmt(user_id).scalar_subquery()
+        
+        active_participants = select(
+            ConferenceParticipant.conference_id,
+            func.count(ConferenceParticipant.id).label('participant_count')
+        ).where(
+            ConferenceParticipant.conference_id.in_(select(page.c.id)),
+            ConferenceParticipant.left_at.is_(None)
+        ).group_by(ConferenceParticipant.conference_id).subquery()
+        
+        return select(
+            Conference,
+            func.coalesce(active_participants.c.participant_count, 0).label('participant_count'),
+            page.c.matched,
+            total.label('total')
+        ).join(
+            page, page.c.id == Conference.id
+        ).outerjoin(
+            active_participants, active_participants.c.conference_id == Conference.id
+        ).order_by(Conference.created_at.desc(), Conference.id.desc())
+    
+    @staticmethod
+    def _host_conference_count_stmt(user_id: UUID):
+        return select(func.count(Conference.id)).where(Conference.host_id == user_id)
+    
+    @staticmethod
+    def _participant_page(rows, total: int, position: int, limit: int) -> dict:
+        """ConferenceList payload; position is the number of conferences before this page"""
+        conferences = []
+        for conference, participant_count, _, _ in rows:
+            item = ConferenceWithParticipants.model_validate(conference)
+            item.participant_count = participant_count
+            conferences.append(item)
+        
+        has_more = position + len(rows) < total
+        return {
+            'conferences': conferences,
+            'total': total,
+            'page': position // limit + 1,
+            'size': limit,
+            'next_cursor': ConferenceService.encode_cursor(rows[-1][0]) if rows and has_more else None
+        }
+    
+    @staticmethod
+    def _page_position(rows, skip: int, after) -> Tuple[int, int]:
+        """(total, position) from the window columns of a non-empty page"""
+        total = rows[0].total
+        return total, (skip if after is None else total - rows[0].matched)
+    
+    @staticmethod
+    def get_conferences_with_participant_count(
+        db: Session, user_id: UUID, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> dict:
+        """Get a page of the host's conferences with participant count (offset or cursor)"""
+        after = ConferenceService.decode_cursor(cursor) if cursor else None
+        rows = db.execute(ConferenceService._participant_page_stmt(user_id, skip, limit, after)).all()
+        if rows:
+            total, position = ConferenceService._page_position(rows, skip, after)
+        else:
+            # Past the last page: no row carries the window total
+            total = db.scalar(ConferenceService._host_conference_count_stmt(user_id)) if skip or after else 0
+            position = total if after else skip
+        
+        return ConferenceService._participant_page(rows, total, position, limit)
     
     @staticmethod
     def update_conference(db: Session, conference_id: UUID, conference_data: ConferenceUpdate, user_id: UUID) -> Optional[Conference]:
@@ -318,8 +468,17 @@ class ConferenceService:
         for field, value in update_data.items():
             setattr(conference, field, value)
         
-        db.commit()
+        try:
+            db.commit()
+        except IntegrityError as e:
+            # A status update to STARTED/PAUSED while another conference is live
+            db.rollback()
+            if not ConferenceService._is_live_conflict(e):
+                raise
+            live_conference = db.execute(ConferenceService._live_conference_stmt(user_id)).scalars().first()
+            raise ConferenceService._live_conflict_error(live_conference)
         db.refresh(conference)
+        conference_cache.invalidate(conference.conference_code)
         return conference
     
     @staticmethod
@@ -332,8 +491,14 @@ class ConferenceService:
         if not conference:
             return False
         
+        conference_code = conference.conference_code
+        # One DELETE pruned to the months the conference spans; the ORM cascade would load every row
+        db.execute(delete(Translation).where(
+            Translation.conference_id == conference.id, *conference_window(conference, until_end=False)
+        ))
         db.delete(conference)
         db.commit()
+        conference_cache.invalidate(conference_code)
         return True
     
     @staticmethod
@@ -355,3 +520,142 @@ class ConferenceService:
             "active_conferences": active_conferences,
             "total_participants": total_participants
         }
+    
+    # Async variants for the hot endpoints (AsyncSession on the asyncpg engine)
+    
+    @staticmethod
+    async def start_conference_async(db: AsyncSession, conference_id: UUID, host_id: UUID) -> Conference:
+        """Start a pending conference"""
+        try:
+            result = await db.execute(ConferenceService._start_stmt(conference_id, host_id))
+            conference = result.scalars().first()
+        except IntegrityError as e:
+            await db.rollback()
+            if not ConferenceService._is_live_conflict(e):
+                raise
+            live_result = await db.execute(ConferenceService._live_conference_stmt(host_id))
+            raise ConferenceService._live_conflict_error(live_result.scalars().first())
+        
+        if conference is None:
+            result = await db.execute(ConferenceService._owned_conference_stmt(conference_id, host_id))
+            raise ConferenceService._start_not_applied(result.scalars().first())
+        await db.commit()
+        await conference_cache.invalidate_async(conference.conference_code)
+        
+        return conference
+    
+    @staticmethod
+    async def pause_conference_async(db: AsyncSession, conference_id: UUID, host_id: UUID) -> Conference:
+        """Pause a started conference"""
+        result = await db.execute(ConferenceService._owned_conference_stmt(conference_id, host_id))
+        conference = ConferenceService._ensure_transition(
+            result.scalars().first(), [ConferenceStatus.STARTED], "pause"
+        )
+        
+        conference.status = ConferenceStatus.PAUSED
+        await db.commit()
+        await db.refresh(conference)
+        await conference_cache.invalidate_async(conference.conference_code)
+        
+        return conference
+    
+    @staticmethod
+    async def resume_conference_async(db: AsyncSession, conference_id: UUID, host_id: UUID) -> Conference:
+        """Resume a paused conference"""
+        result = await db.execute(ConferenceService._owned_conference_stmt(conference_id, host_id))
+        conference = ConferenceService._ensure_transition(
+            result.scalars().first(), [ConferenceStatus.PAUSED], "resume"
+        )
+        
+        conference.status = ConferenceStatus.STARTED
+        await db.commit()
+        await db.refresh(conference)
+        await conference_cache.invalidate_async(conference.conference_code)
+        
+        return conference
+    
+    @staticmethod
+    async def end_conference_async(db: AsyncSession, conference_id: UUID, host_id: UUID) -> Conference:
+        """End a conference (STARTED or PAUSED)"""
+        result = await db.execute(ConferenceService._owned_conference_stmt(conference_id, host_id))
+        conference = ConferenceService._ensure_transition(
+            result.scalars().first(), [ConferenceStatus.STARTED, ConferenceStatus.PAUSED], "end"
+        )
+        
+        ConferenceService._apply_end(conference)
+        await db.commit()
+        await db.refresh(conference)
+        await conference_cache.invalidate_async(conference.conference_code)
+        
+        return conference
+    
+    @staticmethod
+    async def get_conference_by_id_async(db: AsyncSession, conference_id: UUID) -> Optional[Conference]:
+        """Get conference by ID"""
+        return await db.get(Conference, conference_id)
+    
+    @staticmethod
+    async def get_conference_by_code_async(db: AsyncSession, conference_code: str) -> Optional[Conference]:
+        """Get conference by conference code"""
+        result = await db.execute(
+            select(Conference).where(Conference.conference_code == conference_code)
+        )
+        return result.scalars().first()
+
+    @staticmethod
+    async def get_active_participant_async(
+        db: AsyncSession,
+        conference_id: UUID,
+        participant_id: Optional[UUID] = None,
+        user_id: Optional[UUID] = None
+    ) -> Optional[ConferenceParticipant]:
+        """A participant of this conference who has not left, by participant id or else by user"""
+        if participant_id is not None:
+            match = ConferenceParticipant.id == participant_id
+        elif user_id is not None:
+            match = ConferenceParticipant.user_id == user_id
+        else:
+            return None
+        result = await db.execute(
+            select(ConferenceParticipant).where(
+                match,
+                ConferenceParticipant.conference_id == conference_id,
+                ConferenceParticipant.left_at.is_(None)
+            ).limit(1)
+        )
+        return result.scalars().first()
+
+    @staticmethod
+    async def _load_join_snapshot(conference_code: str) -> Optional[ConferenceSnapshot]:
+        # Shared by every waiter on the code, so it reads on its own session
+        async with AsyncSessionLocal() as db:
+            conference = await ConferenceService.get_conference_by_code_async(db, conference_code)
+            if conference is None:
+                return None
+            return ConferenceSnapshot(
+                conference.status.name,
+                ConferenceSchema.model_validate(conference).model_dump_json().encode()
+            )
+
+    @staticmethod
+    async def get_join_snapshot_async(conference_code: str) -> Optional[ConferenceSnapshot]:
+        """Serialized public view of a conference by code, read through the join cache"""
+        return await conference_cache.get_or_load(
+            conference_code, lambda: ConferenceService._load_join_snapshot(conference_code)
+        )
+    
+    @staticmethod
+    async def get_conferences_with_participant_count_async(
+        db: AsyncSession, user_id: UUID, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> dict:
+        """Get a page of the host's conferences with participant count (offset or cursor)"""
+        after = ConferenceService.decode_cursor(cursor) if cursor else None
+        result = await db.execute(ConferenceService._participant_page_stmt(user_id, skip, limit, after))
+        rows = result.all()
+        if rows:
+            total, position = ConferenceService._page_position(rows, skip, after)
+        else:
+            total = await db.scalar(ConferenceService._host_conference_count_stmt(user_id)) if skip or after else 0
+            position = total if after else skip
+        
+        return ConferenceService._participant_page(rows, total, position, limit)
@@ -0,0 +1,151 @@
+import asyncio
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.translation_service import translation_service
+
+# A clause ends at latin punctuation followed by a space/end (so "3.5" stays whole)
+# or at any CJK clause punctuation
+_CLAUSE_END = re.compile(r".*?(?:[.!?;:,]+(?=\s|$)|[。！？；：、，]+)\s*", re.DOTALL)
+
+# A period after a title, "e.g."/"i.e." or an initial ("J. Smith") does not end the clause;
+# "I" is left out as it usually ends a sentence ("so did I.")
+_ABBREVIATION = re.compile(r"(?:^|[\s(\"'])(?:Mr|Mrs|Ms|Dr|Prof|St|Jr|Sr|vs|e\.g|i\.e|[A-HJ-Z])\.$")
+
+# Target languages written without spaces between clauses
+_UNSPACED_LANGUAGES = {"ja", "zh"}
+
+
+def split_clauses(text: str) -> Tuple[List[str], str]:
+    """Split a hypothesis into complete clauses and the unterminated tail"""
+    clauses = []
+    start = position = 0
+    for match in _CLAUSE_END.finditer(text):
+        if match.start() != position:
+            break
+        position = match.end()
+        if _ABBREVIATION.search(match.group().rstrip()):
+            continue
+        clause = text[start:position].strip()
+        if clause:
+            clauses.append(clause)
+        start = position
+    return clauses, text[start:].strip()
+
+
+class IncrementalTranslator:
+    """
+    Stateful translator for one speaker stream and target language.
+
+    Interim STT hypotheses grow by appending words, and earlier clauses rarely
+    change once punctuated. Complete clauses are translated once and reused
+    while they stay identical in later hypotheses; only the unterminated tail
+    is sent to the provider on every update.
+    """
+
+    def __init__(self, source_language: str, target_language: str, retranslate_final: bool = True):
+        self.source_language = source_language
+        self.target_language = target_language
+        self.retranslate_final = retranslate_final
+        self.committed: List[Tuple[str, str]] = []
+        self.last_used = time.monotonic()
+        self.stats = {"updates": 0, "full_chars": 0, "requested_chars": 0}
+
+    async def translate(self, text: str, is_final: bool) -> str:
+        self.last_used = time.monotonic()
+        self.stats["updates"] += 1
+        self.stats["full_chars"] += len(text)
+
+        if is_final and self.retranslate_final:
+            # Finals are kept, so they get a whole-utterance translation for context
+            self.committed = []
+            return await self._request(text)
+
+        clauses, tail = split_clauses(text)
+        reused = 0
+        while (
+            reused < len(clauses)
+            and reused < len(self.committed)
+            and self.committed[reused][0] == clauses[reused]
+        ):
+            reused += 1
+
+        fresh = clauses[reused:]
+        results = await asyncio.gather(*(self._request(piece) for piece in fresh + ([tail] if tail else [])))
+        self.committed = self.committed[:reused] + list(zip(fresh, results[:len(fresh)]))
+
+        pieces = [translated for _, translated in self.committed]
+        if tail:
+            pieces.append(results[-1])
+        if is_final:
+            self.committed = []
+        separator = "" if self.target_language in _UNSPACED_LANGUAGES else " "
+        return separator.join(pieces)
+
+    async def _request(self, text: str) -> str:
+        self.stats["requested_chars"] += len(text)
+        translated = await translation_service.translate_text(text, self.source_language, self.target_language)
+        return translated if translated is not None else text
+
+
+class IncrementalTranslationPool:
+    """Incremental translators keyed by conference, speaker stream and target language"""
+
+    def __init__(self, idle_seconds: float = 60.0, retranslate_final: Optional[bool] = None):
+        self.idle_seconds = idle_seconds
+        self.retranslate_final = (
+            settings.REALTIME_INCREMENTAL_RETRANSLATE_FINAL if retranslate_final is None else retranslate_final
+        )
+        self._translators: Dict[Tuple[str, str, str, str], IncrementalTranslator] = {}
+        self._totals = {"updates": 0, "full_chars": 0, "requested_chars": 0}
+        self._last_prune = time.monotonic()
+
+    async def translate(
+        self,
+        conference_code: str,
+        stream_key: str,
+        text: str,
+        source_language: str,
+        target_language: str,
+        is_final: bool,
+    ) -> str:
+        self._prune()
+        key = (conference_code, stream_key, source_language, target_language)
+        translator = self._translators.get(key)
+        if translator is None:
+            translator = IncrementalTranslator(source_language, target_language, self.retranslate_final)
+            self._translators[key] = translator
+
+        before = dict(translator.stats)
+        try:
+            return await translator.translate(text, is_final)
+        finally:
+            for name in self._totals:
+                self._totals[name] += translator.stats[name] - before[name]
+            if is_final:
+                self._translators.pop(key, None)
+
+    def reset(self, conference_code: str, stream_key: str) -> None:
+        """Forget a stream's committed clauses (its final was translated elsewhere)"""
+        for key in [key for key in self._translators if key[:2] == (conference_code, stream_key)]:
+            del self._translators[key]
+
+    def get_stats(self) -> dict:
+        stats = dict(self._totals)
+        stats["saved_chars"] = stats["full_chars"] - stats["requested_chars"]
+        stats["saved_ratio"] = (
+            round(stats["saved_chars"] / stats["full_chars"], 4) if stats["full_chars"] else 0.0
+        )
+        stats["active_streams"] = len(self._translators)
+        return stats
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        if now - self._last_prune < self.idle_seconds:
+            return
+        self._last_prune = now
+        for key, translator in list(self._translators.items()):
+            if now - translator.last_used > self.idle_seconds:
+                del self._translators[key]
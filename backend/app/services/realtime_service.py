@@ -0,0 +1,520 @@
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from typing import Deque, Dict, List, Optional, Set
+from uuid import UUID
+
+from fastapi import WebSocket, status
+from redis.exceptions import RedisError
+
+from app.celery_app import idempotency_key
+from app.core.config import settings
+from app.core.database import async_engine
+from app.services.incremental_translator import IncrementalTranslationPool
+from app.services.room_backplane import RedisBackplane
+from app.services.translation_pipeline import TranslationPipeline
+from app.services.translation_service import translation_service
+from app.services.translation_writer import TranslationWriter
+from app.services.ttl_cache import RedisTier, TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Final chunk_ids remembered per node; Redis makes the claim hold across nodes
+CHUNK_CLAIMS_MAX_ENTRIES = 20000
+CHUNK_CLAIM_REDIS_TIMEOUT = 0.1
+
+
+class OutboundMessage:
+    __slots__ = ("payload", "is_final", "stream_key")
+
+    def __init__(self, payload: str, is_final: bool, stream_key: Optional[str]):
+        self.payload = payload
+        self.is_final = is_final
+        self.stream_key = stream_key
+
+
+class RoomConnection:
+    """
+    One WebSocket subscribed to a conference room in a target language.
+
+    Outbound messages go through a bounded queue drained by a per-connection
+    writer task, so a slow listener never stalls the room broadcast. On
+    overflow, a pending interim for the same stream is replaced by the newer
+    one (unless the stream's final is queued after it), older interims are
+    dropped next, finals are never dropped; a client whose queue is full of
+    finals is disconnected.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        conference_code: str,
+        language: str,
+        participant_id: Optional[UUID] = None,
+        display_name: Optional[str] = None,
+        max_queue: Optional[int] = None,
+    ):
+        self.websocket = websocket
+        self.conference_code = conference_code
+        self.language = language
+        self.participant_id = participant_id
+        self.display_name = display_name
+        self.connected_at = time.time()
+        self.max_queue = max_queue or settings.REALTIME_SEND_QUEUE_SIZE
+        self.closed = False
+        self._queue: Deque[OutboundMessage] = deque()
+        self._ready = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+        self._closer: Optional[asyncio.Task] = None
+        self.stats = {
+            "sent": 0,
+            "coalesced_interim": 0,
+            "dropped_interim": 0,
+            "max_depth": 0,
+        }
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    def start(self) -> None:
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._write_loop())
+
+    async def stop(self) -> None:
+        self.closed = True
+        if self._writer is not None:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+            self._writer = None
+
+    def enqueue(self, payload: str, is_final: bool = True, stream_key: Optional[str] = None) -> bool:
+        """Queue a payload without blocking; False if the connection is gone"""
+        if self.closed:
+            return False
+
+        if not is_final and stream_key is not None:
+            # The stream's latest queued message: a newer hypothesis supersedes a pending
+            # interim, but one queued before the stream's last final must stay in order
+            for index in range(len(self._queue) - 1, -1, -1):
+                pending = self._queue[index]
+                if pending.stream_key != stream_key:
+                    continue
+                if not pending.is_final:
+                    self._queue[index] = OutboundMessage(payload, is_final, stream_key)
+                    self.stats["coalesced_interim"] += 1
+                    return True
+                break
+
+        if len(self._queue) >= self.max_queue:
+            if not is_final:
+                self.stats["dropped_interim"] += 1
+                return True
+            if not self._drop_oldest_interim():
+                self._disconnect_lagging()
+                return False
+
+        self._queue.append(OutboundMessage(payload, is_final, stream_key))
+        self.stats["max_depth"] = max(self.stats["max_depth"], len(self._queue))
+        self._ready.set()
+        return True
+
+    def get_stats(self) -> dict:
+        return {
+            "participant_id": str(self.participant_id) if self.participant_id else None,
+            "language": self.language,
+            "queue_depth": len(self._queue),
+            "closed": self.closed,
+            **self.stats,
+        }
+
+    def _drop_oldest_interim(self) -> bool:
+        for index, pending in enumerate(self._queue):
+            if not pending.is_final:
+                del self._queue[index]
+                self.stats["dropped_interim"] += 1
+                return True
+        return False
+
+    def _disconnect_lagging(self) -> None:
+        logger.info(
+            "Disconnecting lagging realtime client in %s (%d queued finals)",
+            self.conference_code, len(self._queue),
+        )
+        self.closed = True
+        self._queue.clear()
+        if self._writer is not None:
+            self._writer.cancel()
+        self._closer = asyncio.create_task(self._close(status.WS_1013_TRY_AGAIN_LATER))
+
+    async def _close(self, code: int) -> None:
+        try:
+            await self.websocket.close(code=code)
+        except Exception:
+            pass
+
+    async def _write_loop(self) -> None:
+        try:
+            while True:
+                while not self._queue:
+                    self._ready.clear()
+                    await self._ready.wait()
+                message = self._queue.popleft()
+                await self.websocket.send_text(message.payload)
+                self.stats["sent"] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Socket is gone; the endpoint's receive loop leaves the room
+            self.closed = True
+            self._queue.clear()
+
+
+class ConferenceRoom:
+    def __init__(self, conference_code: str, conference_id: UUID):
+        self.conference_code = conference_code
+        self.conference_id = conference_id
+        self.connections: Set[RoomConnection] = set()
+        # Keeps messages relayed from other nodes in publish order
+        self.lock = asyncio.Lock()
+
+    def languages(self) -> Set[str]:
+        return {connection.language for connection in self.connections}
+
+
+class RoomManager:
+    """
+    In-memory conference rooms for the realtime gateway. Every message is
+    serialized once per target language and the same payload is written to
+    all subscribers of that language. With the Redis backplane enabled,
+    messages are relayed to the same room on every other backend node.
+    With the worker pipeline enabled, audio chunks and final transcripts
+    are processed by Celery workers whose results arrive over the backplane.
+    """
+
+    def __init__(self):
+        self.rooms: Dict[str, ConferenceRoom] = {}
+        self.backplane: Optional[RedisBackplane] = None
+        self.incremental: Optional[IncrementalTranslationPool] = None
+        if settings.REALTIME_INCREMENTAL_TRANSLATION:
+            self.incremental = IncrementalTranslationPool()
+        self.history: Optional[TranslationWriter] = None
+        if settings.TRANSCRIPT_HISTORY_ENABLED:
+            self.history = TranslationWriter(
+                async_engine,
+                flush_ms=settings.TRANSCRIPT_HISTORY_FLUSH_MS,
+                batch_size=settings.TRANSCRIPT_HISTORY_BATCH_SIZE,
+                max_pending=settings.TRANSCRIPT_HISTORY_MAX_PENDING,
+            )
+        self.pipeline: Optional[TranslationPipeline] = None
+        if settings.REALTIME_PIPELINE_ENABLED:
+            self.pipeline = TranslationPipeline()
+        self._chunk_claims = TTLCache(CHUNK_CLAIMS_MAX_ENTRIES)
+        self._chunk_redis = RedisTier("Chunk claims", settings.REDIS_URL, CHUNK_CLAIM_REDIS_TIMEOUT)
+        self.stats = {
+            "messages": 0,
+            "remote_messages": 0,
+            "payloads_encoded": 0,
+            "enqueued": 0,
+            "rejected": 0,
+            "lagging_disconnects": 0,
+            "duplicate_chunks": 0,
+        }
+
+    async def startup(self) -> None:
+        # Pipeline workers publish their results on the backplane channels
+        if (settings.REALTIME_BACKPLANE_ENABLED or self.pipeline is not None) and settings.REDIS_URL:
+            self.backplane = RedisBackplane(settings.REDIS_URL, self._on_remote_message)
+            await self.backplane.start()
+
+    async def shutdown(self) -> None:
+        if self.backplane is not None:
+            await self.backplane.stop()
+            self.backplane = None
+        if self.history is not None:
+            await self.history.drain()
+        await self._chunk_redis.close()
+
+    async def join(self, conference_id: UUID, connection: RoomConnection) -> ConferenceRoom:
+        room = self.rooms.get(connection.conference_code)
+        if room is None:
+            room = ConferenceRoom(connection.conference_code, conference_id)
+            self.rooms[connection.conference_code] = room
+            if self.backplane is not None:
+                await self.backplane.subscribe(connection.conference_code)
+        room.connections.add(connection)
+        connection.start()
+        return room
+
+    async def leave(self, connection: RoomConnection) -> None:
+        await connection.stop()
+        room = self.rooms.get(connection.conference_code)
+        if room is None:
+            return
+        room.connections.discard(connection)
+        if not room.connections:
+            del self.rooms[connection.conference_code]
+            if self.backplane is not None:
+                await self.backplane.unsubscribe(connection.conference_code)
+
+    async def publish_transcript(
+        self,
+        conference_code: str,
+        text: str,
+        source_language: str,
+        is_final: bool,
+        segment_id: Optional[str] = None,
+        speaker: Optional[dict] = None,
+        chunk_id: Optional[str] = None,
+    ) -> None:
+        """
+        Translate a transcript for the room, deliver locally and relay to
+        other nodes. A final whose chunk_id was already published is dropped.
+        """
+        room = self.rooms.get(conference_code)
+        if room is None or not text:
+            return
+        if is_final and chunk_id and not await self._claim_chunk(conference_code, chunk_id):
+            self.stats["duplicate_chunks"] += 1
+            return
+
+        message = {
+            "type": "transcript",
+            "conference_code": conference_code,
+            "segment_id": segment_id,
+            "is_final": is_final,
+            "speaker": speaker,
+            "source_language": source_language,
+            "text": text,
+            "timestamp": time.time(),
+        }
+        languages = room.languages()
+        pending = set()
+        if is_final and self.pipeline is not None and self.backplane is not None:
+            # Interims stay on the incremental path: a queue round trip per hypothesis costs
+            # more than it saves. Languages the workers took arrive later over the backplane.
+            message["chunk_id"] = chunk_id or uuid.uuid4().hex
+            pending = await self.pipeline.submit_text(
+                message, languages - {source_language}, self.backplane.node_id
+            )
+            if pending and self.incremental is not None:
+                self.incremental.reset(conference_code, self._stream_key(message))
+        translations = await self._translate_all(message, languages - pending)
+        self.deliver(conference_code, self._encode(message, translations), is_final, self._stream_key(message))
+        if is_final and self.history is not None:
+            # Recorded by the node the speaker is on only, so relays do not duplicate rows
+            self._record_history(room, message, translations)
+
+        if self.backplane is not None:
+            # Remote nodes reuse these translations and only translate languages they add
+            relay = {"message": message, "translations": translations}
+            if pending:
+                relay["pending"] = sorted(pending)
+            await self.backplane.publish(conference_code, relay)
+
+    async def publish_audio(
+        self,
+        conference_code: str,
+        audio: bytes,
+        source_language: str,
+        is_final: bool = True,
+        segment_id: Optional[str] = None,
+        speaker: Optional[dict] = None,
+        chunk_id: Optional[str] = None,
+    ) -> bool:
+        """Hand an audio chunk to the worker pipeline; False if this node has no pipeline"""
+        room = self.rooms.get(conference_code)
+        if room is None or self.pipeline is None or self.backplane is None or not audio:
+            return False
+
+        message = {
+            "type": "transcript",
+            "conference_code": conference_code,
+            "segment_id": segment_id,
+            "is_final": is_final,
+            "speaker": speaker,
+            "source_language": source_language,
+            "text": "",
+            "timestamp": time.time(),
+            "chunk_id": chunk_id or uuid.uuid4().hex,
+        }
+        return await self.pipeline.submit_audio(message, audio, room.languages(), self.backplane.node_id)
+
+    def deliver(
+        self,
+        conference_code: str,
+        payloads: Dict[str, str],
+        is_final: bool = True,
+        stream_key: Optional[str] = None,
+    ) -> None:
+        """Queue pre-encoded payloads (keyed by target language) on the local room's sockets"""
+        room = self.rooms.get(conference_code)
+        if room is None:
+            return
+        self.stats["messages"] += 1
+        self.stats["payloads_encoded"] += len(payloads)
+
+        for connection in list(room.connections):
+            payload = payloads.get(connection.language)
+            if payload is None:
+                continue
+            was_open = not connection.closed
+            if connection.enqueue(payload, is_final, stream_key):
+                self.stats["enqueued"] += 1
+            else:
+                self.stats["rejected"] += 1
+                if was_open and connection.closed:
+                    self.stats["lagging_disconnects"] += 1
+
+    def get_stats(self) -> dict:
+        stats = dict(self.stats)
+        connections = [c for room in self.rooms.values() for c in room.connections]
+        stats["rooms"] = len(self.rooms)
+        stats["connections"] = len(connections)
+        stats["queued"] = sum(c.queue_depth for c in connections)
+        stats["max_queue_depth"] = max((c.queue_depth for c in connections), default=0)
+        stats["dropped_interim"] = sum(c.stats["dropped_interim"] for c in connections)
+        stats["coalesced_interim"] = sum(c.stats["coalesced_interim"] for c in connections)
+        stats["backplane"] = self.backplane.get_stats() if self.backplane is not None else None
+        stats["incremental_translation"] = self.incremental.get_stats() if self.incremental is not None else None
+        stats["transcript_history"] = self.history.get_stats() if self.history is not None else None
+        stats["pipeline"] = self.pipeline.get_stats() if self.pipeline is not None else None
+        return stats
+
+    def get_connection_stats(self, conference_code: str) -> List[dict]:
+        """Per-connection queue depth and drop counters for one room"""
+        room = self.rooms.get(conference_code)
+        if room is None:
+            return []
+        return [connection.get_stats() for connection in room.connections]
+
+    async def _claim_chunk(self, conference_code: str, chunk_id: str) -> bool:
+        """
+        Claim a final chunk for publishing; False if it was already published
+        here or on another node. Without Redis the claim only holds on this node.
+        """
+        key = idempotency_key(conference_code, chunk_id, "final")
+        if self._chunk_claims.get(key) is not None:
+            return False
+        ttl = settings.PIPELINE_IDEMPOTENCY_TTL_SECONDS
+        self._chunk_claims.set(key, True, ttl)
+        client = self._chunk_redis.client()
+        if client is None:
+            return True
+        try:
+            return bool(await client.set(key, "done", nx=True, ex=ttl))
+        except (RedisError, OSError) as exc:
+            self._chunk_redis.failed(exc)
+            return True
+
+    def _record_history(self, room: ConferenceRoom, message: dict, translations: Dict[str, str]) -> None:
+        """
+        Queue one Translation row per target language of a final transcript.
+        The speaker's participant_id was verified against the conference when
+        their socket connected; without one nothing is recorded.
+        """
+        speaker = message.get("speaker") or {}
+        try:
+            speaker_id = UUID(str(speaker.get("participant_id")))
+        except ValueError:
+            # Rows need a participant; anonymous and unverified speakers are not recorded
+            return
+        created_at = datetime.fromtimestamp(message["timestamp"], timezone.utc)
+        for language, translated in translations.items():
+            self.history.submit({
+                "conference_id": room.conference_id,
+                "speaker_id": speaker_id,
+                "original_text": message["text"],
+                "translated_text": translated,
+                "language_from": message["source_language"],
+                "language_to": language,
+                "translation_status": "completed",
+                "created_at": created_at,
+            })
+
+    async def _on_remote_message(self, conference_code: str, data: dict) -> None:
+        room = self.rooms.get(conference_code)
+        message = data.get("message")
+        if room is None or not isinstance(message, dict):
+            return
+        self.stats["remote_messages"] += 1
+
+        async with room.lock:
+            languages = room.languages()
+            relayed = data.get("translations") or {}
+            translations = {language: relayed[language] for language in languages if language in relayed}
+            if not data.get("pipeline"):
+                # Pipeline results carry only their own language; pending ones arrive as such results
+                missing = languages - translations.keys() - set(data.get("pending") or ())
+                if missing:
+                    translations.update(await self._translate_all(message, missing))
+            is_final = bool(message.get("is_final", True))
+            self.deliver(
+                conference_code,
+                self._encode(message, translations),
+                is_final,
+                self._stream_key(message),
+            )
+            if (
+                is_final
+                and self.history is not None
+                and self.backplane is not None
+                and data.get("record_on") == self.backplane.node_id
+            ):
+                # Worker output is recorded by the node that submitted the chunk
+                self._record_history(room, message, relayed)
+
+    async def _translate_all(self, message: dict, languages) -> Dict[str, str]:
+        languages = sorted(languages)
+        translated = await asyncio.gather(*(
+            self._translate(message, language) for language in languages
+        ))
+        return dict(zip(languages, translated))
+
+    def _encode(self, message: dict, translations: Dict[str, str]) -> Dict[str, str]:
+        return {
+            language: json.dumps(
+                {**message, "target_language": language, "translation": translated},
+                ensure_ascii=False,
+            )
+            for language, translated in translations.items()
+        }
+
+    async def _translate(self, message: dict, target_language: str) -> str:
+        text = message.get("text") or ""
+        source_language = message.get("source_language") or "en"
+        if source_language == target_language:
+            return text
+
+        stream_key = self._stream_key(message)
+        if self.incremental is not None and stream_key is not None:
+            # Growing interim hypotheses only send their unstable tail to the provider
+            return await self.incremental.translate(
+                message.get("conference_code") or "",
+                stream_key,
+                text,
+                source_language,
+                target_language,
+                bool(message.get("is_final", True)),
+            )
+
+        translated = await translation_service.translate_text(text, source_language, target_language)
+        return translated if translated is not None else text
+
+    @staticmethod
+    def _stream_key(message: dict) -> Optional[str]:
+        # Interim hypotheses of one segment (or one speaker) supersede each other
+        if message.get("segment_id"):
+            return str(message["segment_id"])
+        speaker = message.get("speaker") or {}
+        return speaker.get("participant_id") or speaker.get("name")
+
+
+room_manager = RoomManager()
@@ -0,0 +1,155 @@
+import asyncio
+import json
+import logging
+import uuid
+from typing import Awaitable, Callable, Optional, Set
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+MessageHandler = Callable[[str, dict], Awaitable[None]]
+
+
+class RedisBackplane:
+    """
+    Cross-node fan-out for realtime rooms over Redis pub/sub. Each node
+    subscribes only to the channels of conferences it has local sockets
+    for; messages a node published itself are skipped on receipt because
+    they were already delivered locally.
+    """
+
+    CHANNEL_PREFIX = "conference-room:"
+    RECONNECT_DELAY = 1.0
+    MAX_RECONNECT_DELAY = 30.0
+
+    def __init__(self, redis_url: str, on_message: MessageHandler):
+        self.redis_url = redis_url
+        self.node_id = uuid.uuid4().hex
+        self._on_message = on_message
+        self._redis: Optional[aioredis.Redis] = None
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+        self._codes: Set[str] = set()
+        self._handlers: Set[asyncio.Task] = set()
+        self.stats = {
+            "published": 0,
+            "received": 0,
+            "publish_errors": 0,
+            "reconnects": 0,
+        }
+
+    @property
+    def _node_channel(self) -> str:
+        # Keeps the pub/sub connection subscribed even when the node has no rooms
+        return f"{self.CHANNEL_PREFIX}__node__:{self.node_id}"
+
+    def channel(self, conference_code: str) -> str:
+        return f"{self.CHANNEL_PREFIX}{conference_code}"
+
+    async def start(self) -> None:
+        self._redis = aioredis.from_url(self.redis_url, decode_responses=True)
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        await self._close_pubsub()
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def subscribe(self, conference_code: str) -> None:
+        self._codes.add(conference_code)
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.subscribe(self.channel(conference_code))
+            except (RedisError, OSError) as exc:
+                # The listener resubscribes every local room after reconnecting
+                logger.warning("Backplane subscribe failed for %s: %s", conference_code, exc)
+
+    async def unsubscribe(self, conference_code: str) -> None:
+        self._codes.discard(conference_code)
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.unsubscribe(self.channel(conference_code))
+            except (RedisError, OSError) as exc:
+                logger.warning("Backplane unsubscribe failed for %s: %s", conference_code, exc)
+
+    async def publish(self, conference_code: str, message: dict) -> None:
+        if self._redis is None:
+            return
+        data = json.dumps({"origin": self.node_id, **message}, ensure_ascii=False)
+        try:
+            await self._redis.publish(self.channel(conference_code), data)
+            self.stats["published"] += 1
+        except (RedisError, OSError) as exc:
+            self.stats["publish_errors"] += 1
+            logger.warning("Backplane publish failed for %s: %s", conference_code, exc)
+
+    def get_stats(self) -> dict:
+        stats = dict(self.stats)
+        stats["node_id"] = self.node_id
+        stats["subscribed_rooms"] = len(self._codes)
+        stats["connected"] = self._pubsub is not None
+        return stats
+
+    async def _listen(self) -> None:
+        delay = self.RECONNECT_DELAY
+        while True:
+            try:
+                await self._connect_pubsub()
+                delay = self.RECONNECT_DELAY
+                while True:
+                    message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is not None:
+                        await self._dispatch(message)
+            except asyncio.CancelledError:
+                raise
+            except (RedisError, OSError) as exc:
+                logger.warning("Backplane connection lost, reconnecting: %s", exc)
+                self.stats["reconnects"] += 1
+                await self._close_pubsub()
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.MAX_RECONNECT_DELAY)
+
+    async def _connect_pubsub(self) -> None:
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(self._node_channel, *(self.channel(code) for code in self._codes))
+        self._pubsub = pubsub
+
+    async def _close_pubsub(self) -> None:
+        pubsub, self._pubsub = self._pubsub, None
+        if pubsub is not None:
+            try:
+                await pubsub.aclose()
+            except (RedisError, OSError):
+                pass
+
+    async def _dispatch(self, message: dict) -> None:
+        channel = message.get("channel") or ""
+        if not channel.startswith(self.CHANNEL_PREFIX):
+            return
+        try:
+            data = json.loads(message["data"])
+        except (TypeError, ValueError):
+            return
+        if data.get("origin") == self.node_id:
+            return
+        self.stats["received"] += 1
+        # Handled off the listener so one slow room cannot stall the others
+        task = asyncio.create_task(self._handle(channel[len(self.CHANNEL_PREFIX):], data))
+        self._handlers.add(task)
+        task.add_done_callback(self._handlers.discard)
+
+    async def _handle(self, conference_code: str, data: dict) -> None:
+        try:
+            await self._on_message(conference_code, data)
+        except Exception:
+            logger.exception("Backplane message handler failed")
@@ -0,0 +1,57 @@
+import base64
+from typing import Optional
+
+import httpx
+
+from app.core.config import settings
+
+
+class SpeechToTextService:
+    """
+    Speech-to-text for pipeline workers. Without a configured provider it is
+    a local stub that reads the audio bytes as UTF-8 text, so the pipeline
+    can be exercised end to end by sending the words themselves as audio.
+    """
+
+    def __init__(self):
+        self.api_key = settings.STT_API_KEY
+        self.api_url = settings.STT_API_URL
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=settings.PIPELINE_TASK_TIME_LIMIT_SECONDS,
+                headers={"Authorization": f"Bearer {self.api_key}"} if self.api_key else None,
+            )
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def transcribe(self, audio: bytes, language: str) -> Optional[str]:
+        """Transcript of one audio chunk; None when the provider fails"""
+        if not self.api_key or not self.api_url:
+            return self._stub_transcribe(audio)
+
+        try:
+            response = await self._get_client().post(
+                self.api_url,
+                json={
+                    "audio": base64.b64encode(audio).decode("ascii"),
+                    "language": language,
+                },
+            )
+            if response.status_code == 200:
+                return response.json().get("text") or ""
+            return None
+        except Exception:
+            return None
+
+    def _stub_transcribe(self, audio: bytes) -> str:
+        return audio.decode("utf-8", errors="replace")
+
+
+speech_to_text = SpeechToTextService()
@@ -0,0 +1,175 @@
+import csv
+import html
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import select
+
+from app.core.database import AsyncSessionLocal
+from app.models.conference import Conference
+from app.models.conference_participant import ConferenceParticipant
+from app.models.translation import Translation
+from app.schemas.conference import TranscriptFormat
+from app.services.translation_partitions import conference_window
+
+# Rows fetched per round trip from the server-side cursor (and formatted per chunk)
+EXPORT_YIELD_PER = 500
+# A subtitle cue lasts until the next one starts, but never longer than this
+CUE_MAX_SECONDS = 6.0
+
+CSV_COLUMNS = ["timestamp", "speaker", "language_from", "language_to", "original_text", "translated_text"]
+
+# text/* types get "; charset=utf-8" appended by the response
+MEDIA_TYPES: Dict[TranscriptFormat, str] = {
+    TranscriptFormat.NDJSON: "application/x-ndjson",
+    TranscriptFormat.CSV: "text/csv",
+    TranscriptFormat.SRT: "application/x-subrip; charset=utf-8",
+    TranscriptFormat.VTT: "text/vtt",
+}
+
+
+def _transcript_stmt(conference: Conference, language: Optional[str]):
+    stmt = select(
+        Translation.created_at,
+        ConferenceParticipant.guest_name.label("speaker"),
+        Translation.language_from,
+        Translation.language_to,
+        Translation.original_text,
+        Translation.translated_text,
+    ).outerjoin(
+        ConferenceParticipant, ConferenceParticipant.id == Translation.speaker_id
+    ).where(Translation.conference_id == conference.id, *conference_window(conference))
+    if language is not None:
+        stmt = stmt.where(Translation.language_to == language)
+    # Served by ix_translations_conference_created on the partitions in the window
+    return stmt.order_by(Translation.created_at, Translation.id)
+
+
+def _ndjson(rows: Iterable) -> str:
+    return "".join(
+        json.dumps({
+            "timestamp": row.created_at.isoformat() if row.created_at else None,
+            "speaker": row.speaker,
+            "language_from": row.language_from,
+            "language_to": row.language_to,
+            "original_text": row.original_text,
+            "translated_text": row.translated_text,
+        }, ensure_ascii=False) + "\n"
+        for row in rows
+    )
+
+
+def _csv(rows: Iterable) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([
+            row.created_at.isoformat() if row.created_at else "",
+            row.speaker or "",
+            row.language_from,
+            row.language_to,
+            row.original_text,
+            row.translated_text or "",
+        ])
+    return buffer.getvalue()
+
+
+def _timestamp(seconds: float, separator: str) -> str:
+    millis = int(round(max(seconds, 0.0) * 1000))
+    hours, millis = divmod(millis, 3600000)
+    minutes, millis = divmod(millis, 60000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+
+class _CueWriter:
+    """
+    SRT/WebVTT cues from rows in time order. A cue ends where the next one
+    starts, so each row is held back until its successor arrives.
+    """
+
+    def __init__(self, origin: Optional[datetime], vtt: bool):
+        self.origin = origin
+        self.vtt = vtt
+        self.index = 0
+        self._held = None
+
+    def feed(self, rows: Iterable) -> str:
+        parts: List[str] = []
+        for row in rows:
+            if row.created_at is None:
+                continue
+            if self.origin is None:
+                self.origin = row.created_at
+            start = (row.created_at - self.origin).total_seconds()
+            if self._held is not None:
+                parts.append(self._cue(*self._held, end=start))
+            self._held = (start, row)
+        return "".join(parts)
+
+    def close(self) -> str:
+        if self._held is None:
+            return ""
+        return self._cue(*self._held, end=None)
+
+    def _cue(self, start: float, row, end: Optional[float]) -> str:
+        self.index += 1
+        end = start + CUE_MAX_SECONDS if end is None else min(max(end, start), start + CUE_MAX_SECONDS)
+        text = (row.translated_text or row.original_text).replace("\r", " ").replace("\n", " ").strip()
+        separator = "." if self.vtt else ","
+        timing = f"{_timestamp(start, separator)} --> {_timestamp(end, separator)}"
+        if self.vtt:
+            # Cue text is markup in WebVTT
+            text = html.escape(text, quote=False)
+            line = f"<v {html.escape(row.speaker, quote=False)}>{text}" if row.speaker else text
+            return f"{timing}\n{line}\n\n"
+        line = f"{row.speaker}: {text}" if row.speaker else text
+        return f"{self.index}\n{timing}\n{line}\n\n"
+
+
+async def stream_transcript(
+    conference: Conference,
+    export_format: TranscriptFormat,
+    language: Optional[str] = None,
+) -> AsyncIterator[str]:
+    """
+    Yield the conference transcript in `export_format`, one chunk per
+    EXPORT_YIELD_PER rows read from a server-side cursor, so memory does not
+    grow with the length of the conference.
+
+    Opens its own session: the response body is produced after the request's
+    dependencies may already have been cleaned up.
+    """
+    if export_format in (TranscriptFormat.SRT, TranscriptFormat.VTT):
+        # One cue track: several target languages would interleave duplicate cues
+        language = language or conference.language_to
+        cues = _CueWriter(conference.started_at, vtt=export_format == TranscriptFormat.VTT)
+        format_rows: Callable[[Iterable], str] = cues.feed
+    else:
+        cues = None
+        format_rows = _ndjson if export_format == TranscriptFormat.NDJSON else _csv
+
+    if export_format == TranscriptFormat.CSV:
+        yield ",".join(CSV_COLUMNS) + "\r\n"
+    elif export_format == TranscriptFormat.VTT:
+        yield "WEBVTT\n\n"
+
+    stmt = _transcript_stmt(conference, language).execution_options(yield_per=EXPORT_YIELD_PER)
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(stmt)
+        async for partition in result.partitions():
+            chunk = format_rows(partition)
+            if chunk:
+                yield chunk
+
+    if cues is not None:
+        tail = cues.close()
+        if tail:
+            yield tail
+
+
+def export_filename(conference: Conference, export_format: TranscriptFormat) -> str:
+    return f"{conference.conference_code}-transcript.{export_format.value}"
+
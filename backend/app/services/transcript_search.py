@@ -0,0 +1,138 @@
+import base64
+import html
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import REAL, and_, case, cast, func, literal, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.conference import Conference
+from app.models.conference_participant import ConferenceParticipant
+from app.models.translation import Translation
+
+# ts_headline marks hits with control characters (never in transcripts, valid in any server encoding)
+# so the text can be escaped before <mark> goes in
+_START, _STOP = "\x02", "\x03"
+HEADLINE_OPTIONS = f"StartSel={_START}, StopSel={_STOP}, MaxWords=30, MinWords=10, MaxFragments=2, FragmentDelimiter=\" ... \""
+
+
+def encode_cursor(rank: float, created_at: datetime, translation_id: UUID) -> str:
+    """Opaque keyset cursor pointing just after the given hit"""
+    raw = f"{rank!r}|{created_at.isoformat()}|{translation_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[float, datetime, UUID]:
+    """Decode a cursor from encode_cursor into (rank, created_at, id)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        rank, created_at, translation_id = raw.split("|")
+        return float(rank), datetime.fromisoformat(created_at), UUID(translation_id)
+    except ValueError:
+        raise ValueError("Invalid cursor")
+
+
+def _highlight(fragment: Optional[str]) -> Optional[str]:
+    if fragment is None:
+        return None
+    return html.escape(fragment, quote=False).replace(_START, "<mark>").replace(_STOP, "</mark>")
+
+
+def _search_stmt(
+    user_id: UUID,
+    query: str,
+    language: str,
+    conference_id: Optional[UUID],
+    limit: int,
+    after: Optional[Tuple[float, datetime, UUID]],
+):
+    """
+    The host's translations matching `query` (web search syntax) in
+    `language`, best first. Original text is searched when it was spoken
+    in that language, translated text when it was translated into it, so
+    the query and the vectors always share a text search config.
+    """
+    config = func.translation_ts_config(language)
+    tsquery = func.websearch_to_tsquery(config, query)
+    in_original = Translation.language_from == language
+    in_translated = Translation.language_to == language
+    # real, like ts_rank_cd itself, so cursor values compare exactly
+    rank = cast(
+        case((in_original, func.ts_rank_cd(Translation.original_tsv, tsquery)), else_=0)
+        + case((in_translated, func.coalesce(func.ts_rank_cd(Translation.translated_tsv, tsquery), 0)), else_=0),
+        REAL,
+    )
+
+    # Rank and pick the page on narrow rows (BitmapOr over the two GIN indexes) ...
+    page = select(
+        Translation.id, Translation.created_at, rank.label("rank")
+    ).join(
+        Conference, Conference.id == Translation.conference_id
+    ).where(
+        Conference.host_id == user_id,
+        or_(
+            and_(in_original, Translation.original_tsv.op("@@")(tsquery)),
+            and_(in_translated, Translation.translated_tsv.op("@@")(tsquery)),
+        ),
+    )
+    if conference_id is not None:
+        page = page.where(Translation.conference_id == conference_id)
+    if after is not None:
+        page = page.where(tuple_(rank, Translation.created_at, Translation.id) < tuple_(
+            literal(after[0], REAL), literal(after[1]), literal(after[2])
+        ))
+    page = page.order_by(
+        rank.desc(), Translation.created_at.desc(), Translation.id.desc()
+    ).limit(limit).subquery()
+
+    # ... then fetch the texts and build headlines (the expensive part) for that page only
+    return select(
+        Translation.id,
+        Translation.conference_id,
+        Conference.title.label("conference_title"),
+        Translation.created_at,
+        ConferenceParticipant.guest_name.label("speaker"),
+        Translation.language_from,
+        Translation.language_to,
+        Translation.original_text,
+        Translation.translated_text,
+        case((in_original, func.ts_headline(config, Translation.original_text, tsquery, HEADLINE_OPTIONS))).label("original_highlight"),
+        case((in_translated, func.ts_headline(config, Translation.translated_text, tsquery, HEADLINE_OPTIONS))).label("translated_highlight"),
+        page.c.rank,
+    ).join(
+        page, and_(page.c.id == Translation.id, page.c.created_at == Translation.created_at)
+    ).join(
+        Conference, Conference.id == Translation.conference_id
+    ).outerjoin(
+        ConferenceParticipant, ConferenceParticipant.id == Translation.speaker_id
+    ).order_by(page.c.rank.desc(), Translation.created_at.desc(), Translation.id.desc())
+
+
+async def search_transcripts(
+    db: AsyncSession,
+    user_id: UUID,
+    query: str,
+    language: str,
+    conference_id: Optional[UUID] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> dict:
+    """A page of ranked, highlighted transcript hits across the host's conferences"""
+    after = decode_cursor(cursor) if cursor else None
+    # One extra row tells whether another page follows
+    rows = (await db.execute(_search_stmt(user_id, query, language, conference_id, limit + 1, after))).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    hits = []
+    for row in rows:
+        hit = row._asdict()
+        hit["original_highlight"] = _highlight(row.original_highlight)
+        hit["translated_highlight"] = _highlight(row.translated_highlight)
+        hits.append(hit)
+    return {
+        "hits": hits,
+        "size": limit,
+        "next_cursor": encode_cursor(rows[-1].rank, rows[-1].created_at, rows[-1].id) if has_more else None,
+    }
@@ -0,0 +1,96 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+SendBatch = Callable[[List[str], str, str], Awaitable[List[Optional[str]]]]
+
+
+class TranslationBatcher:
+    """
+    Dynamic micro-batching of concurrent translations. Requests for the same
+    language pair are collected for up to `window_ms` (or until
+    `max_batch_size` items) and sent as one provider call; each caller gets
+    its own result back. A None result means the provider failed for it.
+    """
+
+    def __init__(self, send_batch: SendBatch, window_ms: float, max_batch_size: int):
+        self._send_batch = send_batch
+        self.window = window_ms / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+        self._pending: Dict[Tuple[str, str], List[Tuple[str, asyncio.Future]]] = {}
+        self._timers: Dict[Tuple[str, str], asyncio.TimerHandle] = {}
+        self._in_flight: Set[asyncio.Task] = set()
+        self.stats = {
+            "batches": 0,
+            "items": 0,
+            "size_flushes": 0,
+            "window_flushes": 0,
+            "max_batch_seen": 0,
+            "failed_batches": 0,
+        }
+
+    async def submit(self, text: str, source_language: str, target_language: str) -> Optional[str]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pair = (source_language, target_language)
+
+        batch = self._pending.setdefault(pair, [])
+        batch.append((text, future))
+        if len(batch) >= self.max_batch_size:
+            self.stats["size_flushes"] += 1
+            self._flush(pair)
+        elif len(batch) == 1:
+            self._timers[pair] = loop.call_later(self.window, self._flush_on_window, pair)
+
+        return await future
+
+    async def drain(self) -> None:
+        """Flush everything still pending and wait for in-flight batches"""
+        for pair in list(self._pending):
+            self._flush(pair)
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    def get_stats(self) -> dict:
+        stats = dict(self.stats)
+        stats["avg_batch_size"] = round(stats["items"] / stats["batches"], 2) if stats["batches"] else 0.0
+        stats["pending"] = sum(len(batch) for batch in self._pending.values())
+        stats["window_ms"] = self.window * 1000.0
+        stats["max_batch_size"] = self.max_batch_size
+        return stats
+
+    def _flush_on_window(self, pair: Tuple[str, str]) -> None:
+        self.stats["window_flushes"] += 1
+        self._flush(pair)
+
+    def _flush(self, pair: Tuple[str, str]) -> None:
+        timer = self._timers.pop(pair, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(pair, None)
+        if not batch:
+            return
+        task = asyncio.create_task(self._send(pair, batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, pair: Tuple[str, str], batch: List[Tuple[str, asyncio.Future]]) -> None:
+        self.stats["batches"] += 1
+        self.stats["items"] += len(batch)
+        self.stats["max_batch_seen"] = max(self.stats["max_batch_seen"], len(batch))
+
+        try:
+            results = await self._send_batch([text for text, _ in batch], *pair)
+        except Exception:
+            logger.exception("Batched translation request failed")
+            results = []
+        if len(results) != len(batch):
+            self.stats["failed_batches"] += 1
+            results = list(results) + [None] * (len(batch) - len(results))
+
+        for (_, future), result in zip(batch, results):
+            # A caller may have given up (cancelled) while the batch was in flight
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,96 @@
+import hashlib
+import re
+import unicodedata
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from app.services.ttl_cache import RedisTier, TTLCache
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache lookups (unicode form + whitespace)"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+class TranslationCache:
+    """
+    Two-tier translation cache: a bounded in-process LRU with TTL in front of
+    the shared Redis instance. Redis failures degrade to the local tier only.
+    """
+
+    REDIS_PREFIX = "translation:"
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        redis_url: Optional[str] = None,
+        redis_ttl_seconds: int = 86400,
+        redis_timeout: float = 0.1,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self._local = TTLCache(max_entries)
+        self._redis = RedisTier("Translation cache", redis_url, redis_timeout, decode_responses=True)
+        self.stats = {
+            "local_hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+        }
+
+    @staticmethod
+    def make_key(text: str, source_language: str, target_language: str) -> str:
+        """Cache key from normalized text plus the language pair"""
+        digest = hashlib.sha1(normalize_text(text).encode("utf-8")).hexdigest()
+        return f"{source_language}:{target_language}:{digest}"
+
+    async def get(self, key: str) -> Optional[str]:
+        value = self._local.get(key)
+        if value is not None:
+            self.stats["local_hits"] += 1
+            return value
+
+        client = self._redis.client()
+        if client is not None:
+            try:
+                value = await client.get(self.REDIS_PREFIX + key)
+            except (RedisError, OSError) as exc:
+                self._redis.failed(exc)
+                value = None
+            if value is not None:
+                self.stats["redis_hits"] += 1
+                self._local.set(key, value, self.ttl_seconds)
+                return value
+
+        self.stats["misses"] += 1
+        return None
+
+    async def set(self, key: str, value: str) -> None:
+        self._local.set(key, value, self.ttl_seconds)
+        client = self._redis.client()
+        if client is None:
+            return
+        try:
+            await client.set(self.REDIS_PREFIX + key, value, ex=self.redis_ttl_seconds)
+        except (RedisError, OSError) as exc:
+            self._redis.failed(exc)
+
+    async def close(self) -> None:
+        await self._redis.close()
+
+    def get_stats(self) -> dict:
+        stats = dict(self.stats)
+        lookups = stats["local_hits"] + stats["redis_hits"] + stats["misses"]
+        stats["evictions"] = self._local.evictions
+        stats["expirations"] = self._local.expirations
+        stats["redis_errors"] = self._redis.errors
+        stats["size"] = len(self._local)
+        stats["max_entries"] = self.max_entries
+        stats["hit_ratio"] = (
+            round((stats["local_hits"] + stats["redis_hits"]) / lookups, 4) if lookups else 0.0
+        )
+        return stats
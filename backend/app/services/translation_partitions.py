@@ -0,0 +1,189 @@
+import asyncio
+import logging
+import re
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.core.config import settings
+from app.core.database import async_engine
+from app.models.translation import DEFAULT_PARTITION, Translation
+
+logger = logging.getLogger(__name__)
+
+TABLE = Translation.__tablename__
+# Generated columns are computed on insert, so rows are moved without them
+_STORED_COLUMNS = ", ".join(column.name for column in Translation.__table__.columns if column.computed is None)
+_PARTITION_NAME = re.compile(rf"^{TABLE}_y(\d{{4}})m(\d{{2}})$")
+# pg_try_advisory_xact_lock key: one instance maintains partitions at a time
+_MAINTENANCE_LOCK = 7310020211
+# Translation rows carry the app server's clock, conferences the database's
+CLOCK_SKEW = timedelta(minutes=5)
+
+
+def month_start(moment: datetime) -> datetime:
+    moment = moment.astimezone(timezone.utc)
+    return datetime(moment.year, moment.month, 1, tzinfo=timezone.utc)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+def conference_window(conference, until_end: bool = True) -> list:
+    """
+    created_at bounds of a conference's translations. Added to queries by
+    conference_id so the planner only scans the partitions the conference
+    spans instead of probing every month. Without `until_end` only the
+    lower bound is applied (for deletes, which must not miss a late row).
+    """
+    clauses = [Translation.created_at >= conference.created_at - CLOCK_SKEW]
+    if until_end and conference.ended_at is not None:
+        clauses.append(Translation.created_at <= conference.ended_at + CLOCK_SKEW)
+    return clauses
+
+
+class TranslationPartitionManager:
+    """
+    Keeps the monthly partitions of `translations` ahead of the clock and
+    applies retention by dropping whole partitions (no DELETE, no bloat,
+    no vacuum debt). Rows outside every month land in the default
+    partition; they are moved out when their month is created.
+    """
+
+    def __init__(self, engine: AsyncEngine, months_ahead: int, retention_months: int, interval: float):
+        self._engine = engine
+        self.months_ahead = max(1, months_ahead)
+        self.retention_months = max(0, retention_months)
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {
+            "runs": 0,
+            "skipped": 0,
+            "errors": 0,
+            "partitions_created": 0,
+            "partitions_dropped": 0,
+            "rows_moved_from_default": 0,
+            "last_run_ms": 0.0,
+        }
+
+    async def startup(self) -> None:
+        await self.run_once()
+        self._task = asyncio.create_task(self._loop())
+
+    async def shutdown(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def run_once(self, now: Optional[datetime] = None) -> dict:
+        """Create upcoming partitions and drop expired ones; returns what changed"""
+        now = now or datetime.now(timezone.utc)
+        started = asyncio.get_running_loop().time()
+        changes = {"created": [], "dropped": [], "moved": 0}
+        try:
+            async with self._engine.begin() as conn:
+                if not await self._is_partitioned(conn):
+                    self.stats["skipped"] += 1
+                    return changes
+                locked = await conn.scalar(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": _MAINTENANCE_LOCK})
+                if not locked:
+                    # Another instance is on it
+                    self.stats["skipped"] += 1
+                    return changes
+                months = await self._months(conn)
+                current = month_start(now)
+                for offset in range(self.months_ahead + 1):
+                    month = add_months(current, offset)
+                    if month not in months:
+                        changes["moved"] += await self._create(conn, month)
+                        changes["created"].append(partition_name(month))
+                if self.retention_months:
+                    cutoff = add_months(current, -self.retention_months)
+                    for month in sorted(months):
+                        if add_months(month, 1) <= cutoff:
+                            await conn.execute(text(f"DROP TABLE {partition_name(month)}"))
+                            changes["dropped"].append(partition_name(month))
+                    await conn.execute(
+                        text(f"DELETE FROM {DEFAULT_PARTITION} WHERE created_at < :cutoff"), {"cutoff": cutoff}
+                    )
+        except SQLAlchemyError:
+            self.stats["errors"] += 1
+            logger.exception("Translation partition maintenance failed")
+            return changes
+
+        self.stats["runs"] += 1
+        self.stats["partitions_created"] += len(changes["created"])
+        self.stats["partitions_dropped"] += len(changes["dropped"])
+        self.stats["rows_moved_from_default"] += changes["moved"]
+        self.stats["last_run_ms"] = round((asyncio.get_running_loop().time() - started) * 1000, 3)
+        if changes["created"] or changes["dropped"]:
+            logger.info(
+                "Translation partitions created=%s dropped=%s moved_from_default=%d",
+                changes["created"], changes["dropped"], changes["moved"],
+            )
+        return changes
+
+    def get_stats(self) -> dict:
+        stats = dict(self.stats)
+        stats["months_ahead"] = self.months_ahead
+        stats["retention_months"] = self.retention_months
+        return stats
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.run_once()
+
+    async def _is_partitioned(self, conn: AsyncConnection) -> bool:
+        return await conn.scalar(text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:name))"
+        ), {"name": TABLE})
+
+    async def _months(self, conn: AsyncConnection) -> List[datetime]:
+        names = await conn.scalars(text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:name)"
+        ), {"name": TABLE})
+        months = []
+        for name in names:
+            match = _PARTITION_NAME.match(name)
+            if match:
+                months.append(datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=timezone.utc))
+        return months
+
+    async def _create(self, conn: AsyncConnection, month: datetime) -> int:
+        """
+        Create the partition for `month` as a plain table, move that month's
+        rows out of the default partition and attach it. Attaching checks the
+        default partition for overlapping rows, so they have to go first.
+        """
+        name = partition_name(month)
+        lower, upper = month.isoformat(), add_months(month, 1).isoformat()
+        await conn.execute(text(
+            f"CREATE TABLE {name} (LIKE {TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING GENERATED)"
+        ))
+        moved = await conn.execute(text(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+            f"WHERE created_at >= :lower AND created_at < :upper RETURNING {_STORED_COLUMNS}) "
+            f"INSERT INTO {name} ({_STORED_COLUMNS}) SELECT {_STORED_COLUMNS} FROM moved"
+        ), {"lower": month, "upper": add_months(month, 1)})
+        await conn.execute(text(f"ALTER TABLE {TABLE} ATTACH PARTITION {name} FOR VALUES FROM ('{lower}') TO ('{upper}')"))
+        return moved.rowcount or 0
+
+
+translation_partitions = TranslationPartitionManager(
+    async_engine,
+    months_ahead=settings.TRANSLATION_PARTITIONS_AHEAD,
+    retention_months=settings.TRANSLATION_RETENTION_MONTHS,
+    interval=settings.TRANSLATION_PARTITION_CHECK_SECONDS,
+)
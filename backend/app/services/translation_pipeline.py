@@ -0,0 +1,70 @@
+import asyncio
+import base64
+import logging
+from typing import Iterable, Set
+
+from app.celery_app import TRANSCRIBE_TASK, TRANSLATE_TASK, audio_queue, celery_app, text_queue
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TranslationPipeline:
+    """
+    Gateway side of the worker pipeline. Audio chunks and final transcripts
+    are handed to Celery workers on per-language queues; the workers publish
+    results to the room's backplane channel instead of calling back, so they
+    reach every node with listeners in the room.
+    """
+
+    def __init__(self):
+        self.stats = {
+            "audio_submitted": 0,
+            "text_submitted": 0,
+            "submit_errors": 0,
+        }
+
+    async def submit_audio(self, message: dict, audio: bytes, languages: Iterable[str], record_on: str) -> bool:
+        """Queue speech-to-text (and the translations after it) for one audio chunk"""
+        submitted = await self._send(
+            TRANSCRIBE_TASK,
+            (message, base64.b64encode(audio).decode("ascii"), sorted(languages), record_on),
+            audio_queue(message["source_language"]),
+        )
+        if submitted:
+            self.stats["audio_submitted"] += 1
+        return submitted
+
+    async def submit_text(self, message: dict, targets: Iterable[str], record_on: str) -> Set[str]:
+        """Queue one translation task per target language; returns the languages handed off"""
+        targets = sorted(targets)
+        submitted = await asyncio.gather(*(
+            self._send(
+                TRANSLATE_TASK,
+                (message, target, record_on),
+                text_queue(message["source_language"], target),
+            )
+            for target in targets
+        ))
+        handed_off = {target for target, ok in zip(targets, submitted) if ok}
+        self.stats["text_submitted"] += len(handed_off)
+        return handed_off
+
+    def get_stats(self) -> dict:
+        return dict(self.stats)
+
+    async def _send(self, name: str, args: tuple, queue: str) -> bool:
+        try:
+            # kombu publishes synchronously; keep it off the event loop
+            await asyncio.to_thread(
+                celery_app.send_task,
+                name,
+                args=args,
+                queue=queue,
+                expires=settings.PIPELINE_TASK_EXPIRES_SECONDS,
+            )
+            return True
+        except Exception as exc:
+            self.stats["submit_errors"] += 1
+            logger.warning("Pipeline submit to %s failed: %s", queue, exc)
+            return False
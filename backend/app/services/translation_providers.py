@@ -0,0 +1,262 @@
+import math
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from app.core.config import settings
+from app.services.circuit_breaker import CircuitBreaker
+
+Pair = Tuple[str, str]
+
+# Samples needed before a pair's own p95 is trusted as the hedge delay
+MIN_P95_SAMPLES = 20
+
+
+class PairLatency:
+    """EWMA of latency and error rate for one provider and language pair"""
+
+    __slots__ = ("ewma_ms", "error_rate", "samples", "updated_at")
+
+    def __init__(self, window: int):
+        self.ewma_ms: Optional[float] = None
+        self.error_rate = 0.0
+        self.samples: deque = deque(maxlen=window)
+        self.updated_at: Optional[float] = None
+
+    def observe(self, latency_ms: float, alpha: float) -> None:
+        if self.ewma_ms is None:
+            self.ewma_ms = latency_ms
+        else:
+            # Capped so one stall does not move traffic away (hedging covers stalls);
+            # a sustained slowdown still raises the average within a few calls
+            self.ewma_ms = alpha * min(latency_ms, 2 * self.ewma_ms) + (1 - alpha) * self.ewma_ms
+        self.error_rate = (1 - alpha) * self.error_rate
+        self.samples.append(latency_ms)
+        self.updated_at = time.monotonic()
+
+    def error(self, alpha: float) -> None:
+        # Timeouts and errors carry no latency sample; they only raise the error rate
+        self.error_rate = alpha + (1 - alpha) * self.error_rate
+        self.updated_at = time.monotonic()
+
+    def p95(self) -> Optional[float]:
+        if len(self.samples) < MIN_P95_SAMPLES:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[math.ceil(len(ordered) * 0.95) - 1]
+
+
+class TranslationProvider:
+    """
+    One translation backend: its endpoint, its own pooled HTTP client, its
+    circuit breaker and the latency and error statistics routing is based
+    on, per language pair. Each provider has its own connection limits, so
+    a slow one cannot hold every connection while the others are idle.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        api_url: str,
+        api_key: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive: Optional[int] = None,
+    ):
+        self.name = name
+        self.api_url = api_url
+        self.headers = {"Authorization": f"Bearer {api_key}"} if api_key else None
+        self.max_connections = max_connections or settings.TRANSLATION_POOL_MAX_CONNECTIONS
+        self.max_keepalive = max_keepalive or settings.TRANSLATION_POOL_MAX_KEEPALIVE
+        self._client: Optional[httpx.AsyncClient] = None
+        self._pool_counters = {
+            "requests": 0,
+            "new_connections": 0,
+            "pool_waits": 0,
+        }
+        self.breaker: Optional[CircuitBreaker] = None
+        if settings.TRANSLATION_BREAKER_ENABLED:
+            self.breaker = CircuitBreaker(
+                f"translation:{name}",
+                failure_threshold=settings.TRANSLATION_BREAKER_FAILURES,
+                slow_call_ms=settings.TRANSLATION_BREAKER_SLOW_CALL_MS,
+                open_seconds=settings.TRANSLATION_BREAKER_OPEN_SECONDS,
+                half_open_probes=settings.TRANSLATION_BREAKER_HALF_OPEN_PROBES,
+            )
+        self._pairs: Dict[Pair, PairLatency] = {}
+        self.stats = {
+            "requests": 0,
+            "successes": 0,
+            "failures": 0,
+            "cancelled": 0,
+            "refreshes": 0,
+        }
+
+    def client(self) -> httpx.AsyncClient:
+        """Return the provider's long-lived pooled client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            budget = settings.TRANSLATION_LATENCY_BUDGET_MS / 1000
+            self._client = httpx.AsyncClient(
+                http2=settings.TRANSLATION_HTTP2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive,
+                    keepalive_expiry=settings.TRANSLATION_POOL_KEEPALIVE_EXPIRY,
+                ),
+                timeout=httpx.Timeout(budget, connect=min(settings.TRANSLATION_CONNECT_TIMEOUT_MS / 1000, budget)),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the client and its pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _connection_pool(self):
+        """httpcore pool behind the client (None before first use)"""
+        transport = getattr(self._client, "_transport", None)
+        return getattr(transport, "_pool", None)
+
+    def note_pool_request(self) -> None:
+        """Count a request and whether it has to wait for a free connection"""
+        self._pool_counters["requests"] += 1
+        pool = self._connection_pool()
+        if pool is None:
+            return
+        connections = pool.connections
+        if len(connections) >= self.max_connections and not any(
+            connection.is_available() for connection in connections
+        ):
+            self._pool_counters["pool_waits"] += 1
+
+    async def trace(self, event_name: str, info: dict) -> None:
+        """httpcore trace hook: counts freshly opened TCP connections"""
+        if event_name == "connection.connect_tcp.complete":
+            self._pool_counters["new_connections"] += 1
+
+    def get_pool_stats(self) -> dict:
+        """Connection pool statistics for sizing this provider's pool"""
+        stats = dict(self._pool_counters)
+        pool = self._connection_pool()
+        connections = pool.connections if pool is not None else []
+        stats["name"] = self.name
+        stats["open_connections"] = len(connections)
+        stats["idle_connections"] = sum(1 for connection in connections if connection.is_idle())
+        stats["http2_connections"] = sum(
+            1 for connection in connections if "HTTP/2" in connection.info()
+        )
+        stats["max_connections"] = self.max_connections
+        requests = stats["requests"]
+        stats["reuse_ratio"] = (
+            round(1 - min(stats["new_connections"], requests) / requests, 4) if requests else 0.0
+        )
+        return stats
+
+    @property
+    def available(self) -> bool:
+        return self.breaker is None or not self.breaker.is_open
+
+    def allow(self) -> bool:
+        return self.breaker is None or self.breaker.allow()
+
+    def latency(self, pair: Pair) -> PairLatency:
+        latency = self._pairs.get(pair)
+        if latency is None:
+            latency = self._pairs[pair] = PairLatency(settings.TRANSLATION_PROVIDER_SAMPLE_WINDOW)
+        return latency
+
+    def expected_ms(self, pair: Pair, now: float) -> float:
+        """
+        Expected time to a good answer: latency scaled by the error rate.
+        Unknown or stale pairs score 0 so the next request refreshes them.
+        """
+        latency = self._pairs.get(pair)
+        if latency is None or latency.updated_at is None:
+            return 0.0
+        if now - latency.updated_at > settings.TRANSLATION_PROVIDER_REFRESH_SECONDS:
+            return 0.0
+        ewma = latency.ewma_ms if latency.ewma_ms is not None else settings.TRANSLATION_LATENCY_BUDGET_MS
+        return ewma / max(1.0 - latency.error_rate, 0.05)
+
+    def claim_refresh(self, pair: Pair, now: float) -> None:
+        """Routed to for its unknown or stale stats: hold off other requests until it answers"""
+        latency = self.latency(pair)
+        if latency.updated_at is None or now - latency.updated_at > settings.TRANSLATION_PROVIDER_REFRESH_SECONDS:
+            latency.updated_at = now
+            self.stats["refreshes"] += 1
+
+    def hedge_delay_ms(self, pair: Pair) -> float:
+        """How long to wait for this provider before asking another: its p95 for the pair"""
+        p95 = self.latency(pair).p95()
+        if p95 is None:
+            p95 = settings.TRANSLATION_HEDGE_DEFAULT_DELAY_MS
+        return max(p95, settings.TRANSLATION_HEDGE_MIN_DELAY_MS)
+
+    def record(self, pair: Pair, started: float, healthy: Optional[bool]) -> None:
+        """
+        Report a finished call. healthy is None for a call cancelled before it
+        answered (the losing side of a hedge): it says nothing about the provider.
+        """
+        elapsed_ms = (time.monotonic() - started) * 1000
+        self.stats["requests"] += 1
+        if healthy is None:
+            self.stats["cancelled"] += 1
+            if self.breaker is not None:
+                self.breaker.release()
+        elif healthy:
+            self.stats["successes"] += 1
+            self.latency(pair).observe(elapsed_ms, settings.TRANSLATION_PROVIDER_EWMA_ALPHA)
+            if self.breaker is not None:
+                self.breaker.record_success(elapsed_ms)
+        else:
+            self.stats["failures"] += 1
+            self.latency(pair).error(settings.TRANSLATION_PROVIDER_EWMA_ALPHA)
+            if self.breaker is not None:
+                self.breaker.record_failure()
+
+    def get_stats(self) -> dict:
+        stats = dict(self.stats)
+        stats["name"] = self.name
+        stats["breaker"] = self.breaker.get_stats() if self.breaker is not None else None
+        stats["pairs"] = {}
+        for (source, target), latency in self._pairs.items():
+            p95 = latency.p95()
+            stats["pairs"][f"{source}-{target}"] = {
+                "ewma_ms": round(latency.ewma_ms, 1) if latency.ewma_ms is not None else None,
+                "error_rate": round(latency.error_rate, 4),
+                "p95_ms": round(p95, 1) if p95 is not None else None,
+                "samples": len(latency.samples),
+            }
+        return stats
+
+
+def load_providers() -> List[TranslationProvider]:
+    """
+    TRANSLATION_API_URL/KEY as provider "default", followed by TRANSLATION_PROVIDERS;
+    an entry's max_connections/max_keepalive override the TRANSLATION_POOL_* limits
+    """
+    providers = []
+    if settings.TRANSLATION_API_KEY and settings.TRANSLATION_API_URL:
+        providers.append(TranslationProvider("default", settings.TRANSLATION_API_URL, settings.TRANSLATION_API_KEY))
+    for index, entry in enumerate(settings.TRANSLATION_PROVIDERS):
+        if entry.get("url"):
+            name = entry.get("name") or f"provider{index + 1}"
+            providers.append(TranslationProvider(
+                name,
+                entry["url"],
+                entry.get("api_key"),
+                max_connections=int(entry["max_connections"]) if entry.get("max_connections") else None,
+                max_keepalive=int(entry["max_keepalive"]) if entry.get("max_keepalive") else None,
+            ))
+    return providers
+
+
+def rank_providers(providers: List[TranslationProvider], pair: Pair) -> List[TranslationProvider]:
+    """Providers whose circuit is not open, fastest expected first (ties keep configured order)"""
+    now = time.monotonic()
+    return sorted(
+        (provider for provider in providers if provider.available),
+        key=lambda provider: provider.expected_ms(pair, now),
+    )
@@ -1,47 +1,312 @@
+import asyncio
+import time
 import httpx
-from typing import Optional
+from typing import Dict, List, Optional
 from app.core.config import settings
+from app.services.translation_batcher import TranslationBatcher
+from app.services.translation_cache import TranslationCache
+from app.services.translation_providers import Pair, TranslationProvider, load_providers, rank_providers
 
 class TranslationService:
     def __init__(self):
-        self.api_key = settings.TRANSLATION_API_KEY
-        self.api_url = settings.TRANSLATION_API_URL
+        self.providers: List[TranslationProvider] = load_providers()
+        self.cache: Optional[TranslationCache] = None
+        if settings.TRANSLATION_CACHE_ENABLED:
+            self.cache = TranslationCache(
+                max_entries=settings.TRANSLATION_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.TRANSLATION_CACHE_TTL_SECONDS,
+                redis_url=settings.REDIS_URL,
+                redis_ttl_seconds=settings.TRANSLATION_CACHE_REDIS_TTL_SECONDS,
+                redis_timeout=settings.TRANSLATION_CACHE_REDIS_TIMEOUT,
+            )
+        self.batcher: Optional[TranslationBatcher] = None
+        if settings.TRANSLATION_BATCH_ENABLED:
+            self.batcher = TranslationBatcher(
+                send_batch=self._request_translation_batch,
+                window_ms=settings.TRANSLATION_BATCH_WINDOW_MS,
+                max_batch_size=settings.TRANSLATION_BATCH_MAX_SIZE,
+            )
+        self._deadline_counters = {"budget_exceeded": 0, "short_circuited": 0}
+        self._hedge_counters = {"hedged": 0, "hedge_wins": 0}
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._single_flight_counters = {"upstream_calls": 0, "coalesced": 0}
+    
+    async def startup(self) -> None:
+        """Open each provider's pooled client (called on app startup)"""
+        for provider in self.providers:
+            provider.client()
+    
+    async def shutdown(self) -> None:
+        """Close the providers' clients and their pooled connections"""
+        if self.batcher is not None:
+            await self.batcher.drain()
+        for provider in self.providers:
+            await provider.close()
+        if self.cache is not None:
+            await self.cache.close()
+    
+    def _timeout(self, remaining: float) -> httpx.Timeout:
+        """Deadlines for one request: the remaining budget, with connecting capped"""
+        return httpx.Timeout(remaining, connect=min(settings.TRANSLATION_CONNECT_TIMEOUT_MS / 1000, remaining))
+    
+    def _default_deadline(self) -> float:
+        return time.monotonic() + settings.TRANSLATION_LATENCY_BUDGET_MS / 1000
+    
+    def get_provider_stats(self) -> dict:
+        """Per provider breaker state and latency stats, hedging and fallback counters"""
+        stats = dict(self._deadline_counters)
+        stats.update(self._hedge_counters)
+        stats["providers"] = [provider.get_stats() for provider in self.providers]
+        return stats
+    
+    def get_pool_stats(self) -> dict:
+        """Connection pool statistics, in total and per provider (each has its own pool)"""
+        providers = [provider.get_pool_stats() for provider in self.providers]
+        stats = {
+            key: sum(provider[key] for provider in providers)
+            for key in (
+                "requests",
+                "new_connections",
+                "pool_waits",
+                "open_connections",
+                "idle_connections",
+                "http2_connections",
+                "max_connections",
+            )
+        }
+        requests = stats["requests"]
+        stats["reuse_ratio"] = (
+            round(1 - min(stats["new_connections"], requests) / requests, 4) if requests else 0.0
+        )
+        stats["providers"] = providers
+        return stats
     
     async def translate_text(
         self, 
         text: str, 
         source_language: str, 
-        target_language: str
+        target_language: str,
+        budget_ms: Optional[float] = None
     ) -> Optional[str]:
         """
-        Translate text from source language to target language
+        Translate text from source language to target language. A provider
+        that cannot answer within budget_ms (TRANSLATION_LATENCY_BUDGET_MS by
+        default) is replaced by the fallback translation.
         """
-        if not self.api_key or not self.api_url:
+        if not self.providers:
             # Fallback to simple translation logic
             return self._fallback_translate(text, source_language, target_language)
         
+        budget = settings.TRANSLATION_LATENCY_BUDGET_MS if budget_ms is None else budget_ms
+        deadline = time.monotonic() + budget / 1000
+        cache_key = TranslationCache.make_key(text, source_language, target_language)
+        if self.cache is not None:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        if not any(provider.available for provider in self.providers):
+            # Every provider is known to be failing: answer now rather than after a timeout
+            self._deadline_counters["short_circuited"] += 1
+            return self._fallback_translate(text, source_language, target_language)
+        
+        translated = await self._single_flight(cache_key, text, source_language, target_language, deadline)
+        if translated is None:
+            # Provider failed: serve the fallback, but never cache it as a translation
+            return self._fallback_translate(text, source_language, target_language)
+        return translated
+    
+    async def _single_flight(
+        self,
+        key: str,
+        text: str,
+        source_language: str,
+        target_language: str,
+        deadline: float
+    ) -> Optional[str]:
+        """
+        Share one upstream call among concurrent identical requests; each
+        waiter gives up at its own deadline and gets None
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            self._single_flight_counters["upstream_calls"] += 1
+            task = asyncio.create_task(
+                self._translate_and_cache(key, text, source_language, target_language, deadline)
+            )
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget_in_flight(key, done))
+        else:
+            self._single_flight_counters["coalesced"] += 1
+        
+        # Shielded: a cancelled or timed out waiter must not cancel the call the others share
+        # (it still completes and fills the cache)
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    headers={"Authorization": f"Bearer {self.api_key}"},
-                    json={
-                        "text": text,
-                        "source": source_language,
-                        "target": target_language
-                    }
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    return result.get("translated_text", text)
-                else:
-                    # Fallback if API fails
-                    return self._fallback_translate(text, source_language, target_language)
+            return await asyncio.wait_for(asyncio.shield(task), max(deadline - time.monotonic(), 0))
+        except asyncio.TimeoutError:
+            self._deadline_counters["budget_exceeded"] += 1
+            return None
+    
+    def _forget_in_flight(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+    
+    async def _translate_and_cache(
+        self,
+        key: str,
+        text: str,
+        source_language: str,
+        target_language: str,
+        deadline: float
+    ) -> Optional[str]:
+        if self.batcher is not None:
+            translated = await self.batcher.submit(text, source_language, target_language)
+        else:
+            translated = await self._request_translation(text, source_language, target_language, deadline)
         
+        if translated is not None and self.cache is not None:
+            await self.cache.set(key, translated)
+        return translated
+    
+    def get_single_flight_stats(self) -> dict:
+        """Upstream calls vs requests that joined an identical in-flight call"""
+        stats = dict(self._single_flight_counters)
+        stats["in_flight"] = len(self._in_flight)
+        return stats
+    
+    async def _request_translation(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str,
+        deadline: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Translate through the fastest healthy provider, hedged with the next
+        one; returns None when no provider answers in time
+        """
+        result = await self._hedged_call(
+            {"text": text, "source": source_language, "target": target_language},
+            (source_language, target_language),
+            deadline or self._default_deadline(),
+        )
+        if result is None:
+            return None
+        return result.get("translated_text", text)
+    
+    async def _hedged_call(self, payload: dict, pair: Pair, deadline: float) -> Optional[dict]:
+        """
+        Ask the fastest provider; if it has not answered within its p95 (or
+        failed), ask the next one as well and take whichever answers first.
+        The slower request is cancelled.
+        """
+        candidates = rank_providers(self.providers, pair)
+        if not candidates:
+            return None
+        primary = candidates[0]
+        primary.claim_refresh(pair, time.monotonic())
+        if not settings.TRANSLATION_HEDGING_ENABLED or len(candidates) < 2:
+            return await self._call_provider(primary, payload, pair, deadline)
+        
+        first = asyncio.create_task(self._call_provider(primary, payload, pair, deadline))
+        calls = {first: primary}
+        try:
+            delay = primary.hedge_delay_ms(pair) / 1000
+            await asyncio.wait({first}, timeout=min(delay, max(deadline - time.monotonic(), 0)))
+            if first.done() and first.result() is not None:
+                return first.result()
+            if deadline - time.monotonic() <= 0:
+                return None
+            
+            hedge = candidates[1]
+            self._hedge_counters["hedged"] += 1
+            calls[asyncio.create_task(self._call_provider(hedge, payload, pair, deadline))] = hedge
+            pending = {task for task in calls if not task.done()}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.result() is not None:
+                        if calls[task] is hedge:
+                            self._hedge_counters["hedge_wins"] += 1
+                        return task.result()
+            return None
+        finally:
+            for task in calls:
+                if not task.done():
+                    task.cancel()
+    
+    async def _call_provider(
+        self,
+        provider: TranslationProvider,
+        payload: dict,
+        pair: Pair,
+        deadline: float
+    ) -> Optional[dict]:
+        """
+        POST one request to one provider; returns the response body, or None
+        when it fails, runs past the deadline or the provider's breaker refuses it
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not provider.allow():
+            return None
+        
+        started = time.monotonic()
+        healthy: Optional[bool] = None
+        try:
+            client = provider.client()
+            provider.note_pool_request()
+            response = await client.post(
+                provider.api_url,
+                json=payload,
+                headers=provider.headers,
+                timeout=self._timeout(remaining),
+                extensions={"trace": provider.trace}
+            )
+            
+            # Client errors say nothing about the provider's health
+            healthy = response.status_code < 500 and response.status_code != 429
+            if response.status_code == 200:
+                return response.json()
+            return None
+        
+        except asyncio.CancelledError:
+            # Lost a hedge race: no verdict on the provider
+            healthy = None
+            raise
         except Exception:
-            # Fallback if request fails
-            return self._fallback_translate(text, source_language, target_language)
+            healthy = False
+            return None
+        finally:
+            provider.record(pair, started, healthy)
+    
+    async def _request_translation_batch(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> List[Optional[str]]:
+        """
+        Translate several texts of one language pair in a single call to the
+        fastest healthy provider
+        """
+        if len(texts) == 1:
+            return [await self._request_translation(texts[0], source_language, target_language)]
+        
+        pair = (source_language, target_language)
+        candidates = rank_providers(self.providers, pair)
+        if not candidates:
+            return [None] * len(texts)
+        
+        result = await self._call_provider(
+            candidates[0],
+            {"texts": texts, "source": source_language, "target": target_language},
+            pair,
+            self._default_deadline(),
+        )
+        translated = (result or {}).get("translated_texts") or []
+        if len(translated) == len(texts):
+            return translated
+        return [None] * len(texts)
     
     def _fallback_translate(self, text: str, source_language: str, target_language: str) -> str:
         """
@@ -0,0 +1,138 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.models.translation import Translation
+
+logger = logging.getLogger(__name__)
+
+
+class TranslationWriter:
+    """
+    Write-behind buffer for Translation rows. Records are queued without
+    touching the database and written in bulk (one multi-row INSERT per
+    batch) when `batch_size` rows are pending or `flush_ms` after the first
+    one arrived. One flush runs at a time; rows that arrive meanwhile go
+    into the next batch. At most `max_pending` rows are held: beyond that
+    new rows are dropped and counted.
+    """
+
+    def __init__(self, engine: AsyncEngine, flush_ms: float, batch_size: int, max_pending: int):
+        self._engine = engine
+        self.flush_interval = flush_ms / 1000.0
+        self.batch_size = max(1, batch_size)
+        self.max_pending = max(self.batch_size, max_pending)
+        self._pending: Deque[dict] = deque()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self.stats = {
+            "submitted": 0,
+            "written": 0,
+            "dropped": 0,
+            "failed": 0,
+            "flushes": 0,
+            "size_flushes": 0,
+            "timer_flushes": 0,
+            "max_rows_per_flush": 0,
+            "flush_ms_total": 0.0,
+            "flush_ms_max": 0.0,
+            "last_flush_ms": 0.0,
+        }
+
+    def submit(self, record: dict) -> bool:
+        """Queue one row (Translation column values); False if the buffer is full"""
+        if len(self._pending) >= self.max_pending:
+            self.stats["dropped"] += 1
+            return False
+        self._pending.append(record)
+        self.stats["submitted"] += 1
+
+        if len(self._pending) >= self.batch_size:
+            self.stats["size_flushes"] += 1
+            self._start_flush()
+        elif self._timer is None and not self._flushing:
+            self._timer = asyncio.get_running_loop().call_later(self.flush_interval, self._flush_on_timer)
+        return True
+
+    async def drain(self) -> None:
+        """Write everything still buffered (called on shutdown)"""
+        if self._pending:
+            self._start_flush()
+        if self._flusher is not None:
+            await asyncio.gather(self._flusher, return_exceptions=True)
+
+    def get_stats(self) -> dict:
+        stats = dict(self.stats)
+        stats["pending"] = len(self._pending)
+        stats["avg_rows_per_flush"] = round(stats["written"] / stats["flushes"], 2) if stats["flushes"] else 0.0
+        stats["flush_ms_avg"] = round(stats["flush_ms_total"] / stats["flushes"], 3) if stats["flushes"] else 0.0
+        stats["flush_ms_total"] = round(stats["flush_ms_total"], 3)
+        stats["flush_ms_max"] = round(stats["flush_ms_max"], 3)
+        stats["last_flush_ms"] = round(stats["last_flush_ms"], 3)
+        stats["batch_size"] = self.batch_size
+        stats["max_pending"] = self.max_pending
+        return stats
+
+    @property
+    def _flushing(self) -> bool:
+        return self._flusher is not None and not self._flusher.done()
+
+    def _flush_on_timer(self) -> None:
+        self._timer = None
+        self.stats["timer_flushes"] += 1
+        self._start_flush()
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # A running flush keeps going until the buffer is empty
+        if not self._flushing:
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while self._pending:
+            batch = [self._pending.popleft() for _ in range(min(self.batch_size, len(self._pending)))]
+            await self._write(batch)
+
+    async def _write(self, batch: List[dict]) -> None:
+        started = time.perf_counter()
+        try:
+            async with self._engine.begin() as conn:
+                await conn.execute(insert(Translation), batch)
+            written = len(batch)
+        except IntegrityError:
+            # One bad row (e.g. an unknown speaker) must not lose the rest of the batch
+            logger.warning("Translation batch rejected, retrying %d rows one by one", len(batch))
+            written = await self._write_rows(batch)
+        except (SQLAlchemyError, OSError):
+            logger.exception("Could not write %d translation rows", len(batch))
+            written = 0
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.stats["flushes"] += 1
+        self.stats["written"] += written
+        self.stats["failed"] += len(batch) - written
+        self.stats["max_rows_per_flush"] = max(self.stats["max_rows_per_flush"], written)
+        self.stats["flush_ms_total"] += elapsed_ms
+        self.stats["flush_ms_max"] = max(self.stats["flush_ms_max"], elapsed_ms)
+        self.stats["last_flush_ms"] = elapsed_ms
+
+    async def _write_rows(self, batch: List[dict]) -> int:
+        written = 0
+        for record in batch:
+            try:
+                async with self._engine.begin() as conn:
+                    await conn.execute(insert(Translation), [record])
+                written += 1
+            except IntegrityError:
+                pass
+            except (SQLAlchemyError, OSError):
+                logger.exception("Could not write translation row")
+        return written
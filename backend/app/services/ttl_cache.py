@@ -0,0 +1,102 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+import redis.asyncio as aioredis
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """
+    Bounded in-process LRU whose entries each carry their own expiry.
+    Thread-safe: the same instance is used from the event loop and from
+    threadpool endpoints.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value, ttl_seconds: float) -> int:
+        """Store value; returns how many entries were evicted"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+            self.evictions += evicted
+            return evicted
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisTier:
+    """
+    Lazily connected Redis client for the shared tier behind a TTLCache.
+    After an error it is skipped for RETRY_SECONDS instead of paying the
+    timeout on every lookup.
+    """
+
+    RETRY_SECONDS = 30.0
+
+    def __init__(self, name: str, url: Optional[str], timeout: float, decode_responses: bool = False):
+        self.name = name
+        self.url = url
+        self.timeout = timeout
+        self.decode_responses = decode_responses
+        self.errors = 0
+        self._client: Optional[aioredis.Redis] = None
+        self._retry_at = 0.0
+
+    def client(self) -> Optional[aioredis.Redis]:
+        """The client, or None while Redis is not configured or backing off"""
+        if not self.url or time.monotonic() < self._retry_at:
+            return None
+        if self._client is None:
+            self._client = aioredis.from_url(
+                self.url,
+                decode_responses=self.decode_responses,
+                socket_timeout=self.timeout,
+                socket_connect_timeout=self.timeout,
+            )
+        return self._client
+
+    def failed(self, exc: Exception) -> None:
+        self.errors += 1
+        self._retry_at = time.monotonic() + self.RETRY_SECONDS
+        logger.warning("%s Redis error, using local tier only: %s", self.name, exc)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,152 @@
+"""
+Realtime pipeline tasks: speech-to-text of audio chunks, then translation
+per language pair. Results are published to the conference's backplane
+channel, where every gateway node with listeners in the room delivers them.
+"""
+import asyncio
+import base64
+import json
+import logging
+import os
+import socket
+from typing import List, Optional
+
+import redis
+from celery.signals import worker_process_init, worker_process_shutdown
+
+from app.celery_app import TRANSCRIBE_TASK, TRANSLATE_TASK, celery_app, idempotency_key, text_queue
+from app.core.config import settings
+from app.services.room_backplane import RedisBackplane
+from app.services.speech_to_text import speech_to_text
+from app.services.translation_service import translation_service
+
+logger = logging.getLogger(__name__)
+
+RUNNING, DONE = "running", "done"
+
+# Per worker process (prefork children must not share the parent's loop or sockets)
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_redis: Optional[redis.Redis] = None
+
+
+@worker_process_init.connect
+def _reset_process_state(**kwargs) -> None:
+    global _loop, _redis
+    _loop, _redis = None, None
+
+
+@worker_process_shutdown.connect
+def _close_process_state(**kwargs) -> None:
+    if _loop is not None:
+        _run(translation_service.shutdown())
+        _run(speech_to_text.close())
+        _loop.close()
+    if _redis is not None:
+        _redis.close()
+
+
+def _run(coro):
+    """Run a coroutine on the process's long-lived loop, so provider clients keep their pools"""
+    global _loop
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+    return _loop.run_until_complete(coro)
+
+
+def _client() -> redis.Redis:
+    global _redis
+    if _redis is None:
+        _redis = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis
+
+
+def _begin(task, key: str) -> bool:
+    """
+    Claim a chunk stage for this delivery. False if it was already processed;
+    retries later while another delivery holds the claim.
+    """
+    client = _client()
+    lease_ms = int(settings.PIPELINE_TASK_TIME_LIMIT_SECONDS * 1000)
+    if client.set(key, RUNNING, nx=True, px=lease_ms):
+        return True
+    if client.get(key) == DONE:
+        return False
+    # Still running elsewhere, or its worker died holding the claim: look again once it lapses
+    raise task.retry(countdown=max(client.pttl(key), 100) / 1000)
+
+
+def _finish(key: str) -> None:
+    _client().set(key, DONE, ex=settings.PIPELINE_IDEMPOTENCY_TTL_SECONDS)
+
+
+def _abandon(key: str) -> None:
+    _client().delete(key)
+
+
+def _publish(conference_code: str, data: dict) -> None:
+    origin = f"pipeline:{socket.gethostname()}:{os.getpid()}"
+    _client().publish(
+        f"{RedisBackplane.CHANNEL_PREFIX}{conference_code}",
+        json.dumps({"origin": origin, **data}, ensure_ascii=False),
+    )
+
+
+@celery_app.task(bind=True, name=TRANSCRIBE_TASK, max_retries=3)
+def transcribe_chunk(self, message: dict, audio: str, languages: List[str], record_on: Optional[str] = None) -> None:
+    """
+    Transcribe one audio chunk, publish the transcript for listeners of the
+    spoken language and fan out one translation task per other language.
+    """
+    key = idempotency_key(message["conference_code"], message["chunk_id"], "stt")
+    if not _begin(self, key):
+        return
+    try:
+        source = message["source_language"]
+        text = _run(speech_to_text.transcribe(base64.b64decode(audio), source))
+        if text is None:
+            raise self.retry(countdown=0.2)
+        text = text.strip()
+        if text:
+            message = {**message, "text": text}
+            targets = [language for language in languages if language != source]
+            # Published before the fan-out so gateways know which languages are still coming
+            _publish(message["conference_code"], {
+                "record_on": record_on,
+                "message": message,
+                "translations": {source: text} if source in languages else {},
+                "pending": targets,
+            })
+            for target in targets:
+                translate_segment.apply_async(
+                    (message, target, record_on),
+                    queue=text_queue(source, target),
+                    expires=settings.PIPELINE_TASK_EXPIRES_SECONDS,
+                )
+        _finish(key)
+    except Exception:
+        _abandon(key)
+        raise
+
+
+@celery_app.task(bind=True, name=TRANSLATE_TASK, max_retries=3)
+def translate_segment(self, message: dict, target_language: str, record_on: Optional[str] = None) -> None:
+    """Translate one transcript into one language and publish it to the room"""
+    key = idempotency_key(message["conference_code"], message["chunk_id"], target_language)
+    if not _begin(self, key):
+        return
+    try:
+        translated = _run(translation_service.translate_text(
+            message["text"], message["source_language"], target_language
+        ))
+        # Published before the claim is marked done: a worker dying in between
+        # republishes, which beats losing the line
+        _publish(message["conference_code"], {
+            "pipeline": True,
+            "record_on": record_on,
+            "message": message,
+            "translations": {target_language: translated if translated is not None else message["text"]},
+        })
+        _finish(key)
+    except Exception:
+        _abandon(key)
+        raise
@@ -59,9 +59,25 @@ CREATE TABLE conference_participants (
     UNIQUE(conference_id, guest_name)
 );
 
+-- Text search config per language code (used by the generated tsvector columns below)
+CREATE OR REPLACE FUNCTION translation_ts_config(language text) RETURNS regconfig
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT (CASE split_part(lower(language), '-', 1)
+        WHEN 'ar' THEN 'arabic' WHEN 'ca' THEN 'catalan' WHEN 'da' THEN 'danish' WHEN 'de' THEN 'german'
+        WHEN 'el' THEN 'greek' WHEN 'en' THEN 'english' WHEN 'es' THEN 'spanish' WHEN 'eu' THEN 'basque'
+        WHEN 'fi' THEN 'finnish' WHEN 'fr' THEN 'french' WHEN 'ga' THEN 'irish' WHEN 'hi' THEN 'hindi'
+        WHEN 'hu' THEN 'hungarian' WHEN 'hy' THEN 'armenian' WHEN 'id' THEN 'indonesian' WHEN 'it' THEN 'italian'
+        WHEN 'lt' THEN 'lithuanian' WHEN 'nb' THEN 'norwegian' WHEN 'ne' THEN 'nepali' WHEN 'nl' THEN 'dutch'
+        WHEN 'no' THEN 'norwegian' WHEN 'pt' THEN 'portuguese' WHEN 'ro' THEN 'romanian' WHEN 'ru' THEN 'russian'
+        WHEN 'sr' THEN 'serbian' WHEN 'sv' THEN 'swedish' WHEN 'ta' THEN 'tamil' WHEN 'tr' THEN 'turkish'
+        WHEN 'yi' THEN 'yiddish' ELSE 'simple' END)::regconfig
+$$;
+
 -- Create translations table for live voice translation
+-- Range-partitioned by month on created_at; the backend creates the monthly partitions
+-- and drops expired ones, rows outside them land in translations_default
 CREATE TABLE translations (
-    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    id UUID DEFAULT gen_random_uuid(),
     conference_id UUID REFERENCES conferences(id) ON DELETE CASCADE,
     speaker_id UUID REFERENCES conference_participants(id) ON DELETE CASCADE,
     original_text TEXT NOT NULL,
@@ -69,8 +85,12 @@ CREATE TABLE translations (
     language_from VARCHAR(10) NOT NULL,
     language_to VARCHAR(10) NOT NULL,
     translation_status VARCHAR(20) DEFAULT 'pending', -- pending, processing, completed, failed
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-);
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    original_tsv TSVECTOR GENERATED ALWAYS AS (to_tsvector(translation_ts_config(language_from), original_text)) STORED,
+    translated_tsv TSVECTOR GENERATED ALWAYS AS (to_tsvector(translation_ts_config(language_to), translated_text)) STORED,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+CREATE TABLE translations_default PARTITION OF translations DEFAULT;
 
 -- Create conference_settings table for additional configuration
 CREATE TABLE conference_settings (
@@ -91,6 +111,8 @@ CREATE INDEX idx_conference_participants_conference_id ON conference_participant
 CREATE INDEX idx_conference_participants_user_id ON conference_participants(user_id);
 CREATE INDEX idx_translations_conference_id ON translations(conference_id);
 CREATE INDEX idx_translations_speaker_id ON translations(speaker_id);
+CREATE INDEX idx_translations_original_tsv ON translations USING gin (original_tsv);
+CREATE INDEX idx_translations_translated_tsv ON translations USING gin (translated_tsv);
 
 -- Create trigger to update updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
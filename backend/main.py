@@ -2,7 +2,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.database import engine
 from app.core.config import settings
+from app.core.security import shutdown_password_hashing
 from app.api.v1.api import api_router
+from app.services.realtime_service import room_manager
+from app.services.translation_service import translation_service
+from app.services.conference_cache import conference_cache
+from app.services.translation_partitions import translation_partitions
 from app.models import User, Conference, ConferenceParticipant, Translation, ConferenceSettings
 
 # Create tables
@@ -29,6 +34,21 @@ app.add_middleware(
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+@app.on_event("startup")
+async def startup():
+    await translation_service.startup()
+    await room_manager.startup()
+    if settings.TRANSLATION_PARTITIONS_ENABLED:
+        await translation_partitions.startup()
+
+@app.on_event("shutdown")
+async def shutdown():
+    await translation_partitions.shutdown()
+    await room_manager.shutdown()
+    await translation_service.shutdown()
+    await conference_cache.close()
+    shutdown_password_hashing()
+
 @app.get("/")
 async def root():
     return {"message": "Live Voice Translator API"}
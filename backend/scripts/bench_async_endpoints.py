@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Load test: sync (threadpool) vs async (asyncpg) conference endpoints.
+
+Seeds a host with a few conferences, then drives two in-process ASGI apps
+with the same concurrent load through httpx:
+  - sync:  the previous `def` handlers on SessionLocal (run in the threadpool)
+  - async: the current endpoints in app/api/v1/endpoints/conferences.py
+and prints requests/sec and latency percentiles for join-by-code and the
+host's conference list.
+
+Requires DATABASE_URL to point at a migrated database.
+
+Usage:
+    python scripts/bench_async_endpoints.py [--concurrency 100] [--requests 5000]
+"""
+
+import argparse
+import asyncio
+import sys
+import os
+import uuid
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import Depends, FastAPI, Query
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_current_active_user
+from app.api.v1.endpoints import conferences
+from app.core.config import settings
+from app.core.database import SessionLocal, get_db
+from app.core.security import create_access_token
+from app.models import Conference, ConferenceParticipant, User
+from app.models.conference import ConferenceStatus
+from app.schemas.conference import Conference as ConferenceSchema, ConferenceList
+from app.services.conference_service import ConferenceService
+from bench_harness import cleanup, dispose_engines, drive, new_user
+
+
+def build_sync_app() -> FastAPI:
+    """The endpoints as they were before the async engine (sync def handlers)"""
+    app = FastAPI()
+
+    @app.get("/conferences/code/{conference_code}", response_model=ConferenceSchema)
+    def get_conference_by_code(conference_code: str, db: Session = Depends(get_db)):
+        return ConferenceService.get_conference_by_code(db=db, conference_code=conference_code)
+
+    @app.get("/conferences/", response_model=ConferenceList)
+    def get_my_conferences(
+        skip: int = Query(0, ge=0),
+        limit: int = Query(100, ge=1, le=100),
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_active_user),
+    ):
+        return ConferenceService.get_conferences_with_participant_count(
+            db=db, user_id=current_user.id, skip=skip, limit=limit
+        )
+
+    return app
+
+
+def build_async_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(conferences.router, prefix="/conferences")
+    return app
+
+
+def seed(conference_count: int):
+    db = SessionLocal()
+    try:
+        host = new_user(uuid.uuid4().hex[:8], full_name="Bench Host")
+        db.add(host)
+        db.flush()
+        codes = []
+        for index in range(conference_count):
+            conference = Conference(
+                conference_code=ConferenceService.generate_conference_code(),
+                title=f"Bench conference {index}",
+                host_id=host.id,
+                status=ConferenceStatus.PENDING,
+            )
+            db.add(conference)
+            db.flush()
+            db.add(ConferenceParticipant(conference_id=conference.id, guest_name="Host", is_host=True))
+            codes.append(conference.conference_code)
+        db.commit()
+        return host.id, codes
+    finally:
+        db.close()
+
+
+async def main(args):
+    host_id, codes = seed(args.conferences)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(host_id)})}"}
+    scenarios = {
+        "join-by-code": [f"/conferences/code/{code}" for code in codes],
+        "list": ["/conferences/?limit=20"],
+    }
+    try:
+        print(f"concurrency={args.concurrency} requests={args.requests} conferences={args.conferences}")
+        print(f"{'endpoint':<14} {'mode':<6} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}")
+        for name, paths in scenarios.items():
+            for mode, app in (("sync", build_sync_app()), ("async", build_async_app())):
+                result = await drive(
+                    app,
+                    lambda client, index: client.get(paths[index % len(paths)], headers=headers),
+                    args.concurrency,
+                    args.requests,
+                )
+                print(
+                    f"{name:<14} {mode:<6} {result['rps']:>9.1f} {result['p50']:>9.1f} "
+                    f"{result['p99']:>9.1f} {result['errors']:>7}"
+                )
+    finally:
+        cleanup([host_id])
+        await dispose_engines()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--conferences", type=int, default=20)
+    print(f"database: {settings.DATABASE_URL.rsplit('@', 1)[-1]}")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Load test: authentication cost on GET /auth/me and GET /conferences/.
+
+Drives the real routers in-process through httpx as one signed-in host
+(plus a few other users so the caches hold more than one entry) in
+three modes:
+  - legacy:   the previous dependencies (verify_token + load the User
+              row on every request)
+  - uncached: the current dependencies with the auth cache disabled
+  - cached:   claims cached per token and principals per user, so the
+              conference list skips the user lookup entirely
+Reports requests/sec, latency percentiles and SQL statements per request.
+
+Requires DATABASE_URL to point at a migrated database.
+
+Usage:
+    python scripts/bench_auth.py [--concurrency 50] [--requests 3000] [--users 20]
+"""
+
+import argparse
+import asyncio
+import sys
+import os
+import uuid
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.api.v1.endpoints import auth, conferences
+from app.core.database import SessionLocal, get_async_db, get_db
+from app.core.security import create_access_token, verify_token
+from app.models import User
+from app.services.auth_cache import auth_cache
+from bench_harness import StatementCounter, cleanup, dispose_engines, drive, new_user
+
+
+def legacy_user(
+    credentials: HTTPAuthorizationCredentials = Depends(deps.security),
+    db: Session = Depends(get_db),
+):
+    """get_current_active_user as it was: decode and query on every request"""
+    payload = verify_token(credentials.credentials)
+    if payload is None or payload.get("sub") is None:
+        raise HTTPException(status_code=401)
+    user = db.query(User).filter(User.id == payload["sub"]).first()
+    if user is None or not user.is_active:
+        raise HTTPException(status_code=401)
+    return user
+
+
+async def legacy_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(deps.security),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """The async user dependency as it was: decode and load the User row on every request"""
+    payload = verify_token(credentials.credentials)
+    if payload is None or payload.get("sub") is None:
+        raise HTTPException(status_code=401)
+    user = await db.get(User, uuid.UUID(payload["sub"]))
+    if user is None or not user.is_active:
+        raise HTTPException(status_code=401)
+    return user
+
+
+def build_app(legacy: bool) -> FastAPI:
+    app = FastAPI()
+    app.include_router(auth.router, prefix="/auth")
+    app.include_router(conferences.router, prefix="/conferences")
+    if legacy:
+        app.dependency_overrides[deps.get_current_active_user] = legacy_user
+        app.dependency_overrides[deps.get_current_active_principal] = legacy_user_async
+    return app
+
+
+def seed(users: int):
+    db = SessionLocal()
+    try:
+        suffix = uuid.uuid4().hex[:8]
+        rows = [new_user(suffix, index) for index in range(users)]
+        db.add_all(rows)
+        db.commit()
+        return [row.id for row in rows]
+    finally:
+        db.close()
+
+
+async def main(args):
+    user_ids = seed(args.users)
+    headers = [{"Authorization": f"Bearer {create_access_token({'sub': str(user_id)})}"} for user_id in user_ids]
+
+    try:
+        with StatementCounter() as statements:
+            print(f"concurrency={args.concurrency} requests={args.requests} users={args.users}")
+            print(f"{'endpoint':<16} {'mode':<9} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'stmts/req':>10} {'errors':>7}")
+            for path in ("/auth/me", "/conferences/?limit=20"):
+                for mode, legacy, enabled in (("legacy", True, False), ("uncached", False, False), ("cached", False, True)):
+                    auth_cache.enabled = enabled
+                    auth_cache.clear()
+                    statements.count = 0
+                    result = await drive(
+                        build_app(legacy),
+                        lambda client, index: client.get(path, headers=headers[index % len(headers)]),
+                        args.concurrency,
+                        args.requests,
+                    )
+                    print(
+                        f"{path.split('?')[0]:<16} {mode:<9} {result['rps']:>9.1f} {result['p50']:>9.1f} "
+                        f"{result['p99']:>9.1f} {statements.count / args.requests:>10.3f} {result['errors']:>7}"
+                    )
+        print(auth_cache.get_stats())
+    finally:
+        cleanup(user_ids)
+        await dispose_engines()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--users", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
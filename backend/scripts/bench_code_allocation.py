@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Benchmark: conference code allocation at a high fill ratio of the code space.
+
+The real space (26^10 codes) cannot be filled in a test database, so the
+generator is narrowed to a 26^3 slice (`<run>-bnch-xxx`, 17576 codes) that
+is pre-filled to each --fill ratio before timing --creates conferences
+with:
+  - blind:        random code + INSERT, a collision is a failed create (the
+                  previous behaviour: unique violation, HTTP 500)
+  - select-check: SELECT the code until a free one is found, then INSERT
+                  (one extra round trip per attempt, still racy)
+  - insert-retry: ConferenceService._insert_with_unique_code
+                  (INSERT ... ON CONFLICT (conference_code) DO NOTHING, retry)
+Each (mode, fill) pair gets its own slice. Reports creates/s, failed
+creates, code attempts and SQL statements per create.
+
+Requires DATABASE_URL to point at a migrated database.
+
+Usage:
+    python scripts/bench_code_allocation.py [--fill 0 0.5 0.9] [--creates 200]
+"""
+
+import argparse
+import itertools
+import random
+import string
+import sys
+import os
+import time
+import uuid
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.exc import IntegrityError
+
+from app.core.database import SessionLocal, engine
+from app.models import Conference, User
+from app.models.conference import ConferenceStatus, ConferenceType
+from app.services import conference_service
+from app.services.conference_service import ConferenceService
+
+SLICE = [''.join(letters) for letters in itertools.product(string.ascii_lowercase, repeat=3)]
+# One fresh slice per run, drawn at random so reruns do not share codes
+prefixes = iter(random.sample(SLICE, len(SLICE)))
+
+
+def conference_values(host_id):
+    return {
+        "title": "Bench conference",
+        "host_id": host_id,
+        "status": ConferenceStatus.PENDING,
+        "type": ConferenceType.SCHEDULED,
+    }
+
+
+def blind(db, host_id, generate):
+    db.add(Conference(conference_code=generate(), **conference_values(host_id)))
+    db.flush()
+
+
+def select_check(db, host_id, generate):
+    while True:
+        code = generate()
+        if db.scalar(select(Conference.id).where(Conference.conference_code == code)) is None:
+            break
+    db.add(Conference(conference_code=code, **conference_values(host_id)))
+    db.flush()
+
+
+def insert_retry(db, host_id, generate):
+    ConferenceService._insert_with_unique_code(db, **conference_values(host_id))
+
+
+def prefill(host_id, prefix, fill):
+    taken = random.sample(SLICE, int(len(SLICE) * fill))
+    db = SessionLocal()
+    try:
+        if taken:
+            db.execute(insert(Conference), [
+                {"id": uuid.uuid4(), "conference_code": f"{prefix}-bnch-{suffix}", **conference_values(host_id)}
+                for suffix in taken
+            ])
+        db.commit()
+    finally:
+        db.close()
+
+
+def run(mode, host_id, fill, creates):
+    prefix = next(prefixes)
+    prefill(host_id, prefix, fill)
+    attempts = [0]
+
+    def generate():
+        attempts[0] += 1
+        return f"{prefix}-bnch-{random.choice(SLICE)}"
+
+    # insert-retry draws its codes through the service
+    original = ConferenceService.generate_conference_code
+    ConferenceService.generate_conference_code = staticmethod(generate)
+    statements = [0]
+    counter = lambda *args: statements.__setitem__(0, statements[0] + 1)
+    event.listen(engine, "before_cursor_execute", counter)
+    failed = 0
+    try:
+        started = time.perf_counter()
+        for _ in range(creates):
+            db = SessionLocal()
+            try:
+                mode(db, host_id, generate)
+                db.commit()
+            except (IntegrityError, RuntimeError):
+                db.rollback()
+                failed += 1
+            finally:
+                db.close()
+        elapsed = time.perf_counter() - started
+    finally:
+        event.remove(engine, "before_cursor_execute", counter)
+        ConferenceService.generate_conference_code = original
+    return {
+        "rps": creates / elapsed,
+        "failed": failed,
+        "attempts": attempts[0] / creates,
+        "statements": statements[0] / creates,
+    }
+
+
+def main(args):
+    # Let insert-retry keep trying at extreme fill ratios instead of giving up after a few codes
+    conference_service.CODE_ALLOCATION_ATTEMPTS = args.max_attempts
+    db = SessionLocal()
+    try:
+        suffix = uuid.uuid4().hex[:8]
+        host = User(
+            email=f"bench_{suffix}@bench.local",
+            username=f"bench_{suffix}",
+            full_name="Bench Host",
+            hashed_password="",
+            is_active=True,
+        )
+        db.add(host)
+        db.commit()
+        host_id = host.id
+    finally:
+        db.close()
+
+    try:
+        print(f"code slice={len(SLICE)} creates={args.creates} max_attempts={args.max_attempts}")
+        print(f"{'fill':>5} {'mode':<13} {'creates/s':>10} {'failed':>7} {'attempts':>9} {'stmts':>6}")
+        for fill in args.fill:
+            for name, mode in (("blind", blind), ("select-check", select_check), ("insert-retry", insert_retry)):
+                result = run(mode, host_id, fill, args.creates)
+                print(
+                    f"{fill:>5.2f} {name:<13} {result['rps']:>10.1f} {result['failed']:>7} "
+                    f"{result['attempts']:>9.2f} {result['statements']:>6.2f}"
+                )
+    finally:
+        db = SessionLocal()
+        try:
+            db.query(Conference).filter(Conference.host_id == host_id).delete(synchronize_session=False)
+            db.query(User).filter(User.id == host_id).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fill", type=float, nargs="+", default=[0.0, 0.5, 0.9])
+    parser.add_argument("--creates", type=int, default=200)
+    parser.add_argument("--max-attempts", type=int, default=1000)
+    main(parser.parse_args())
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Benchmark: host conference list, N+1 counting vs one aggregate query,
+and offset vs keyset (cursor) pages.
+
+Seeds one host with thousands of conferences (a few participants each,
+some of whom have left) and times a page of the host's conference list:
+  - n+1:       the previous implementation, one COUNT per conference
+  - aggregate: ConferenceService.get_conferences_with_participant_count
+               with skip (page picked first, count(*) over() for the total)
+  - cursor:    the same query continuing from next_cursor (keyset on
+               created_at, id) instead of skipping rows
+Reports milliseconds and SQL statements per page.
+
+Requires DATABASE_URL to point at a migrated database.
+
+Usage:
+    python scripts/bench_conference_list.py [--conferences 5000] [--limit 100]
+"""
+
+import argparse
+import statistics
+import sys
+import os
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, insert
+
+from app.core.database import SessionLocal, engine
+from app.models import Conference, ConferenceParticipant, User
+from app.models.conference import ConferenceStatus, ConferenceType
+from app.services.conference_service import ConferenceService
+
+
+def legacy_list(db, user_id, skip, limit):
+    """The list as it was: one COUNT per conference, ORM state copied via __dict__"""
+    conferences = db.query(Conference).filter(
+        Conference.host_id == user_id
+    ).offset(skip).limit(limit).all()
+    result = []
+    for conference in conferences:
+        participant_count = db.query(ConferenceParticipant).filter(
+            ConferenceParticipant.conference_id == conference.id,
+            ConferenceParticipant.left_at.is_(None)
+        ).count()
+        result.append({**conference.__dict__, 'participant_count': participant_count})
+    return result
+
+
+def seed(conference_count: int, participants: int):
+    db = SessionLocal()
+    try:
+        suffix = uuid.uuid4().hex[:8]
+        host = User(
+            email=f"bench_{suffix}@bench.local",
+            username=f"bench_{suffix}",
+            full_name="Bench Host",
+            hashed_password="",
+            is_active=True,
+        )
+        db.add(host)
+        db.flush()
+
+        now = datetime.now(timezone.utc)
+        conference_rows, participant_rows = [], []
+        for index in range(conference_count):
+            conference_id = uuid.uuid4()
+            conference_rows.append({
+                "id": conference_id,
+                "conference_code": f"b{suffix[:2]}-{index:07d}-{suffix[2:5]}",
+                "title": f"Bench conference {index}",
+                "host_id": host.id,
+                "status": ConferenceStatus.ENDED,
+                "type": ConferenceType.SCHEDULED,
+                "is_active": True,
+                "max_participants": 50,
+                "language_from": "en",
+                "language_to": "vi",
+                "created_at": now - timedelta(minutes=index),
+            })
+            for seat in range(participants):
+                participant_rows.append({
+                    "id": uuid.uuid4(),
+                    "conference_id": conference_id,
+                    "guest_name": f"Guest {seat}",
+                    "is_host": seat == 0,
+                    "left_at": now if seat % 3 == 2 else None,
+                })
+        db.execute(insert(Conference), conference_rows)
+        db.execute(insert(ConferenceParticipant), participant_rows)
+        db.commit()
+        return host.id
+    finally:
+        db.close()
+
+
+def cleanup(host_id):
+    db = SessionLocal()
+    try:
+        conference_ids = db.query(Conference.id).filter(Conference.host_id == host_id).scalar_subquery()
+        db.query(ConferenceParticipant).filter(
+            ConferenceParticipant.conference_id.in_(conference_ids)
+        ).delete(synchronize_session=False)
+        db.query(Conference).filter(Conference.host_id == host_id).delete(synchronize_session=False)
+        db.query(User).filter(User.id == host_id).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def cursor_before(host_id, skip):
+    """next_cursor a client would hold when asking for the page at `skip`"""
+    if not skip:
+        return None
+    db = SessionLocal()
+    try:
+        previous = db.query(Conference).filter(Conference.host_id == host_id).order_by(
+            Conference.created_at.desc(), Conference.id.desc()
+        ).offset(skip - 1).first()
+        return ConferenceService.encode_cursor(previous)
+    finally:
+        db.close()
+
+
+def measure(fn, host_id, skip, limit, rounds):
+    statements = []
+    listener = lambda *args: statements.append(1)
+    event.listen(engine, "before_cursor_execute", listener)
+    timings = []
+    try:
+        for _ in range(rounds):
+            db = SessionLocal()
+            try:
+                statements.clear()
+                started = time.perf_counter()
+                fn(db, host_id, skip, limit)
+                timings.append((time.perf_counter() - started) * 1000)
+            finally:
+                db.close()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return statistics.median(timings), len(statements)
+
+
+def main(args):
+    print(f"seeding {args.conferences} conferences x {args.participants} participants...")
+    host_id = seed(args.conferences, args.participants)
+    try:
+        print(f"{'page':<12} {'mode':<10} {'p50 ms':>9} {'queries':>8}")
+        last_page = max(args.conferences - args.limit, 0)
+        for label, skip in (("first", 0), ("middle", last_page // 2), ("last", last_page)):
+            cursor = cursor_before(host_id, skip)
+            keyset = lambda db, user_id, _skip, limit: ConferenceService.get_conferences_with_participant_count(
+                db, user_id, limit=limit, cursor=cursor
+            )
+            for mode, fn in (
+                ("n+1", legacy_list),
+                ("aggregate", ConferenceService.get_conferences_with_participant_count),
+                ("cursor", keyset),
+            ):
+                p50, queries = measure(fn, host_id, skip, args.limit, args.rounds)
+                print(f"{label:<12} {mode:<10} {p50:>9.1f} {queries:>8}")
+    finally:
+        cleanup(host_id)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--conferences", type=int, default=5000)
+    parser.add_argument("--participants", type=int, default=3)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=20)
+    main(parser.parse_args())
@@ -0,0 +1,131 @@
+"""
+Shared harness for the in-process HTTP load tests (bench_auth, bench_signin,
+bench_join_cache, bench_async_endpoints): seeding and removing bench users,
+driving an ASGI app with concurrent httpx clients, counting SQL statements.
+
+Imported by the scripts after they put the backend directory on sys.path.
+"""
+
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, Iterable, Optional
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import event
+
+from app.core.database import SessionLocal, async_engine, engine
+from app.models import Conference, ConferenceParticipant, User
+
+
+def new_user(suffix: str, index=None, full_name: str = "Bench User", hashed_password: str = "") -> User:
+    """An unsaved bench user; suffix keeps concurrent or leftover runs apart"""
+    name = f"bench_{suffix}" if index is None else f"bench_{suffix}_{index}"
+    return User(
+        email=f"{name}@example.com",
+        username=name,
+        full_name=full_name,
+        hashed_password=hashed_password,
+        is_active=True,
+    )
+
+
+def cleanup(user_ids) -> None:
+    """Delete the bench users with their conferences and participants"""
+    db = SessionLocal()
+    try:
+        conference_ids = db.query(Conference.id).filter(Conference.host_id.in_(user_ids))
+        db.query(ConferenceParticipant).filter(
+            ConferenceParticipant.conference_id.in_(conference_ids.scalar_subquery())
+        ).delete(synchronize_session=False)
+        db.query(Conference).filter(Conference.host_id.in_(user_ids)).delete(synchronize_session=False)
+        db.query(User).filter(User.id.in_(user_ids)).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+async def dispose_engines() -> None:
+    await async_engine.dispose()
+    engine.dispose()
+
+
+class StatementCounter:
+    """Counts SQL statements executed on the given engines while entered"""
+
+    def __init__(self, *targets):
+        self.targets = targets or (engine, async_engine.sync_engine)
+        self.count = 0
+
+    def _count(self, *args) -> None:
+        self.count += 1
+
+    def __enter__(self) -> "StatementCounter":
+        for target in self.targets:
+            event.listen(target, "before_cursor_execute", self._count)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        for target in self.targets:
+            event.remove(target, "before_cursor_execute", self._count)
+
+
+def percentile(values, fraction: float) -> float:
+    """Percentile of latencies in seconds, in milliseconds"""
+    values = sorted(values)
+    return values[max(int(len(values) * fraction) - 1, 0)] * 1000
+
+
+async def drive(
+    app: FastAPI,
+    send: Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]],
+    concurrency: int,
+    total: int,
+    ok: Iterable[int] = (200,),
+    prepare: Optional[Callable[[int], Awaitable[None]]] = None,
+    background: Optional[Callable[[httpx.AsyncClient, asyncio.Event], Awaitable[None]]] = None,
+) -> dict:
+    """
+    Issue total requests against app from concurrency workers. send(client, index)
+    makes request number index; prepare(index) runs before it, outside the timing;
+    background(client, done) runs alongside until every request has answered.
+    Responses outside ok and exceptions (e.g. pool checkout timeouts under
+    threadpool starvation) count as errors.
+    """
+    ok = frozenset(ok)
+    latencies = []
+    errors = 0
+    counter = iter(range(total))
+    done = asyncio.Event()
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def worker():
+            nonlocal errors
+            for index in counter:
+                if prepare is not None:
+                    await prepare(index)
+                started = time.perf_counter()
+                try:
+                    response = await send(client, index)
+                    failed = response.status_code not in ok
+                except Exception:
+                    failed = True
+                latencies.append(time.perf_counter() - started)
+                errors += failed
+
+        background_task = asyncio.create_task(background(client, done)) if background is not None else None
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        if background_task is not None:
+            await background_task
+
+    return {
+        "rps": total / elapsed,
+        "p50": statistics.median(latencies) * 1000,
+        "p99": percentile(latencies, 0.99),
+        "errors": errors,
+    }
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Load test: the public join-by-code endpoint with and without the snapshot cache.
+
+Models the burst when a conference starts: every attendee opens the same
+code at once (plus a tail of other codes). Drives the real conference
+router in-process through httpx with the cache disabled, then enabled,
+then enabled with the host pausing/resuming every --churn requests (each
+transition invalidates the entry). Reports requests/sec, latency
+percentiles and SQL statements per request.
+
+Requires DATABASE_URL to point at a migrated database.
+
+Usage:
+    python scripts/bench_join_cache.py [--concurrency 100] [--requests 5000] [--churn 500]
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import os
+import uuid
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI
+
+from app.api.v1.endpoints import conferences
+from app.core.database import AsyncSessionLocal, SessionLocal, async_engine
+from app.models import Conference
+from app.models.conference import ConferenceStatus
+from app.services.conference_cache import conference_cache
+from app.services.conference_service import ConferenceService
+from bench_harness import StatementCounter, cleanup, dispose_engines, drive, new_user
+
+
+def seed(conference_count: int):
+    db = SessionLocal()
+    try:
+        suffix = uuid.uuid4().hex[:8]
+        hosts, codes = [], []
+        for index in range(conference_count):
+            # One host per conference: each may have a live conference of its own
+            host = new_user(suffix, index, full_name="Bench Host")
+            db.add(host)
+            db.flush()
+            conference = Conference(
+                conference_code=ConferenceService.generate_conference_code(),
+                title=f"Bench conference {index}",
+                host_id=host.id,
+                status=ConferenceStatus.STARTED,
+            )
+            db.add(conference)
+            db.flush()
+            hosts.append(host.id)
+            codes.append((conference.id, conference.conference_code))
+        db.commit()
+        return hosts, codes
+    finally:
+        db.close()
+
+
+class HostChurn:
+    """Pauses or resumes the hot conference every `every` requests, the way the host's endpoint does"""
+
+    def __init__(self, conference_id, host_id, every: int):
+        self.conference_id = conference_id
+        self.host_id = host_id
+        self.every = every
+        self.paused = False
+        self._toggling = asyncio.Lock()
+
+    async def __call__(self, index: int) -> None:
+        if self.every and index and index % self.every == 0:
+            async with self._toggling:
+                await self.toggle()
+
+    async def toggle(self) -> None:
+        async with AsyncSessionLocal() as db:
+            if self.paused:
+                await ConferenceService.resume_conference_async(db, self.conference_id, self.host_id)
+            else:
+                await ConferenceService.pause_conference_async(db, self.conference_id, self.host_id)
+        self.paused = not self.paused
+
+
+async def main(args):
+    host_ids, conferences_seeded = seed(args.conferences)
+    hot_id, hot_code = conferences_seeded[0]
+    # Nine in ten requests hit the conference that just started
+    paths = [
+        f"/conferences/code/{hot_code if random.random() < 0.9 else random.choice(conferences_seeded)[1]}"
+        for _ in range(1000)
+    ]
+    app = FastAPI()
+    app.include_router(conferences.router, prefix="/conferences")
+
+    try:
+        with StatementCounter(async_engine.sync_engine) as statements:
+            print(f"concurrency={args.concurrency} requests={args.requests} conferences={args.conferences}")
+            print(f"{'mode':<14} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'stmts/req':>10} {'errors':>7}")
+            for mode, enabled, churn in (
+                ("uncached", False, 0),
+                ("cached", True, 0),
+                ("cached+churn", True, args.churn),
+            ):
+                conference_cache.enabled = enabled
+                conference_cache._local.clear()
+                statements.count = 0
+                host = HostChurn(hot_id, host_ids[0], churn)
+                result = await drive(
+                    app,
+                    lambda client, index: client.get(paths[index % len(paths)]),
+                    args.concurrency,
+                    args.requests,
+                    # A paused conference answers 400 PAUSED by design
+                    ok=(200, 400),
+                    prepare=host,
+                )
+                if host.paused:
+                    await host.toggle()
+                print(
+                    f"{mode:<14} {result['rps']:>9.1f} {result['p50']:>9.1f} {result['p99']:>9.1f} "
+                    f"{statements.count / args.requests:>10.3f} {result['errors']:>7}"
+                )
+        print(conference_cache.get_stats())
+    finally:
+        cleanup(host_ids)
+        await conference_cache.close()
+        await dispose_engines()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--conferences", type=int, default=20)
+    parser.add_argument("--churn", type=int, default=500)
+    asyncio.run(main(parser.parse_args()))
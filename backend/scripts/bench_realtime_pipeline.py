@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+End-to-end check of the realtime worker pipeline against a running gateway.
+
+Opens a speaker socket (as the host) and one listener per --languages in
+a fresh conference, sends --chunks audio chunks (the stub speech-to-text reads the
+bytes as text, so each chunk is a short sentence) and resends every
+--duplicate-every-th chunk with the same chunk_id. Reports, per listener
+language, how many distinct chunks arrived, how many arrived twice, and the
+latency from sending a chunk to receiving it (median / p95).
+
+Needs a gateway started with REALTIME_PIPELINE_ENABLED=true and a worker for
+the queues, e.g. for the defaults:
+    uvicorn main:app --port 8000
+    celery -A app.celery_app worker -Q audio.en,text.en-vi,text.en-fr --concurrency 4
+
+Usage:
+    python scripts/bench_realtime_pipeline.py [--base-url http://127.0.0.1:8000] [--chunks 200] [--rate 20]
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import statistics
+import time
+import uuid
+from collections import Counter
+
+import httpx
+import websockets
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[max(0, int(len(values) * fraction) - 1)]
+
+
+async def create_conference(base_url: str, source: str, target: str):
+    """A fresh conference and its host's access token (the host is the speaker)"""
+    api = f"{base_url}/api/v1"
+    email = f"bench_{uuid.uuid4().hex[:8]}@example.com"
+    async with httpx.AsyncClient() as client:
+        await client.post(f"{api}/auth/signup", json={"email": email, "password": "bench-password"})
+        signin = await client.post(f"{api}/auth/signin", json={"email": email, "password": "bench-password"})
+        headers = {"Authorization": f"Bearer {signin.json()['access_token']}"}
+        response = await client.post(
+            f"{api}/conferences/",
+            json={"title": "Pipeline bench", "language_from": source, "language_to": target},
+            headers=headers,
+        )
+        response.raise_for_status()
+        return response.json()["conference_code"], signin.json()["access_token"]
+
+
+async def listen(socket, arrivals: list, done: asyncio.Event):
+    while not done.is_set():
+        try:
+            message = json.loads(await asyncio.wait_for(socket.recv(), 0.5))
+        except asyncio.TimeoutError:
+            continue
+        if message.get("type") == "transcript":
+            arrivals.append((message.get("chunk_id"), time.perf_counter()))
+
+
+async def main(args):
+    code, token = await create_conference(args.base_url, args.source, args.languages[0])
+    room_url = f"{args.base_url.replace('http', 'ws', 1)}/api/v1/realtime/conferences/{code}"
+    print(
+        f"conference={code} chunks={args.chunks} rate={args.rate}/s "
+        f"languages={','.join(args.languages)} duplicate_every={args.duplicate_every}"
+    )
+
+    sent = {}
+    arrivals = {language: [] for language in args.languages}
+    done = asyncio.Event()
+    async with websockets.connect(f"{room_url}?lang={args.source}&name=Bench&token={token}") as speaker:
+        listeners = [await websockets.connect(f"{room_url}?lang={language}") for language in args.languages]
+        readers = [
+            asyncio.create_task(listen(socket, arrivals[language], done))
+            for language, socket in zip(args.languages, listeners)
+        ]
+        await asyncio.sleep(0.5)
+
+        for index in range(args.chunks):
+            chunk_id = f"chunk-{index}"
+            frame = json.dumps({
+                "type": "audio",
+                "data": base64.b64encode(f"sentence number {index} from the speaker".encode()).decode(),
+                "chunk_id": chunk_id,
+                "language": args.source,
+            })
+            sent[chunk_id] = time.perf_counter()
+            await speaker.send(frame)
+            if args.duplicate_every and index % args.duplicate_every == 0:
+                await speaker.send(frame)
+            await asyncio.sleep(1 / args.rate)
+
+        await asyncio.sleep(args.settle)
+        done.set()
+        await asyncio.gather(*readers)
+        for socket in listeners:
+            await socket.close()
+
+    print(f"\n{'language':<10} {'received':>9} {'twice':>6} {'p50 ms':>8} {'p95 ms':>8}")
+    for language, received in arrivals.items():
+        counts = Counter(chunk_id for chunk_id, _ in received)
+        first = {}
+        for chunk_id, at in received:
+            first.setdefault(chunk_id, at)
+        latencies = [(at - sent[chunk_id]) * 1000 for chunk_id, at in first.items() if chunk_id in sent]
+        twice = sum(1 for count in counts.values() if count > 1)
+        p50 = statistics.median(latencies) if latencies else 0.0
+        p95 = percentile(latencies, 0.95) if latencies else 0.0
+        print(f"{language:<10} {len(counts):>9} {twice:>6} {p50:>8.1f} {p95:>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--source", default="en")
+    parser.add_argument("--languages", nargs="+", default=["en", "vi", "fr"])
+    parser.add_argument("--chunks", type=int, default=200)
+    parser.add_argument("--rate", type=float, default=20.0, help="chunks sent per second")
+    parser.add_argument("--duplicate-every", type=int, default=10, help="resend every n-th chunk (0 disables)")
+    parser.add_argument("--settle", type=float, default=3.0, help="seconds to wait for the last results")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark: realtime room fan-out latency.
+
+Joins N in-process sockets to one conference room (spread over a few target
+languages) and publishes transcripts through RoomManager. Reports the time
+from publish until the first/last socket has written the message from its
+send queue, and compares the encode-once delivery with naive per-socket
+json encoding. --slow adds listeners that never drain, to check that they
+do not delay the rest of the room.
+
+Translation uses the local fallback (no provider round trip), so the numbers
+isolate the gateway's own fan-out cost.
+
+Usage:
+    python scripts/bench_room_fanout.py [--sockets 1000] [--messages 200]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import os
+import time
+import uuid
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.realtime_service import RoomConnection, RoomManager
+from app.services.translation_service import translation_service
+
+
+class FakeWebSocket:
+    """Stands in for a Starlette WebSocket; records when a payload arrives"""
+
+    def __init__(self, sink: list):
+        self.sink = sink
+
+    async def send_text(self, data: str) -> None:
+        await asyncio.sleep(0)
+        self.sink.append(time.perf_counter())
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+
+class StalledWebSocket(FakeWebSocket):
+    """A listener whose network never drains"""
+
+    async def send_text(self, data: str) -> None:
+        await asyncio.Event().wait()
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[max(0, int(len(values) * fraction) - 1)]
+
+
+async def bench(manager: RoomManager, publish, sockets: int, languages, messages: int, slow: int):
+    code = "bch-mark-abc"
+    arrivals = []
+    for index in range(sockets):
+        connection = RoomConnection(FakeWebSocket(arrivals), code, languages[index % len(languages)])
+        await manager.join(uuid.uuid4(), connection)
+    for index in range(slow):
+        connection = RoomConnection(StalledWebSocket([]), code, languages[index % len(languages)])
+        await manager.join(uuid.uuid4(), connection)
+
+    first, last = [], []
+    for sequence in range(messages):
+        arrivals.clear()
+        started = time.perf_counter()
+        await publish(code, f"segment {sequence}: thank you, next slide please")
+        # Delivery happens on the per-connection writer tasks
+        while len(arrivals) < sockets:
+            await asyncio.sleep(0)
+        first.append((min(arrivals) - started) * 1000)
+        last.append((max(arrivals) - started) * 1000)
+
+    for connection in list(manager.rooms[code].connections):
+        await manager.leave(connection)
+    return first, last
+
+
+async def main(args):
+    languages = args.languages
+    print(
+        f"sockets={args.sockets} stalled={args.slow} languages={','.join(languages)} "
+        f"messages={args.messages}"
+    )
+    print(f"{'mode':<18} {'first p50':>10} {'last p50':>10} {'last p95':>10} {'last p99':>10}  (ms)")
+
+    manager = RoomManager()
+
+    async def encode_once(code, text):
+        await manager.publish_transcript(code, text, "en", is_final=True, segment_id="s")
+
+    async def encode_per_socket(code, text):
+        room = manager.rooms[code]
+        translations = {
+            language: await translation_service.translate_text(text, "en", language)
+            for language in room.languages()
+        }
+        for connection in room.connections:
+            connection.enqueue(json.dumps({
+                "type": "transcript", "segment_id": "s", "is_final": True, "source_language": "en",
+                "text": text, "timestamp": time.time(), "target_language": connection.language,
+                "translation": translations[connection.language],
+            }, ensure_ascii=False))
+
+    for label, publish in (("encode-once", encode_once), ("encode-per-socket", encode_per_socket)):
+        first, last = await bench(manager, publish, args.sockets, languages, args.messages, args.slow)
+        print(
+            f"{label:<18} {statistics.median(first):>10.2f} {statistics.median(last):>10.2f} "
+            f"{percentile(last, 0.95):>10.2f} {percentile(last, 0.99):>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sockets", type=int, default=1000)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--languages", nargs="+", default=["vi", "ja", "fr"])
+    parser.add_argument("--slow", type=int, default=0, help="stalled listeners to add to the room")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Load test: a burst of sign-ins, bcrypt on the request threadpool vs the
+dedicated hashing executor.
+
+Seeds --users accounts, then fires --requests sign-ins with --concurrency
+clients at two in-process apps while a background client keeps calling a
+cheap sync endpoint (which, like most of the API, runs on the request
+threadpool):
+  - threadpool: the previous `def` sign-in, bcrypt on a request thread
+  - executor:   the current async sign-in, bcrypt on the bounded
+                password-hash executor (PASSWORD_HASH_WORKERS threads)
+Reports sign-ins/sec and latency, and the latency of the cheap endpoint
+during the burst (how badly sign-ins starve everything else).
+
+Requires DATABASE_URL to point at a migrated database.
+
+Usage:
+    python scripts/bench_signin.py [--concurrency 50] [--requests 200] [--rounds 12]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import os
+import time
+import uuid
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import Depends, FastAPI, HTTPException
+from sqlalchemy.orm import Session
+
+from app.api.v1.endpoints import auth
+from app.core.config import settings
+from app.core.database import SessionLocal, get_db
+from app.core.security import create_access_token, pwd_context, verify_password
+from app.models import User
+from app.schemas.user import UserLogin
+from bench_harness import cleanup, dispose_engines, drive, new_user, percentile
+
+PASSWORD = "bench-password"
+
+
+def legacy_signin(user_credentials: UserLogin, db: Session = Depends(get_db)):
+    """The sign-in as it was: sync handler, bcrypt on the request thread"""
+    user = db.query(User).filter(User.email == user_credentials.email).first()
+    if not user or not verify_password(user_credentials.password, user.hashed_password):
+        raise HTTPException(status_code=401)
+    return {"access_token": create_access_token(data={"sub": str(user.id)})}
+
+
+def build_app(legacy: bool) -> FastAPI:
+    app = FastAPI()
+    if legacy:
+        app.post("/auth/signin")(legacy_signin)
+    else:
+        app.include_router(auth.router, prefix="/auth")
+
+    @app.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    return app
+
+
+def seed(users: int):
+    db = SessionLocal()
+    try:
+        suffix = uuid.uuid4().hex[:8]
+        hashed = pwd_context.hash(PASSWORD)
+        rows = [new_user(suffix, index, hashed_password=hashed) for index in range(users)]
+        db.add_all(rows)
+        db.commit()
+        return [(row.id, row.email) for row in rows]
+    finally:
+        db.close()
+
+
+async def run_burst(app: FastAPI, emails, concurrency: int, total: int):
+    """Sign-ins from concurrency clients while a background client pings"""
+    pings = []
+
+    def signin(client, index):
+        return client.post("/auth/signin", json={"email": emails[index % len(emails)], "password": PASSWORD})
+
+    async def pinger(client, done):
+        while not done.is_set():
+            started = time.perf_counter()
+            await client.get("/ping")
+            pings.append(time.perf_counter() - started)
+            await asyncio.sleep(0.01)
+
+    result = await drive(app, signin, concurrency, total, background=pinger)
+    result["ping_p50"] = statistics.median(pings) * 1000
+    result["ping_p99"] = percentile(pings, 0.99)
+    return result
+
+
+async def main(args):
+    pwd_context.update(bcrypt__rounds=args.rounds)
+    users = seed(args.users)
+    try:
+        print(
+            f"concurrency={args.concurrency} requests={args.requests} rounds={args.rounds} "
+            f"hash_workers={settings.PASSWORD_HASH_WORKERS}"
+        )
+        print(f"{'mode':<11} {'signin/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'ping p50':>9} {'ping p99':>9} {'errors':>7}")
+        for mode, legacy in (("threadpool", True), ("executor", False)):
+            result = await run_burst(build_app(legacy), [email for _, email in users], args.concurrency, args.requests)
+            print(
+                f"{mode:<11} {result['rps']:>9.1f} {result['p50']:>9.1f} {result['p99']:>9.1f} "
+                f"{result['ping_p50']:>9.1f} {result['ping_p99']:>9.1f} {result['errors']:>7}"
+            )
+    finally:
+        cleanup([user_id for user_id, _ in users])
+        await dispose_engines()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=settings.BCRYPT_ROUNDS)
+    asyncio.run(main(parser.parse_args()))
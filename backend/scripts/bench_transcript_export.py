@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Benchmark: exporting a long conference transcript by loading the
+Conference.translations relationship vs streaming it from a server-side
+cursor (app.services.transcript_export).
+
+Seeds a conference with --rows Translation rows, then builds the export
+each way and reports wall time, peak Python memory (tracemalloc) and
+output size:
+  - relationship: conference.translations loaded into the session, then
+                  formatted (what a naive endpoint would do)
+  - streaming:    stream_transcript(), EXPORT_YIELD_PER rows per chunk;
+                  chunks are counted and discarded as a client would
+                  consume them
+Run with two --rows values to see that the streaming peak stays flat.
+
+Requires DATABASE_URL to point at a migrated database.
+
+Usage:
+    python scripts/bench_transcript_export.py [--rows 50000] [--formats ndjson,csv,srt,vtt]
+"""
+
+import argparse
+import asyncio
+import sys
+import os
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta, timezone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert
+from sqlalchemy.orm import selectinload
+
+from app.core.database import SessionLocal, async_engine, engine
+from app.models import Conference, ConferenceParticipant, Translation, User
+from app.models.conference import ConferenceStatus
+from app.schemas.conference import TranscriptFormat
+from app.services import transcript_export
+from app.services.conference_service import ConferenceService
+
+
+def seed(rows: int):
+    db = SessionLocal()
+    try:
+        suffix = uuid.uuid4().hex[:8]
+        host = User(
+            email=f"bench_{suffix}@example.com",
+            username=f"bench_{suffix}",
+            full_name="Bench Host",
+            hashed_password="",
+            is_active=True,
+        )
+        db.add(host)
+        db.flush()
+        started_at = datetime.now(timezone.utc) - timedelta(hours=8)
+        conference = Conference(
+            conference_code=ConferenceService.generate_conference_code(),
+            title="Bench conference",
+            host_id=host.id,
+            status=ConferenceStatus.ENDED,
+            language_from="en",
+            language_to="vi",
+            started_at=started_at,
+        )
+        db.add(conference)
+        db.flush()
+        participant = ConferenceParticipant(conference_id=conference.id, guest_name="Speaker")
+        db.add(participant)
+        db.flush()
+        for offset in range(0, rows, 5000):
+            db.execute(insert(Translation), [
+                {
+                    "conference_id": conference.id,
+                    "speaker_id": participant.id,
+                    "original_text": f"utterance {index} from the speaker, a sentence of typical length",
+                    "translated_text": f"cau {index} cua dien gia, mot cau co do dai thong thuong",
+                    "language_from": "en",
+                    "language_to": "vi",
+                    "translation_status": "completed",
+                    "created_at": started_at + timedelta(milliseconds=500 * index),
+                }
+                for index in range(offset, min(offset + 5000, rows))
+            ])
+        db.commit()
+        return host.id, conference.id
+    finally:
+        db.close()
+
+
+def cleanup(host_id, conference_id):
+    db = SessionLocal()
+    try:
+        db.query(Translation).filter(Translation.conference_id == conference_id).delete(synchronize_session=False)
+        db.query(ConferenceParticipant).filter(
+            ConferenceParticipant.conference_id == conference_id
+        ).delete(synchronize_session=False)
+        db.query(Conference).filter(Conference.id == conference_id).delete(synchronize_session=False)
+        db.query(User).filter(User.id == host_id).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+class _Row:
+    """Adapts a Translation object to the row shape the formatters expect"""
+
+    __slots__ = ("created_at", "speaker", "language_from", "language_to", "original_text", "translated_text")
+
+    def __init__(self, translation: Translation):
+        self.created_at = translation.created_at
+        self.speaker = translation.speaker.guest_name if translation.speaker else None
+        self.language_from = translation.language_from
+        self.language_to = translation.language_to
+        self.original_text = translation.original_text
+        self.translated_text = translation.translated_text
+
+
+def relationship_export(conference_id, export_format: TranscriptFormat) -> int:
+    db = SessionLocal()
+    try:
+        conference = db.query(Conference).options(
+            selectinload(Conference.translations).joinedload(Translation.speaker)
+        ).filter(Conference.id == conference_id).one()
+        rows = [_Row(translation) for translation in sorted(conference.translations, key=lambda t: t.created_at)]
+        if export_format == TranscriptFormat.NDJSON:
+            body = transcript_export._ndjson(rows)
+        elif export_format == TranscriptFormat.CSV:
+            body = ",".join(transcript_export.CSV_COLUMNS) + "\r\n" + transcript_export._csv(rows)
+        else:
+            cues = transcript_export._CueWriter(conference.started_at, vtt=export_format == TranscriptFormat.VTT)
+            body = ("WEBVTT\n\n" if export_format == TranscriptFormat.VTT else "") + cues.feed(rows) + cues.close()
+        return len(body.encode())
+    finally:
+        db.close()
+
+
+async def streaming_export(conference_id, export_format: TranscriptFormat) -> int:
+    db = SessionLocal()
+    try:
+        conference = db.get(Conference, conference_id)
+        db.expunge(conference)
+    finally:
+        db.close()
+    size = 0
+    async for chunk in transcript_export.stream_transcript(conference, export_format):
+        size += len(chunk.encode())
+    return size
+
+
+async def measure(run):
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        size = await run()
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak, size
+
+
+async def main(args):
+    formats = [TranscriptFormat(value) for value in args.formats.split(",")]
+    host_id, conference_id = seed(args.rows)
+    try:
+        print(f"rows={args.rows} yield_per={transcript_export.EXPORT_YIELD_PER}")
+        print(f"{'format':<7} {'mode':<13} {'seconds':>8} {'peak MB':>9} {'output MB':>10}")
+        # Warm the connection pools and imports so neither mode pays for them
+        await streaming_export(conference_id, TranscriptFormat.NDJSON)
+        for export_format in formats:
+            for mode in ("relationship", "streaming"):
+                if mode == "relationship":
+                    run = lambda: asyncio.to_thread(relationship_export, conference_id, export_format)
+                else:
+                    run = lambda: streaming_export(conference_id, export_format)
+                elapsed, peak, size = await measure(run)
+                print(
+                    f"{export_format.value:<7} {mode:<13} {elapsed:>8.2f} "
+                    f"{peak / 1048576:>9.1f} {size / 1048576:>10.1f}"
+                )
+    finally:
+        cleanup(host_id, conference_id)
+        await async_engine.dispose()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--formats", default="ndjson,csv,srt,vtt")
+    asyncio.run(main(parser.parse_args()))
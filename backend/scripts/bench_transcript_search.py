@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Benchmark: finding a word in a host's past transcripts with an ILIKE scan
+vs the full-text search behind GET /conferences/transcripts/search.
+
+Seeds one host with --conferences conferences holding --rows Translation
+rows in total. One row in --rare mentions "budget"; the rest are filler
+sentences. Then times (median of --repeat runs):
+  - ilike:       original_text/translated_text ILIKE '%budget%', newest
+                 first (the only option without an index)
+  - fts:         transcript_search's ranked, highlighted first page
+  - fts page N:  the same search continued from a keyset cursor
+and reports how many rows each plan had to read.
+
+Requires DATABASE_URL to point at a database migrated to head.
+
+Usage:
+    python scripts/bench_transcript_search.py [--rows 500000] [--rare 1000] [--conferences 50]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import os
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert, or_, select, text
+
+from app.core.database import AsyncSessionLocal, SessionLocal, async_engine, engine
+from app.models import Conference, ConferenceParticipant, Translation, User
+from app.models.conference import ConferenceStatus
+from app.services import transcript_search
+from app.services.conference_service import ConferenceService
+
+PAGE = 20
+
+
+def seed(rows: int, rare: int, conferences: int):
+    db = SessionLocal()
+    try:
+        suffix = uuid.uuid4().hex[:8]
+        host = User(
+            email=f"bench_{suffix}@example.com",
+            username=f"bench_{suffix}",
+            full_name="Bench Host",
+            hashed_password="",
+            is_active=True,
+        )
+        db.add(host)
+        db.flush()
+        # Recent enough to sit in the current monthly partitions
+        started_at = datetime.now(timezone.utc) - timedelta(days=1)
+        conference_rows = [{
+            "id": uuid.uuid4(),
+            "conference_code": ConferenceService.generate_conference_code(),
+            "title": f"Bench conference {index}",
+            "host_id": host.id,
+            "status": ConferenceStatus.ENDED,
+            "language_from": "en",
+            "language_to": "fr",
+        } for index in range(conferences)]
+        db.execute(insert(Conference), conference_rows)
+        participant_rows = [{
+            "id": uuid.uuid4(),
+            "conference_id": conference["id"],
+            "guest_name": "Speaker",
+        } for conference in conference_rows]
+        db.execute(insert(ConferenceParticipant), participant_rows)
+        db.commit()
+
+        per_conference = max(rows // conferences, 1)
+        for index, participant in enumerate(participant_rows):
+            db.execute(text(
+                "INSERT INTO translations (id, conference_id, speaker_id, original_text, translated_text, "
+                "language_from, language_to, translation_status, created_at) "
+                "SELECT gen_random_uuid(), :conference, :speaker, "
+                "CASE WHEN (:offset + g) % :rare = 0 "
+                "THEN 'then we should revisit the budget for item ' || g "
+                "ELSE 'the speaker moves on to agenda point ' || g || ' with a few remarks' END, "
+                "'le conferencier passe au point ' || g, 'en', 'fr', 'completed', "
+                ":started + make_interval(secs => g) "
+                "FROM generate_series(1, :count) g"
+            ), {
+                "conference": participant["conference_id"],
+                "speaker": participant["id"],
+                "offset": index * per_conference,
+                "rare": rare,
+                "started": started_at,
+                "count": per_conference,
+            })
+        db.commit()
+        db.execute(text("ANALYZE translations"))
+        db.commit()
+        return host.id, [conference["id"] for conference in conference_rows]
+    finally:
+        db.close()
+
+
+def cleanup(host_id, conference_ids):
+    db = SessionLocal()
+    try:
+        db.query(Translation).filter(Translation.conference_id.in_(conference_ids)).delete(synchronize_session=False)
+        db.query(ConferenceParticipant).filter(
+            ConferenceParticipant.conference_id.in_(conference_ids)
+        ).delete(synchronize_session=False)
+        db.query(Conference).filter(Conference.id.in_(conference_ids)).delete(synchronize_session=False)
+        db.query(User).filter(User.id == host_id).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def ilike_stmt(host_id):
+    return select(
+        Translation.id, Translation.created_at, Translation.original_text, Translation.translated_text
+    ).join(
+        Conference, Conference.id == Translation.conference_id
+    ).where(
+        Conference.host_id == host_id,
+        or_(Translation.original_text.ilike("%budget%"), Translation.translated_text.ilike("%budget%")),
+    ).order_by(Translation.created_at.desc()).limit(PAGE)
+
+
+async def timed(run, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = await run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), result
+
+
+def rows_read(statement) -> int:
+    """Rows the plan pulled from translations (all partitions), including those filtered out"""
+    compiled = statement.compile(dialect=engine.dialect)
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql("EXPLAIN (ANALYZE, FORMAT JSON) " + str(compiled), compiled.params).scalar()[0]
+
+    def walk(node):
+        read = 0
+        if node.get("Relation Name", "").startswith("translations"):
+            read = (node["Actual Rows"] + node.get("Rows Removed by Filter", 0)) * node["Actual Loops"]
+        return read + sum(walk(child) for child in node.get("Plans", []))
+
+    return walk(plan["Plan"])
+
+
+async def main(args):
+    host_id, conference_ids = seed(args.rows, args.rare, args.conferences)
+    try:
+        print(f"rows={args.rows} matches~={args.rows // args.rare} conferences={args.conferences} page={PAGE}")
+        print(f"{'query':<12} {'median ms':>10} {'hits':>6} {'rows read':>10}")
+        async with AsyncSessionLocal() as db:
+            async def ilike():
+                return (await db.execute(ilike_stmt(host_id))).all()
+
+            elapsed, result = await timed(ilike, args.repeat)
+            print(f"{'ilike':<12} {elapsed:>10.2f} {len(result):>6} {rows_read(ilike_stmt(host_id)):>10}")
+
+            async def search(cursor=None):
+                return await transcript_search.search_transcripts(db, host_id, "budget", "en", limit=PAGE, cursor=cursor)
+
+            elapsed, page = await timed(search, args.repeat)
+            statement = transcript_search._search_stmt(host_id, "budget", "en", None, PAGE + 1, None)
+            print(f"{'fts':<12} {elapsed:>10.2f} {len(page['hits']):>6} {rows_read(statement):>10}")
+
+            cursor = None
+            for _ in range(args.page - 1):
+                cursor = (await search(cursor))["next_cursor"]
+            if cursor:
+                elapsed, page = await timed(lambda: search(cursor), args.repeat)
+                print(f"{f'fts page {args.page}':<12} {elapsed:>10.2f} {len(page['hits']):>6} {'':>10}")
+    finally:
+        cleanup(host_id, conference_ids)
+        await async_engine.dispose()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500000)
+    parser.add_argument("--rare", type=int, default=1000)
+    parser.add_argument("--conferences", type=int, default=50)
+    parser.add_argument("--page", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark: translation micro-batching, throughput vs added latency.
+
+Runs the TranslationBatcher against a simulated provider that costs a fixed
+round trip plus a small per-item cost and only allows a limited number of
+concurrent requests (connection pool / provider rate limit). Each row
+compares one batching configuration against unbatched single requests.
+
+Usage:
+    python scripts/bench_translation_batching.py [--speakers 20] [--seconds 5]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.translation_batcher import TranslationBatcher
+
+
+class SimulatedProvider:
+    def __init__(self, rtt_ms: float, per_item_ms: float, max_concurrency: int):
+        self.rtt = rtt_ms / 1000.0
+        self.per_item = per_item_ms / 1000.0
+        self.slots = asyncio.Semaphore(max_concurrency)
+        self.calls = 0
+
+    async def translate_batch(self, texts, source_language, target_language):
+        async with self.slots:
+            self.calls += 1
+            await asyncio.sleep(self.rtt + self.per_item * len(texts))
+            return [f"[{target_language}] {text}" for text in texts]
+
+    async def translate_one(self, text, source_language, target_language):
+        return (await self.translate_batch([text], source_language, target_language))[0]
+
+
+async def run_load(translate, speakers: int, seconds: float):
+    latencies = []
+    deadline = time.perf_counter() + seconds
+
+    async def speaker(index: int):
+        sequence = 0
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            await translate(f"speaker {index} segment {sequence}", "en", "vi")
+            latencies.append(time.perf_counter() - started)
+            sequence += 1
+
+    await asyncio.gather(*(speaker(i) for i in range(speakers)))
+    return latencies
+
+
+def summarize(label: str, latencies, seconds: float, calls: int, baseline_p50=None):
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies) * 1000
+    p95 = latencies[int(len(latencies) * 0.95) - 1] * 1000
+    added = f"{p50 - baseline_p50:+8.1f}" if baseline_p50 is not None else f"{'-':>8}"
+    print(
+        f"{label:<22} {len(latencies) / seconds:>10.1f} {p50:>9.1f} {p95:>9.1f} {added} {calls:>8}"
+    )
+    return p50
+
+
+async def main(args):
+    print(
+        f"provider: rtt={args.rtt_ms}ms per_item={args.per_item_ms}ms "
+        f"max_concurrency={args.max_concurrency}; speakers={args.speakers}"
+    )
+    print(f"{'config':<22} {'items/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'+p50 ms':>8} {'calls':>8}")
+
+    provider = SimulatedProvider(args.rtt_ms, args.per_item_ms, args.max_concurrency)
+    latencies = await run_load(provider.translate_one, args.speakers, args.seconds)
+    baseline_p50 = summarize("unbatched", latencies, args.seconds, provider.calls)
+
+    for window_ms in args.windows:
+        for max_size in args.max_sizes:
+            provider = SimulatedProvider(args.rtt_ms, args.per_item_ms, args.max_concurrency)
+            batcher = TranslationBatcher(provider.translate_batch, window_ms, max_size)
+            latencies = await run_load(batcher.submit, args.speakers, args.seconds)
+            await batcher.drain()
+            summarize(
+                f"window={window_ms:g}ms max={max_size}",
+                latencies, args.seconds, provider.calls, baseline_p50,
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--speakers", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--rtt-ms", type=float, default=60.0)
+    parser.add_argument("--per-item-ms", type=float, default=1.0)
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    parser.add_argument("--windows", type=float, nargs="+", default=[5.0, 10.0, 20.0])
+    parser.add_argument("--max-sizes", type=int, nargs="+", default=[8, 32])
+    asyncio.run(main(parser.parse_args()))
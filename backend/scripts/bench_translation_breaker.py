@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Benchmark: translate_text latency while the provider degrades and recovers.
+
+Starts a local HTTP provider and drives TranslationService with --speakers
+concurrent callers, each sending an utterance every --interval-ms, through
+three phases of --seconds each:
+  - healthy:   answers in --rtt-ms
+  - hanging:   accepts requests but never answers in time
+  - recovered: healthy again
+for three configurations:
+  - legacy:          5 s timeouts (httpx's default) and no breaker
+  - budget:          TRANSLATION_LATENCY_BUDGET_MS deadlines only
+  - budget+breaker:  deadlines plus the circuit breaker (--open-seconds)
+and reports per phase the latency (p50 / p95), the share of callers served
+the fallback translation and how many requests reached the provider.
+
+The translation cache is disabled so every call needs the provider.
+
+Usage:
+    python scripts/bench_translation_breaker.py [--speakers 20] [--seconds 6] [--interval-ms 250]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.translation_providers import TranslationProvider
+from app.services.translation_service import translation_service
+
+
+class LocalProvider:
+    """Minimal HTTP/1.1 translation endpoint whose health can be switched"""
+
+    def __init__(self, rtt_ms: float):
+        self.rtt = rtt_ms / 1000.0
+        self.hanging = False
+        self.requests = 0
+        self.server = None
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/translate"
+
+    async def stop(self) -> None:
+        self.server.close()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.decode("latin-1").split("\r\n"):
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                request = json.loads(await reader.readexactly(length))
+                self.requests += 1
+                await asyncio.sleep(30 if self.hanging else self.rtt)
+                body = json.dumps({"translated_text": f"{request['text']} ({request['target']})"}).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+
+async def run_phase(speakers: int, seconds: float, interval_ms: float, label: str):
+    latencies, fallbacks = [], 0
+    deadline = time.perf_counter() + seconds
+
+    async def speaker(index: int):
+        nonlocal fallbacks
+        sequence = 0
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            translated = await translation_service.translate_text(f"{label} {index} {sequence}", "en", "vi")
+            latencies.append((time.perf_counter() - started) * 1000)
+            fallbacks += translated.startswith("[")
+            sequence += 1
+            await asyncio.sleep(max(interval_ms / 1000 - (time.perf_counter() - started), 0))
+
+    await asyncio.gather(*(speaker(index) for index in range(speakers)))
+    return latencies, fallbacks
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[max(0, int(len(values) * fraction) - 1)]
+
+
+async def main(args):
+    provider = LocalProvider(args.rtt_ms)
+    url = await provider.start()
+    upstream = TranslationProvider("bench", url, "bench")
+    translation_service.providers = [upstream]
+    translation_service.cache = None
+    translation_service.batcher = None
+    budget_ms = settings.TRANSLATION_LATENCY_BUDGET_MS
+    print(
+        f"speakers={args.speakers} seconds/phase={args.seconds} rtt={args.rtt_ms}ms "
+        f"budget={budget_ms:.0f}ms breaker: {settings.TRANSLATION_BREAKER_FAILURES} failures, "
+        f"slow>{settings.TRANSLATION_BREAKER_SLOW_CALL_MS:.0f}ms, open {args.open_seconds}s"
+    )
+    print(f"{'config':<16} {'phase':<10} {'calls':>7} {'p50 ms':>8} {'p95 ms':>8} {'fallback':>9} {'upstream':>9}")
+
+    configs = [
+        ("legacy", 5000.0, False),
+        ("budget", budget_ms, False),
+        ("budget+breaker", budget_ms, True),
+    ]
+    try:
+        for label, config_budget, with_breaker in configs:
+            settings.TRANSLATION_LATENCY_BUDGET_MS = config_budget
+            upstream.breaker = CircuitBreaker(
+                "translation",
+                failure_threshold=settings.TRANSLATION_BREAKER_FAILURES,
+                slow_call_ms=settings.TRANSLATION_BREAKER_SLOW_CALL_MS,
+                open_seconds=args.open_seconds,
+                half_open_probes=settings.TRANSLATION_BREAKER_HALF_OPEN_PROBES,
+            ) if with_breaker else None
+            # Fresh connections per configuration (hung ones are abandoned)
+            await translation_service.shutdown()
+
+            for phase, hanging in (("healthy", False), ("hanging", True), ("recovered", False)):
+                provider.hanging = hanging
+                before = provider.requests
+                latencies, fallbacks = await run_phase(args.speakers, args.seconds, args.interval_ms, f"{label}-{phase}")
+                print(
+                    f"{label:<16} {phase:<10} {len(latencies):>7} {statistics.median(latencies):>8.1f} "
+                    f"{percentile(latencies, 0.95):>8.1f} {fallbacks / len(latencies):>8.1%} "
+                    f"{provider.requests - before:>9}"
+                )
+            if upstream.breaker is not None:
+                stats = upstream.breaker.get_stats()
+                short_circuited = translation_service.get_provider_stats()["short_circuited"]
+                print(f"{'':<16} breaker: state={stats['state']} trips={stats['trips']} "
+                      f"rejected={stats['rejected']} probes={stats['probes']} short_circuited={short_circuited}")
+    finally:
+        settings.TRANSLATION_LATENCY_BUDGET_MS = budget_ms
+        await translation_service.shutdown()
+        await provider.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--speakers", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=6.0)
+    parser.add_argument("--rtt-ms", type=float, default=40.0)
+    parser.add_argument("--interval-ms", type=float, default=250.0, help="time between one speaker's utterances")
+    parser.add_argument("--open-seconds", type=float, default=2.0, help="breaker open time before probing")
+    asyncio.run(main(parser.parse_args()))
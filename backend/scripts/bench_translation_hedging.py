@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Benchmark: translate_text tail latency with one provider vs several routed
+and hedged ones.
+
+Starts two local HTTP providers; each answers in its --rtt-ms, except for a
+--tail-ratio share of requests (independently per provider) that take
+--tail-ms, like a GC pause or a cold model replica. Drives
+TranslationService with --speakers concurrent callers, each sending an
+utterance every --interval-ms for --seconds, in four configurations:
+  - single:          only the fast provider
+  - routed:          both, slower one configured first; routing by EWMA
+  - routed+hedged:   as routed, plus a hedge to the other provider after p95
+  - degraded:        routed+hedged, the fast provider slows down halfway through
+and reports latency (p50 / p95 / p99 / max), upstream requests per call,
+how many calls were hedged and won by the hedge, and each provider's share.
+
+The translation cache is disabled so every call needs a provider.
+
+Usage:
+    python scripts/bench_translation_hedging.py [--speakers 20] [--seconds 10] [--tail-ratio 0.05]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.services.translation_providers import TranslationProvider
+from app.services.translation_service import translation_service
+
+
+class LocalProvider:
+    """Minimal HTTP/1.1 translation endpoint with a latency tail"""
+
+    def __init__(self, rtt_ms: float, tail_ms: float, tail_ratio: float, seed: int):
+        self.rtt = rtt_ms / 1000.0
+        self.tail = tail_ms / 1000.0
+        self.tail_ratio = tail_ratio
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.server = None
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/translate"
+
+    async def stop(self) -> None:
+        self.server.close()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.decode("latin-1").split("\r\n"):
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                request = json.loads(await reader.readexactly(length))
+                self.requests += 1
+                slow = self.random.random() < self.tail_ratio
+                await asyncio.sleep(self.tail if slow else self.rtt * self.random.uniform(0.8, 1.2))
+                body = json.dumps({"translated_text": f"{request['text']} ({request['target']})"}).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+
+async def run_load(speakers: int, seconds: float, interval_ms: float, label: str, on_halfway=None):
+    latencies = []
+    started_at = time.perf_counter()
+    deadline = started_at + seconds
+
+    async def speaker(index: int):
+        sequence = 0
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            await translation_service.translate_text(f"{label} {index} {sequence}", "en", "vi")
+            latencies.append((time.perf_counter() - started) * 1000)
+            sequence += 1
+            await asyncio.sleep(max(interval_ms / 1000 - (time.perf_counter() - started), 0))
+
+    async def halfway():
+        await asyncio.sleep(seconds / 2)
+        on_halfway()
+
+    tasks = [speaker(index) for index in range(speakers)]
+    if on_halfway is not None:
+        tasks.append(halfway())
+    await asyncio.gather(*tasks)
+    return latencies
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[max(0, int(len(values) * fraction) - 1)]
+
+
+async def main(args):
+    fast = LocalProvider(args.rtt_ms, args.tail_ms, args.tail_ratio, seed=1)
+    slow = LocalProvider(args.rtt_ms * args.slower, args.tail_ms, args.tail_ratio, seed=2)
+    fast_url, slow_url = await fast.start(), await slow.start()
+    translation_service.cache = None
+    translation_service.batcher = None
+    hedging = settings.TRANSLATION_HEDGING_ENABLED
+    print(
+        f"speakers={args.speakers} seconds={args.seconds} interval={args.interval_ms}ms "
+        f"fast={args.rtt_ms}ms slow={args.rtt_ms * args.slower:.0f}ms "
+        f"tail={args.tail_ratio:.0%} at {args.tail_ms}ms"
+    )
+    print(
+        f"{'config':<15} {'calls':>6} {'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7} {'max ms':>7} "
+        f"{'req/call':>8} {'hedged':>7} {'won':>5} {'fast':>6} {'slow':>6}"
+    )
+
+    configs = [
+        ("single", [("fast", fast_url)], False, False),
+        ("routed", [("slow", slow_url), ("fast", fast_url)], False, False),
+        ("routed+hedged", [("slow", slow_url), ("fast", fast_url)], True, False),
+        ("degraded", [("slow", slow_url), ("fast", fast_url)], True, True),
+    ]
+    try:
+        for label, urls, hedged, degrade in configs:
+            settings.TRANSLATION_HEDGING_ENABLED = hedged
+            # Closes the previous configuration's provider clients
+            await translation_service.shutdown()
+            translation_service.providers = [TranslationProvider(name, url, "bench") for name, url in urls]
+            translation_service._hedge_counters = {"hedged": 0, "hedge_wins": 0}
+            fast.rtt = args.rtt_ms / 1000.0
+            before = (fast.requests, slow.requests)
+
+            def slow_down():
+                fast.rtt = args.rtt_ms * args.slower * 2 / 1000.0
+
+            latencies = await run_load(
+                args.speakers, args.seconds, args.interval_ms, label, slow_down if degrade else None
+            )
+            fast_requests, slow_requests = fast.requests - before[0], slow.requests - before[1]
+            upstream = fast_requests + slow_requests
+            counters = translation_service.get_provider_stats()
+            print(
+                f"{label:<15} {len(latencies):>6} {statistics.median(latencies):>7.1f} "
+                f"{percentile(latencies, 0.95):>7.1f} {percentile(latencies, 0.99):>7.1f} {max(latencies):>7.1f} "
+                f"{upstream / len(latencies):>8.3f} {counters['hedged']:>7} {counters['hedge_wins']:>5} "
+                f"{fast_requests / upstream:>6.1%} {slow_requests / upstream:>6.1%}"
+            )
+    finally:
+        settings.TRANSLATION_HEDGING_ENABLED = hedging
+        await translation_service.shutdown()
+        await fast.stop()
+        await slow.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--speakers", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--rtt-ms", type=float, default=40.0, help="typical latency of the fast provider")
+    parser.add_argument("--slower", type=float, default=1.5, help="the other provider's latency, as a multiple")
+    parser.add_argument("--tail-ms", type=float, default=600.0)
+    parser.add_argument("--tail-ratio", type=float, default=0.05, help="share of requests that hit the tail")
+    parser.add_argument("--interval-ms", type=float, default=250.0, help="time between one speaker's utterances")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Benchmark: the translations layout before and after monthly range
+partitioning, at --rows rows spread over --months months.
+
+Builds two scratch copies of the translations table with the production
+indexes (no foreign keys: the checks cost the same in both layouts):
+  - flat:        one heap, PRIMARY KEY (id)
+  - partitioned: PARTITION BY RANGE (created_at), one partition per month,
+                 PRIMARY KEY (id, created_at)
+and compares
+  - bulk load and steady-state insert rate (--insert-rows rows in
+    TranslationWriter-sized batches into the current month)
+  - a conference transcript query (conference_id plus the conference's
+    created_at window) and how many partitions it touches
+  - purging the oldest month: DELETE vs DROP TABLE of the partition
+    (time, WAL written, and disk actually released)
+  - purging one conference's rows (ConferenceService.delete_conference)
+The default is the 100M-row scale from the partitioning design; it needs
+roughly 60 GB of free disk and hours to load, so pass a smaller --rows
+for a quick run.
+
+Requires DATABASE_URL to point at a PostgreSQL 12+ database.
+
+Usage:
+    python scripts/bench_translation_partitions.py [--rows 100000000] [--months 24] [--conferences 200000]
+"""
+
+import argparse
+import sys
+import os
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+
+from app.core.database import engine
+from app.services.translation_partitions import add_months, month_start
+
+FLAT = "bench_translations_flat"
+PARTITIONED = "bench_translations_part"
+COLUMNS = """
+    id UUID NOT NULL DEFAULT gen_random_uuid(),
+    conference_id UUID NOT NULL,
+    speaker_id UUID NOT NULL,
+    original_text TEXT NOT NULL,
+    translated_text TEXT,
+    language_from VARCHAR(10) NOT NULL,
+    language_to VARCHAR(10) NOT NULL,
+    translation_status VARCHAR(20),
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+"""
+# Rows of --rows loaded per INSERT ... SELECT
+LOAD_CHUNK = 1000000
+# TranslationWriter flushes up to TRANSCRIPT_HISTORY_BATCH_SIZE rows per INSERT
+INSERT_BATCH = 500
+
+
+def create_tables(conn, first_month: datetime, months: int):
+    conn.execute(text(f"DROP TABLE IF EXISTS {FLAT}, {PARTITIONED}"))
+    conn.execute(text(f"CREATE TABLE {FLAT} ({COLUMNS}, PRIMARY KEY (id))"))
+    conn.execute(text(f"CREATE TABLE {PARTITIONED} ({COLUMNS}, PRIMARY KEY (id, created_at)) PARTITION BY RANGE (created_at)"))
+    conn.execute(text(f"CREATE TABLE {PARTITIONED}_default PARTITION OF {PARTITIONED} DEFAULT"))
+    for offset in range(months + 1):
+        month = add_months(first_month, offset)
+        conn.execute(text(
+            f"CREATE TABLE {PARTITIONED}_{offset:03d} PARTITION OF {PARTITIONED} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+        ))
+    for table in (FLAT, PARTITIONED):
+        conn.execute(text(f"CREATE INDEX ON {table} (id)"))
+        conn.execute(text(f"CREATE INDEX ON {table} (conference_id, created_at)"))
+        conn.execute(text(f"CREATE INDEX ON {table} (speaker_id)"))
+
+
+def load(table: str, rows: int, start: datetime, span_seconds: float, conferences: int) -> float:
+    """
+    Time-ordered rows, like the write-behind buffer appends them: each
+    conference is a contiguous run of rows with four speakers. Returns seconds.
+    """
+    started = time.perf_counter()
+    for offset in range(0, rows, LOAD_CHUNK):
+        with engine.begin() as conn:
+            conn.execute(text(
+                f"INSERT INTO {table} (conference_id, speaker_id, original_text, translated_text, "
+                f"language_from, language_to, translation_status, created_at) "
+                f"SELECT md5((g / :per_conference)::text)::uuid, md5((g / :per_conference) || '-' || (g % 4))::uuid, "
+                f"'utterance ' || g || ' from the speaker, a sentence of typical length', "
+                f"'cau ' || g || ' cua dien gia, mot cau co do dai thong thuong', 'en', 'vi', 'completed', "
+                f":start + make_interval(secs => g * :step) "
+                f"FROM generate_series(:low, :high) g"
+            ), {
+                "per_conference": max(rows // conferences, 1),
+                "start": start,
+                "step": span_seconds / rows,
+                "low": offset,
+                "high": min(offset + LOAD_CHUNK, rows) - 1,
+            })
+    return time.perf_counter() - started
+
+
+def steady_inserts(table: str, rows: int, moment: datetime) -> float:
+    """rows/sec for TranslationWriter-style multi-row INSERTs"""
+    started = time.perf_counter()
+    for offset in range(0, rows, INSERT_BATCH):
+        batch = [{
+            "conference_id": uuid.uuid4(),
+            "speaker_id": uuid.uuid4(),
+            "original_text": f"utterance {index} from the speaker, a sentence of typical length",
+            "translated_text": f"cau {index} cua dien gia, mot cau co do dai thong thuong",
+            "created_at": moment + timedelta(milliseconds=index),
+        } for index in range(offset, min(offset + INSERT_BATCH, rows))]
+        with engine.begin() as conn:
+            conn.execute(text(
+                f"INSERT INTO {table} (conference_id, speaker_id, original_text, translated_text, "
+                f"language_from, language_to, translation_status, created_at) "
+                f"VALUES (:conference_id, :speaker_id, :original_text, :translated_text, 'en', 'vi', 'completed', :created_at)"
+            ), batch)
+    return rows / (time.perf_counter() - started)
+
+
+def timed(conn, sql: str, params=None):
+    """(seconds, WAL bytes) of one statement"""
+    wal_before = conn.execute(text("SELECT pg_current_wal_insert_lsn()")).scalar()
+    started = time.perf_counter()
+    result = conn.execute(text(sql), params or {})
+    elapsed = time.perf_counter() - started
+    wal = conn.execute(text("SELECT pg_wal_lsn_diff(pg_current_wal_insert_lsn(), :lsn)"), {"lsn": wal_before}).scalar()
+    return elapsed, int(wal), result
+
+
+def size(conn, table: str) -> int:
+    return conn.execute(text(
+        "SELECT sum(pg_total_relation_size(oid)) FROM pg_class "
+        "WHERE oid = to_regclass(:table) OR oid IN (SELECT relid FROM pg_partition_tree(:table))"
+    ), {"table": table}).scalar()
+
+
+def transcript_plan(conn, table: str, conference_id: str, lower: datetime, upper: datetime):
+    plan = conn.execute(text(
+        f"EXPLAIN (ANALYZE, FORMAT JSON) SELECT * FROM {table} "
+        f"WHERE conference_id = :conference AND created_at >= :lower AND created_at <= :upper ORDER BY created_at"
+    ), {"conference": conference_id, "lower": lower, "upper": upper}).scalar()[0]
+
+    def relations(node):
+        found = {node["Relation Name"]} if "Relation Name" in node else set()
+        for child in node.get("Plans", []):
+            found |= relations(child)
+        return found
+
+    return plan["Execution Time"], len(relations(plan["Plan"]))
+
+
+def megabytes(value: int) -> str:
+    return f"{value / 1048576:.1f}"
+
+
+def main(args):
+    now = datetime.now(timezone.utc)
+    first_month = add_months(month_start(now), -(args.months - 1))
+    span = (now - first_month).total_seconds()
+    with engine.begin() as conn:
+        create_tables(conn, first_month, args.months)
+    try:
+        print(f"rows={args.rows} months={args.months} conferences={args.conferences} insert_rows={args.insert_rows}")
+        print(f"\n{'layout':<12} {'load rows/s':>12} {'insert rows/s':>14} {'size MB':>9}")
+        for table in (FLAT, PARTITIONED):
+            elapsed = load(table, args.rows, first_month, span, args.conferences)
+            with engine.begin() as conn:
+                conn.execute(text(f"ANALYZE {table}"))
+            rate = steady_inserts(table, args.insert_rows, now)
+            with engine.connect() as conn:
+                total = size(conn, table)
+            print(f"{table.split('_')[-1]:<12} {args.rows / elapsed:>12.0f} {rate:>14.0f} {megabytes(total):>9}")
+
+        # The most recent loaded conference, queried the way transcript_export does
+        with engine.connect() as conn:
+            conference_id, lower, upper = conn.execute(text(
+                f"SELECT conference_id, min(created_at), max(created_at) FROM {FLAT} "
+                f"WHERE conference_id = md5(((:rows - 1) / :per_conference)::text)::uuid GROUP BY conference_id"
+            ), {"rows": args.rows, "per_conference": max(args.rows // args.conferences, 1)}).one()
+            print(f"\n{'layout':<12} {'transcript ms':>14} {'relations':>10}")
+            for table in (FLAT, PARTITIONED):
+                # Warm run first so both are measured from cache
+                transcript_plan(conn, table, conference_id, lower, upper)
+                elapsed, relations = transcript_plan(conn, table, conference_id, lower, upper)
+                print(f"{table.split('_')[-1]:<12} {elapsed:>14.3f} {relations:>10}")
+
+        print(f"\n{'purge':<28} {'seconds':>8} {'WAL MB':>8} {'size before':>12} {'size after':>11}")
+        cutoff = add_months(first_month, 1)
+        with engine.begin() as conn:
+            before = size(conn, FLAT)
+            elapsed, wal, _ = timed(conn, f"DELETE FROM {FLAT} WHERE created_at < :cutoff", {"cutoff": cutoff})
+        with engine.connect() as conn:
+            # DELETE leaves dead tuples: the disk is only reusable after VACUUM, never returned
+            conn.execution_options(isolation_level="AUTOCOMMIT").execute(text(f"VACUUM {FLAT}"))
+            after = size(conn, FLAT)
+        print(f"{'oldest month: DELETE':<28} {elapsed:>8.2f} {megabytes(wal):>8} {megabytes(before):>12} {megabytes(after):>11}")
+        with engine.begin() as conn:
+            before = size(conn, PARTITIONED)
+            elapsed, wal, _ = timed(conn, f"DROP TABLE {PARTITIONED}_000")
+            after = size(conn, PARTITIONED)
+        print(f"{'oldest month: DROP TABLE':<28} {elapsed:>8.2f} {megabytes(wal):>8} {megabytes(before):>12} {megabytes(after):>11}")
+
+        with engine.begin() as conn:
+            elapsed, wal, result = timed(conn, f"DELETE FROM {FLAT} WHERE conference_id = :conference", {"conference": conference_id})
+            print(f"{'one conference: flat':<28} {elapsed:>8.3f} {megabytes(wal):>8} {result.rowcount:>12} rows")
+            elapsed, wal, result = timed(
+                conn,
+                f"DELETE FROM {PARTITIONED} WHERE conference_id = :conference AND created_at >= :lower",
+                {"conference": conference_id, "lower": lower - timedelta(minutes=5)},
+            )
+            print(f"{'one conference: windowed':<28} {elapsed:>8.3f} {megabytes(wal):>8} {result.rowcount:>12} rows")
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {FLAT}, {PARTITIONED}"))
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000000)
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--conferences", type=int, default=200000)
+    parser.add_argument("--insert-rows", type=int, default=50000)
+    main(parser.parse_args())
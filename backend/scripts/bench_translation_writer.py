@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Benchmark: persisting Translation rows one commit per utterance vs the
+write-behind TranslationWriter.
+
+Seeds a conference with --speakers participants, then has every speaker
+produce --rows / --speakers final transcripts concurrently:
+  - per-row:      INSERT + COMMIT per utterance on its own session
+  - write-behind: TranslationWriter.submit() per utterance, drained at the
+                  end (multi-row INSERT per batch)
+Reports rows/sec until everything is durable, SQL statements and
+transactions, and the writer's flush metrics.
+
+Requires DATABASE_URL to point at a migrated database.
+
+Usage:
+    python scripts/bench_translation_writer.py [--rows 20000] [--speakers 50] [--batch-size 500]
+"""
+
+import argparse
+import asyncio
+import sys
+import os
+import time
+import uuid
+from datetime import datetime, timezone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, insert
+
+from app.core.database import AsyncSessionLocal, SessionLocal, async_engine, engine
+from app.models import Conference, ConferenceParticipant, Translation, User
+from app.models.conference import ConferenceStatus
+from app.services.conference_service import ConferenceService
+from app.services.translation_writer import TranslationWriter
+
+
+def seed(speakers: int):
+    db = SessionLocal()
+    try:
+        suffix = uuid.uuid4().hex[:8]
+        host = User(
+            email=f"bench_{suffix}@example.com",
+            username=f"bench_{suffix}",
+            full_name="Bench Host",
+            hashed_password="",
+            is_active=True,
+        )
+        db.add(host)
+        db.flush()
+        conference = Conference(
+            conference_code=ConferenceService.generate_conference_code(),
+            title="Bench conference",
+            host_id=host.id,
+            status=ConferenceStatus.STARTED,
+        )
+        db.add(conference)
+        db.flush()
+        participants = [
+            ConferenceParticipant(conference_id=conference.id, guest_name=f"Speaker {index}")
+            for index in range(speakers)
+        ]
+        db.add_all(participants)
+        db.commit()
+        return host.id, conference.id, [participant.id for participant in participants]
+    finally:
+        db.close()
+
+
+def cleanup(host_id, conference_id):
+    db = SessionLocal()
+    try:
+        db.query(Translation).filter(Translation.conference_id == conference_id).delete(synchronize_session=False)
+        db.query(ConferenceParticipant).filter(
+            ConferenceParticipant.conference_id == conference_id
+        ).delete(synchronize_session=False)
+        db.query(Conference).filter(Conference.id == conference_id).delete(synchronize_session=False)
+        db.query(User).filter(User.id == host_id).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def record(conference_id, speaker_id, index):
+    return {
+        "conference_id": conference_id,
+        "speaker_id": speaker_id,
+        "original_text": f"utterance {index} from the speaker, a sentence of typical length",
+        "translated_text": f"cau {index} cua dien gia, mot cau co do dai thong thuong",
+        "language_from": "en",
+        "language_to": "vi",
+        "translation_status": "completed",
+        "created_at": datetime.now(timezone.utc),
+    }
+
+
+async def per_row(conference_id, speakers, per_speaker):
+    async def speak(speaker_id):
+        for index in range(per_speaker):
+            async with AsyncSessionLocal() as db:
+                await db.execute(insert(Translation), [record(conference_id, speaker_id, index)])
+                await db.commit()
+
+    await asyncio.gather(*(speak(speaker_id) for speaker_id in speakers))
+    return None
+
+
+async def write_behind(conference_id, speakers, per_speaker, args):
+    writer = TranslationWriter(
+        async_engine, flush_ms=args.flush_ms, batch_size=args.batch_size, max_pending=args.rows
+    )
+
+    async def speak(speaker_id):
+        for index in range(per_speaker):
+            writer.submit(record(conference_id, speaker_id, index))
+            # Utterances arrive over time, not in one synchronous burst
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(speak(speaker_id) for speaker_id in speakers))
+    await writer.drain()
+    return writer.get_stats()
+
+
+async def main(args):
+    host_id, conference_id, speakers = seed(args.speakers)
+    per_speaker = args.rows // len(speakers)
+    total = per_speaker * len(speakers)
+
+    counters = {"statements": 0, "commits": 0}
+    count_statement = lambda *a: counters.__setitem__("statements", counters["statements"] + 1)
+    count_commit = lambda *a: counters.__setitem__("commits", counters["commits"] + 1)
+    event.listen(async_engine.sync_engine, "before_cursor_execute", count_statement)
+    event.listen(async_engine.sync_engine, "commit", count_commit)
+    try:
+        print(f"rows={total} speakers={len(speakers)} batch_size={args.batch_size} flush_ms={args.flush_ms}")
+        print(f"{'mode':<13} {'rows/s':>9} {'seconds':>8} {'stmts':>7} {'commits':>8}")
+        for mode in ("per-row", "write-behind"):
+            counters.update(statements=0, commits=0)
+            started = time.perf_counter()
+            if mode == "per-row":
+                stats = await per_row(conference_id, speakers, per_speaker)
+            else:
+                stats = await write_behind(conference_id, speakers, per_speaker, args)
+            elapsed = time.perf_counter() - started
+            print(
+                f"{mode:<13} {total / elapsed:>9.1f} {elapsed:>8.2f} "
+                f"{counters['statements']:>7} {counters['commits']:>8}"
+            )
+        print(
+            f"writer: flushes={stats['flushes']} avg_rows_per_flush={stats['avg_rows_per_flush']} "
+            f"flush_ms_avg={stats['flush_ms_avg']} flush_ms_max={stats['flush_ms_max']} "
+            f"written={stats['written']} failed={stats['failed']} dropped={stats['dropped']}"
+        )
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", count_statement)
+        event.remove(async_engine.sync_engine, "commit", count_commit)
+        cleanup(host_id, conference_id)
+        await async_engine.dispose()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--speakers", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--flush-ms", type=float, default=500.0)
+    asyncio.run(main(parser.parse_args()))
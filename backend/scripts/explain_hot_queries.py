@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+EXPLAIN ANALYZE the hot ConferenceService queries against a seeded database.
+
+Seeds hosts with conferences (a few of them live), participants (some of
+whom have left) and translations, runs ANALYZE, then prints the plan of
+each query with the index it is expected to use and whether the planner
+picked it. The queries are the service's own statements, so plans track
+the code.
+
+Requires DATABASE_URL to point at a database migrated to head.
+
+Usage:
+    python scripts/explain_hot_queries.py [--hosts 200] [--conferences 50]
+"""
+
+import argparse
+import random
+import sys
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert, select
+
+from app.core.database import SessionLocal, engine
+from app.models import Conference, ConferenceParticipant, Translation, User
+from app.models.conference import ConferenceStatus, ConferenceType
+from app.services.conference_service import ConferenceService
+from app.services.transcript_export import _transcript_stmt
+
+
+def seed(hosts: int, conferences_per_host: int, participants: int, translations: int):
+    db = SessionLocal()
+    try:
+        suffix = uuid.uuid4().hex[:6]
+        now = datetime.now(timezone.utc)
+        host_rows = [{
+            "id": uuid.uuid4(),
+            "email": f"explain_{suffix}_{index}@bench.local",
+            "username": f"explain_{suffix}_{index}",
+            "full_name": "Explain Host",
+            "hashed_password": "",
+            "is_active": True,
+        } for index in range(hosts)]
+        db.execute(insert(User), host_rows)
+
+        conference_rows, participant_rows, translation_rows = [], [], []
+        for host_index, host in enumerate(host_rows):
+            for index in range(conferences_per_host):
+                # Each host has at most one live conference, like production
+                status = ConferenceStatus.STARTED if index == 0 and host_index % 4 == 0 else ConferenceStatus.ENDED
+                conference_id = uuid.uuid4()
+                conference_rows.append({
+                    "id": conference_id,
+                    "conference_code": f"x{suffix[:2]}-{host_index:04d}{index:03d}-{suffix[2:5]}",
+                    "title": f"Explain conference {index}",
+                    "host_id": host["id"],
+                    "status": status,
+                    "type": ConferenceType.SCHEDULED,
+                    "is_active": True,
+                    "max_participants": 50,
+                    "language_from": "en",
+                    "language_to": "vi",
+                    "created_at": now - timedelta(minutes=index),
+                })
+                speakers = []
+                for seat in range(participants):
+                    participant_id = uuid.uuid4()
+                    speakers.append(participant_id)
+                    participant_rows.append({
+                        "id": participant_id,
+                        "conference_id": conference_id,
+                        "guest_name": f"Guest {seat}",
+                        "is_host": seat == 0,
+                        "left_at": None if status == ConferenceStatus.STARTED and seat % 2 == 0 else now,
+                    })
+                for line in range(translations):
+                    translation_rows.append({
+                        "id": uuid.uuid4(),
+                        "conference_id": conference_id,
+                        "speaker_id": random.choice(speakers),
+                        "original_text": f"line {line}",
+                        "translated_text": f"dong {line}",
+                        "language_from": "en",
+                        "language_to": "vi",
+                        "translation_status": "completed",
+                        "created_at": now - timedelta(minutes=index, seconds=-line),
+                    })
+        db.execute(insert(Conference), conference_rows)
+        db.execute(insert(ConferenceParticipant), participant_rows)
+        db.execute(insert(Translation), translation_rows)
+        db.commit()
+        return [host["id"] for host in host_rows]
+    finally:
+        db.close()
+
+
+def cleanup(host_ids):
+    db = SessionLocal()
+    try:
+        conference_ids = select(Conference.id).where(Conference.host_id.in_(host_ids))
+        db.query(Translation).filter(Translation.conference_id.in_(conference_ids)).delete(synchronize_session=False)
+        db.query(ConferenceParticipant).filter(
+            ConferenceParticipant.conference_id.in_(conference_ids)
+        ).delete(synchronize_session=False)
+        db.query(Conference).filter(Conference.host_id.in_(host_ids)).delete(synchronize_session=False)
+        db.query(User).filter(User.id.in_(host_ids)).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def hot_queries(db, host_id, conference_id):
+    """(label, expected index, statement) for each hot path"""
+    page = ConferenceService._participant_page_stmt(host_id, 0, 20)
+    return [
+        ("live conference for host", "uq_conferences_host_live",
+         ConferenceService._live_conference_stmt(host_id)),
+        ("host conference page", "ix_conferences_host_created_id", page),
+        ("active participants on page", "ix_conference_participants_active", page),
+        ("active participant count", "ix_conference_participants_active",
+         db.query(ConferenceParticipant).filter(
+             ConferenceParticipant.conference_id == conference_id,
+             ConferenceParticipant.left_at.is_(None)
+         ).statement),
+        ("stats: participants across host", "ix_conference_participants_active",
+         db.query(ConferenceParticipant).join(Conference).filter(
+             Conference.host_id == host_id,
+             ConferenceParticipant.left_at.is_(None)
+         ).statement),
+        # Per-partition copies of ix_translations_conference_created, named after the partition
+        ("conference transcript", "conference_id_created_at_idx",
+         _transcript_stmt(db.get(Conference, conference_id), None)),
+    ]
+
+
+def explain(db, statement) -> str:
+    compiled = statement.compile(dialect=engine.dialect, compile_kwargs={"render_postcompile": True})
+    rows = db.connection().exec_driver_sql(
+        "EXPLAIN (ANALYZE, BUFFERS) " + str(compiled), compiled.params
+    ).all()
+    return "\n".join(row[0] for row in rows)
+
+
+def main(args):
+    print(f"seeding {args.hosts} hosts x {args.conferences} conferences...")
+    host_ids = seed(args.hosts, args.conferences, args.participants, args.translations)
+    try:
+        db = SessionLocal()
+        try:
+            for table in ("conferences", "conference_participants", "translations"):
+                db.connection().exec_driver_sql(f"ANALYZE {table}")
+            # A host with a live conference (every 4th seeded host has one)
+            host_id = host_ids[0]
+            conference_id = db.scalar(ConferenceService._live_conference_stmt(host_id).with_only_columns(Conference.id))
+
+            missing = 0
+            for label, index, statement in hot_queries(db, host_id, conference_id):
+                plan = explain(db, statement)
+                used = index in plan
+                missing += not used
+                print(f"\n=== {label}: expects {index} -> {'USED' if used else 'NOT USED'}")
+                print(plan)
+        finally:
+            db.close()
+        print(f"\n{missing} quer{'y' if missing == 1 else 'ies'} without the expected index")
+    finally:
+        cleanup(host_ids)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hosts", type=int, default=200)
+    parser.add_argument("--conferences", type=int, default=50)
+    parser.add_argument("--participants", type=int, default=5)
+    parser.add_argument("--translations", type=int, default=20)
+    main(parser.parse_args())
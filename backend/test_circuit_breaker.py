@@ -0,0 +1,157 @@
+"""
+Tests for the translation circuit breaker's state machine
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from app.services import circuit_breaker
+from app.services.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker, "time", fake)
+    return fake
+
+
+def make_breaker(**kwargs) -> CircuitBreaker:
+    options = {"failure_threshold": 3, "slow_call_ms": 100.0, "open_seconds": 10.0, "half_open_probes": 1}
+    options.update(kwargs)
+    return CircuitBreaker("test", **options)
+
+
+def trip(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_trips_after_consecutive_failures(clock):
+    breaker = make_breaker()
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    # A healthy call resets the streak
+    breaker.record_success(10)
+    assert breaker.consecutive_failures == 0
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.is_open
+    assert not breaker.allow()
+    assert breaker.stats["trips"] == 1
+    assert breaker.stats["rejected"] == 1
+
+
+def test_slow_call_counts_as_failure(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.record_success(150)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.stats["slow_calls"] == 3
+    assert breaker.stats["failures"] == 0
+
+
+def test_stays_open_until_open_seconds_pass(clock):
+    breaker = make_breaker()
+    trip(breaker)
+    clock.advance(9.9)
+    assert breaker.is_open
+    assert not breaker.allow()
+
+    clock.advance(0.2)
+    # Checking does not use up the probe
+    assert not breaker.is_open
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+
+def test_late_success_does_not_close_open_circuit(clock):
+    breaker = make_breaker()
+    trip(breaker)
+    # A call that started before the trip answers healthy
+    breaker.record_success(10)
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_healthy_probe_closes(clock):
+    breaker = make_breaker()
+    trip(breaker)
+    clock.advance(10)
+
+    assert breaker.allow()
+    assert not breaker.allow(), "only one probe at a time"
+    breaker.record_success(10)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+    assert breaker.allow()
+    assert breaker.stats["probes"] == 1
+
+
+@pytest.mark.parametrize("verdict", ["failure", "slow"])
+def test_unhealthy_probe_reopens(clock, verdict):
+    breaker = make_breaker()
+    trip(breaker)
+    clock.advance(10)
+
+    assert breaker.allow()
+    if verdict == "failure":
+        breaker.record_failure()
+    else:
+        breaker.record_success(150)
+    # A single bad probe is enough, whatever the threshold
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.stats["trips"] == 2
+    assert not breaker.allow()
+
+    clock.advance(10)
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+
+def test_release_frees_probe_slot(clock):
+    breaker = make_breaker(half_open_probes=2)
+    trip(breaker)
+    clock.advance(10)
+
+    assert breaker.allow()
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    # The probe was cancelled (e.g. it lost a hedge): no verdict, slot freed
+    breaker.release()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+
+
+def test_release_when_closed_is_noop(clock):
+    breaker = make_breaker()
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.consecutive_failures == 0
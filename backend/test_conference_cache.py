@@ -0,0 +1,91 @@
+"""
+Tests for the join-by-code snapshot cache across backend nodes sharing one Redis
+"""
+
+import asyncio
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from app.services.conference_cache import ConferenceSnapshot, ConferenceSnapshotCache
+
+CODE = "ABC123"
+PENDING = ConferenceSnapshot("PENDING", b'{"status": "PENDING"}')
+STARTED = ConferenceSnapshot("STARTED", b'{"status": "STARTED"}')
+
+
+def make_node(server) -> ConferenceSnapshotCache:
+    """One backend node's cache, its Redis clients pointed at the shared fake server"""
+    cache = ConferenceSnapshotCache(max_entries=100, ttl_seconds=5.0, redis_url="redis://shared")
+    cache._redis._client = fakeredis.aioredis.FakeRedis(server=server)
+    cache._sync_redis = fakeredis.FakeRedis(server=server)
+    return cache
+
+
+async def returning(snapshot):
+    return snapshot
+
+
+def test_snapshot_is_shared_through_redis():
+    async def run():
+        server = fakeredis.FakeServer()
+        node_a, node_b = make_node(server), make_node(server)
+        assert await node_a.get_or_load(CODE, lambda: returning(PENDING)) == PENDING
+        assert await node_b.get(CODE) == PENDING
+        assert node_b.stats["redis_hits"] == 1
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("invalidate", ["async", "sync"])
+def test_load_racing_another_nodes_invalidation_is_not_written_back(invalidate):
+    async def run():
+        server = fakeredis.FakeServer()
+        node_a, node_b = make_node(server), make_node(server)
+        reading, resume = asyncio.Event(), asyncio.Event()
+
+        async def slow_read():
+            # Node A reads the row before the host starts the conference...
+            reading.set()
+            await resume.wait()
+            return PENDING
+
+        join = asyncio.create_task(node_a.get_or_load(CODE, slow_read))
+        await reading.wait()
+        # ...node B starts it and invalidates...
+        if invalidate == "async":
+            await node_b.invalidate_async(CODE)
+        else:
+            node_b.invalidate(CODE)
+        # ...then node A's read finishes
+        resume.set()
+        assert await join == PENDING
+
+        # The old status was stored neither in Redis nor on node A
+        assert node_a.stats["stale_sets_skipped"] == 1
+        assert await node_b.get(CODE) is None
+        assert await node_a.get_or_load(CODE, lambda: returning(STARTED)) == STARTED
+        assert await node_b.get(CODE) == STARTED
+
+    asyncio.run(run())
+
+
+def test_load_after_invalidation_is_written_back():
+    async def run():
+        server = fakeredis.FakeServer()
+        node_a, node_b = make_node(server), make_node(server)
+        await node_a.get_or_load(CODE, lambda: returning(PENDING))
+        await node_b.invalidate_async(CODE)
+        await node_b.invalidate_async(CODE)
+
+        # A load that starts after the invalidations sees the current version
+        assert await node_b.get_or_load(CODE, lambda: returning(STARTED)) == STARTED
+        node_a._local.clear()
+        assert await node_a.get(CODE) == STARTED
+        assert node_b.stats["stale_sets_skipped"] == 0
+
+    asyncio.run(run())
@@ -0,0 +1,162 @@
+"""
+Tests for ConferenceService status transitions and list cursors
+"""
+
+import asyncio
+import sys
+import os
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.core.database import SessionLocal
+from app.models import Conference, User
+from app.models.conference import ConferenceStatus
+from app.services import conference_service
+from app.services.conference_service import ConferenceService
+
+
+class FakeResult:
+    def __init__(self, row):
+        self.row = row
+
+    def scalars(self):
+        return self
+
+    def first(self):
+        return self.row
+
+
+class FakeSession:
+    """Answers each execute() with the next row in turn"""
+
+    def __init__(self, *rows):
+        self.rows = list(rows)
+        self.commits = 0
+
+    def execute(self, statement):
+        return FakeResult(self.rows.pop(0))
+
+    def commit(self):
+        self.commits += 1
+
+
+class FakeAsyncSession(FakeSession):
+    async def execute(self, statement):
+        return FakeSession.execute(self, statement)
+
+    async def commit(self):
+        FakeSession.commit(self)
+
+
+@pytest.fixture
+def invalidated(monkeypatch):
+    codes = []
+
+    async def invalidate_async(code):
+        codes.append(code)
+
+    monkeypatch.setattr(conference_service.conference_cache, "invalidate", codes.append)
+    monkeypatch.setattr(conference_service.conference_cache, "invalidate_async", invalidate_async)
+    return codes
+
+
+def start(session, mode):
+    if mode == "async":
+        return asyncio.run(ConferenceService.start_conference_async(session, uuid.uuid4(), uuid.uuid4()))
+    return ConferenceService.start_conference(session, uuid.uuid4(), uuid.uuid4())
+
+
+def make_session(mode, *rows):
+    return FakeAsyncSession(*rows) if mode == "async" else FakeSession(*rows)
+
+
+def conference(status):
+    return SimpleNamespace(conference_code="ABC123", status=status)
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_start_commits_and_invalidates(mode, invalidated):
+    session = make_session(mode, conference(ConferenceStatus.STARTED))
+    assert start(session, mode).status == ConferenceStatus.STARTED
+    assert session.commits == 1
+    assert invalidated == ["ABC123"]
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+@pytest.mark.parametrize("reread, message", [
+    (None, "Conference not found or not authorized"),
+    (conference(ConferenceStatus.ENDED), "Cannot start conference with status"),
+    # Pending again by the re-read: the start still did not happen
+    (conference(ConferenceStatus.PENDING), "Conference status changed while starting"),
+])
+def test_start_matching_no_row_raises(mode, reread, message, invalidated):
+    session = make_session(mode, None, reread)
+    with pytest.raises(ValueError, match=message):
+        start(session, mode)
+    assert session.commits == 0
+    assert invalidated == []
+
+
+def test_cursor_round_trip():
+    row = SimpleNamespace(created_at=datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc), id=uuid.uuid4())
+    cursor = ConferenceService.encode_cursor(row)
+    assert "=" not in cursor
+    assert ConferenceService.decode_cursor(cursor) == (row.created_at, row.id)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor",
+    "bm90LWEtZGF0ZXxub3QtYS11dWlk",  # "not-a-date|not-a-uuid"
+    "MjAyNC0wNS0wMVQxMjozMDoxNSswMDowMA",  # timestamp without the id
+    "gICA",  # not UTF-8
+])
+def test_tampered_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        ConferenceService.decode_cursor(cursor)
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        session.execute(text("SELECT 1"))
+    except OperationalError:
+        session.close()
+        pytest.skip("database not available")
+    try:
+        yield session
+    finally:
+        # Nothing is committed: the seeded rows go away with the transaction
+        session.rollback()
+        session.close()
+
+
+def test_cursor_pages_through_equal_created_at(db):
+    host = User(email=f"cursor_{uuid.uuid4().hex[:8]}@example.com", username=f"cursor_{uuid.uuid4().hex[:8]}",
+                hashed_password="")
+    db.add(host)
+    db.flush()
+    created_at = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    ids = []
+    for _ in range(5):
+        conference = Conference(conference_code=uuid.uuid4().hex[:12], title="Cursor", host_id=host.id,
+                                created_at=created_at)
+        db.add(conference)
+        db.flush()
+        ids.append(conference.id)
+
+    seen, cursor = [], None
+    for _ in range(3):
+        page = ConferenceService.get_conferences_with_participant_count(db, host.id, limit=2, cursor=cursor)
+        assert page["total"] == 5
+        seen.extend(conference.id for conference in page["conferences"])
+        cursor = page["next_cursor"]
+    # Ties on created_at are broken by id: no row repeated or skipped at a page boundary
+    assert seen == sorted(ids, reverse=True)
+    assert cursor is None
@@ -0,0 +1,49 @@
+"""
+Tests for splitting interim hypotheses into clauses for incremental translation
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from app.services.incremental_translator import split_clauses
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Hello there. How are", (["Hello there."], "How are")),
+    ("First, second; third: fourth!", (["First,", "second;", "third:", "fourth!"], "")),
+    ("Wait... what?! Fine", (["Wait...", "what?!"], "Fine")),
+    # A period inside a number is not a boundary
+    ("It costs 3.5 dollars. OK", (["It costs 3.5 dollars."], "OK")),
+    ("你好。我们开始吧，今天", (["你好。", "我们开始吧，"], "今天")),
+    ("no punctuation yet", ([], "no punctuation yet")),
+    ("", ([], "")),
+])
+def test_split_at_clause_punctuation(text, expected):
+    assert split_clauses(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Mr. Smith said hi", ([], "Mr. Smith said hi")),
+    ("Mr. Smith said hi. Then", (["Mr. Smith said hi."], "Then")),
+    ("Ask Mrs. Jones and Dr. Lee. Now", (["Ask Mrs. Jones and Dr. Lee."], "Now")),
+    ("We met on St. Mark's square. It", (["We met on St. Mark's square."], "It")),
+    ("Fruit, e.g. apples, i.e. food. Yes", (["Fruit,", "e.g. apples,", "i.e. food."], "Yes")),
+    ("J. R. R. Tolkien wrote it. Then", (["J. R. R. Tolkien wrote it."], "Then")),
+    # The pronoun still ends a sentence
+    ("So did I. Then we left", (["So did I."], "Then we left")),
+    # An abbreviation at the end of the hypothesis leaves the clause open
+    ("We called the Dr.", ([], "We called the Dr.")),
+])
+def test_abbreviations_and_initials_do_not_split(text, expected):
+    assert split_clauses(text) == expected
+
+
+def test_growing_hypothesis_keeps_earlier_clauses():
+    first, _ = split_clauses("Mr. Smith said hi. And then")
+    second, tail = split_clauses("Mr. Smith said hi. And then Dr. Lee left. So")
+    assert second[:len(first)] == first
+    assert second == ["Mr. Smith said hi.", "And then Dr. Lee left."]
+    assert tail == "So"
@@ -0,0 +1,90 @@
+"""
+Tests for the realtime WebSocket gateway's handling of client frames
+"""
+
+import base64
+import json
+import sys
+import os
+import uuid
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import realtime
+from app.models.conference import ConferenceStatus
+from app.services.realtime_service import room_manager
+
+CONFERENCE = SimpleNamespace(id=uuid.uuid4(), status=ConferenceStatus.STARTED, language_from="en", language_to="vi")
+SPEAKER = SimpleNamespace(id=uuid.uuid4(), guest_name="Speaker", can_speak=True, user_id=None)
+
+
+@pytest.fixture
+def published(monkeypatch):
+    """Calls that reached the room manager, with the socket connected as a speaker"""
+    calls = []
+
+    async def load_conference(conference_code, participant_id, user_id):
+        return CONFERENCE, SPEAKER
+
+    async def publish_transcript(**kwargs):
+        calls.append(("transcript", kwargs))
+
+    async def publish_audio(**kwargs):
+        calls.append(("audio", kwargs))
+        return True
+
+    monkeypatch.setattr(realtime, "_load_conference", load_conference)
+    monkeypatch.setattr(room_manager, "publish_transcript", publish_transcript)
+    monkeypatch.setattr(room_manager, "publish_audio", publish_audio)
+    return calls
+
+
+def connect():
+    app = FastAPI()
+    app.include_router(realtime.router, prefix="/realtime")
+    return TestClient(app).websocket_connect(f"/realtime/conferences/ABC?participant_id={SPEAKER.id}")
+
+
+def test_malformed_fields_do_not_drop_the_socket(published):
+    with connect() as websocket:
+        websocket.send_text(json.dumps({
+            "type": "transcript", "text": "hello", "language": ["en"], "segment_id": {}, "chunk_id": [1],
+        }))
+        websocket.send_text(json.dumps({
+            "type": "audio", "data": base64.b64encode(b"pcm").decode(), "language": {"code": "en"},
+            "segment_id": True, "chunk_id": None,
+        }))
+        websocket.send_text(json.dumps({
+            "type": "transcript", "text": "hi", "language": "x" * 50, "segment_id": "s" * 500, "chunk_id": 7,
+        }))
+        websocket.send_text(json.dumps({"type": "ping"}))
+        assert websocket.receive_json() == {"type": "pong"}
+
+    fields = [
+        (kind, call["source_language"], call["segment_id"], call["chunk_id"]) for kind, call in published
+    ]
+    assert fields == [
+        ("transcript", "en", None, None),
+        ("audio", "en", None, None),
+        ("transcript", "en", "s" * realtime.MAX_CLIENT_ID_LENGTH, "7"),
+    ]
+
+
+def test_well_formed_fields_are_passed_through(published):
+    with connect() as websocket:
+        websocket.send_text(json.dumps({
+            "type": "transcript", "text": " hola ", "language": "es", "segment_id": "seg-1",
+            "chunk_id": "chunk-1", "is_final": False,
+        }))
+        websocket.send_text(json.dumps({"type": "ping"}))
+        assert websocket.receive_json() == {"type": "pong"}
+
+    _, call = published[0]
+    assert (call["text"], call["source_language"], call["segment_id"], call["chunk_id"], call["is_final"]) == (
+        "hola", "es", "seg-1", "chunk-1", False
+    )
+    assert call["speaker"] == {"participant_id": str(SPEAKER.id), "name": "Speaker"}
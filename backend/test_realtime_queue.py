@@ -0,0 +1,111 @@
+"""
+Tests for a realtime connection's bounded send queue
+"""
+
+import asyncio
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi import status
+
+from app.services.realtime_service import RoomConnection
+
+
+class FakeWebSocket:
+    def __init__(self, stalled: bool = False):
+        self.sent = []
+        self.close_codes = []
+        self.stalled = stalled
+
+    async def send_text(self, payload: str) -> None:
+        if self.stalled:
+            await asyncio.Event().wait()
+        self.sent.append(payload)
+
+    async def close(self, code: int) -> None:
+        self.close_codes.append(code)
+
+
+def make_connection(max_queue: int = 8, stalled: bool = False) -> RoomConnection:
+    return RoomConnection(FakeWebSocket(stalled), "ABC123", "vi", max_queue=max_queue)
+
+
+def queued(connection: RoomConnection) -> list:
+    return [message.payload for message in connection._queue]
+
+
+def test_newer_interim_replaces_pending_one_in_place():
+    connection = make_connection()
+    connection.enqueue("a1", is_final=False, stream_key="a")
+    connection.enqueue("b1", is_final=False, stream_key="b")
+    connection.enqueue("a2", is_final=False, stream_key="a")
+    assert queued(connection) == ["a2", "b1"]
+    assert connection.stats["coalesced_interim"] == 1
+
+
+def test_interim_after_streams_final_is_not_coalesced_ahead_of_it():
+    connection = make_connection()
+    connection.enqueue("a1", is_final=False, stream_key="a")
+    connection.enqueue("A", is_final=True, stream_key="a")
+    connection.enqueue("a2", is_final=False, stream_key="a")
+    # The stale interim stays before the final, the new one goes after it
+    assert queued(connection) == ["a1", "A", "a2"]
+
+    connection.enqueue("a3", is_final=False, stream_key="a")
+    assert queued(connection) == ["a1", "A", "a3"]
+    assert connection.stats["coalesced_interim"] == 1
+
+
+def test_overflow_drops_interims_before_finals():
+    connection = make_connection(max_queue=3)
+    connection.enqueue("A", is_final=True, stream_key="a")
+    connection.enqueue("b1", is_final=False, stream_key="b")
+    connection.enqueue("C", is_final=True, stream_key="c")
+
+    # A new interim is dropped rather than displacing anything
+    assert connection.enqueue("d1", is_final=False, stream_key="d")
+    assert queued(connection) == ["A", "b1", "C"]
+
+    # A final makes room by dropping the oldest interim
+    assert connection.enqueue("E", is_final=True, stream_key="e")
+    assert queued(connection) == ["A", "C", "E"]
+    assert connection.stats["dropped_interim"] == 2
+    assert not connection.closed
+
+
+def test_queue_full_of_finals_disconnects_with_1013():
+    async def run():
+        connection = make_connection(max_queue=2, stalled=True)
+        connection.start()
+        assert connection.enqueue("A", is_final=True)
+        await asyncio.sleep(0)
+        # The writer is stuck on "A"; two more finals fill the queue
+        assert connection.enqueue("B", is_final=True)
+        assert connection.enqueue("C", is_final=True)
+
+        assert not connection.enqueue("D", is_final=True)
+        assert connection.closed
+        assert connection.queue_depth == 0
+        await connection._closer
+        assert connection.websocket.close_codes == [status.WS_1013_TRY_AGAIN_LATER]
+        assert not connection.enqueue("E", is_final=True)
+        await connection.stop()
+
+    asyncio.run(run())
+
+
+def test_writer_sends_in_queue_order():
+    async def run():
+        connection = make_connection()
+        connection.enqueue("a1", is_final=False, stream_key="a")
+        connection.enqueue("A", is_final=True, stream_key="a")
+        connection.enqueue("a2", is_final=False, stream_key="a")
+        connection.start()
+        while connection.queue_depth:
+            await asyncio.sleep(0)
+        await connection.stop()
+        assert connection.websocket.sent == ["a1", "A", "a2"]
+        assert connection.stats["sent"] == 3
+
+    asyncio.run(run())
@@ -0,0 +1,251 @@
+"""
+Tests for translation provider routing (rank_providers) and hedged calls
+"""
+
+import asyncio
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.translation_providers import MIN_P95_SAMPLES, TranslationProvider, load_providers, rank_providers
+from app.services.translation_service import TranslationService
+
+PAIR = ("en", "vi")
+
+
+@pytest.fixture(autouse=True)
+def routing_settings(monkeypatch):
+    for name, value in {
+        "TRANSLATION_BREAKER_ENABLED": True,
+        "TRANSLATION_BREAKER_FAILURES": 2,
+        "TRANSLATION_BREAKER_SLOW_CALL_MS": 5000.0,
+        "TRANSLATION_BREAKER_OPEN_SECONDS": 30.0,
+        "TRANSLATION_BREAKER_HALF_OPEN_PROBES": 1,
+        "TRANSLATION_PROVIDER_EWMA_ALPHA": 0.2,
+        "TRANSLATION_PROVIDER_SAMPLE_WINDOW": 200,
+        "TRANSLATION_PROVIDER_REFRESH_SECONDS": 10.0,
+        "TRANSLATION_HEDGING_ENABLED": True,
+        "TRANSLATION_HEDGE_MIN_DELAY_MS": 20.0,
+        "TRANSLATION_HEDGE_DEFAULT_DELAY_MS": 50.0,
+        "TRANSLATION_LATENCY_BUDGET_MS": 1000.0,
+        "TRANSLATION_POOL_MAX_CONNECTIONS": 10,
+        "TRANSLATION_POOL_MAX_KEEPALIVE": 4,
+    }.items():
+        monkeypatch.setattr(settings, name, value)
+
+
+def observe(provider: TranslationProvider, latency_ms: float, count: int = 1) -> None:
+    for _ in range(count):
+        provider.latency(PAIR).observe(latency_ms, settings.TRANSLATION_PROVIDER_EWMA_ALPHA)
+
+
+def names(providers) -> list:
+    return [provider.name for provider in providers]
+
+
+def test_rank_fastest_expected_first():
+    slow, fast = TranslationProvider("slow", "http://slow/"), TranslationProvider("fast", "http://fast/")
+    observe(slow, 80)
+    observe(fast, 40)
+    assert names(rank_providers([slow, fast], PAIR)) == ["fast", "slow"]
+
+
+def test_rank_penalises_error_rate():
+    flaky, steady = TranslationProvider("flaky", "http://flaky/"), TranslationProvider("steady", "http://steady/")
+    observe(flaky, 40)
+    for _ in range(3):
+        flaky.latency(PAIR).error(settings.TRANSLATION_PROVIDER_EWMA_ALPHA)
+    observe(steady, 60)
+    # 40ms at ~49% errors is worse than 60ms that always answers
+    assert names(rank_providers([flaky, steady], PAIR)) == ["steady", "flaky"]
+
+
+def test_rank_skips_open_breakers():
+    first, second = TranslationProvider("first", "http://first/"), TranslationProvider("second", "http://second/")
+    observe(first, 10)
+    observe(second, 90)
+    for _ in range(settings.TRANSLATION_BREAKER_FAILURES):
+        first.breaker.record_failure()
+    assert names(rank_providers([first, second], PAIR)) == ["second"]
+
+    # Due for a probe: routable again
+    first.breaker._opened_at -= settings.TRANSLATION_BREAKER_OPEN_SECONDS
+    assert names(rank_providers([first, second], PAIR)) == ["first", "second"]
+
+
+def test_rank_refreshes_unknown_and_stale_pairs():
+    known, unknown = TranslationProvider("known", "http://known/"), TranslationProvider("unknown", "http://unknown/")
+    observe(known, 10)
+    assert names(rank_providers([known, unknown], PAIR)) == ["unknown", "known"]
+
+    observe(unknown, 50)
+    assert names(rank_providers([known, unknown], PAIR)) == ["known", "unknown"]
+
+    unknown.latency(PAIR).updated_at -= settings.TRANSLATION_PROVIDER_REFRESH_SECONDS + 1
+    assert names(rank_providers([known, unknown], PAIR)) == ["unknown", "known"]
+
+
+def test_claim_refresh_holds_off_other_requests():
+    first, second = TranslationProvider("first", "http://first/"), TranslationProvider("second", "http://second/")
+    assert names(rank_providers([first, second], PAIR)) == ["first", "second"]
+
+    # Routed to for its unknown stats: the next request refreshes the other one
+    first.claim_refresh(PAIR, time.monotonic())
+    assert names(rank_providers([first, second], PAIR)) == ["second", "first"]
+
+    first.claim_refresh(PAIR, time.monotonic())
+    assert first.stats["refreshes"] == 1
+
+
+def test_hedge_delay_from_p95():
+    provider = TranslationProvider("provider", "http://provider/")
+    observe(provider, 100, MIN_P95_SAMPLES - 1)
+    assert provider.hedge_delay_ms(PAIR) == settings.TRANSLATION_HEDGE_DEFAULT_DELAY_MS
+
+    observe(provider, 100)
+    assert provider.hedge_delay_ms(PAIR) == 100
+
+    fast = TranslationProvider("fast", "http://fast/")
+    observe(fast, 2, MIN_P95_SAMPLES)
+    assert fast.hedge_delay_ms(PAIR) == settings.TRANSLATION_HEDGE_MIN_DELAY_MS
+
+
+def test_record_cancelled_call_gives_no_verdict():
+    provider = TranslationProvider("provider", "http://provider/")
+    for _ in range(settings.TRANSLATION_BREAKER_FAILURES):
+        provider.record(PAIR, time.monotonic(), False)
+    assert provider.breaker.state == CircuitBreaker.OPEN
+    # Errors carry no latency sample
+    assert len(provider.latency(PAIR).samples) == 0
+
+    provider.breaker._opened_at -= settings.TRANSLATION_BREAKER_OPEN_SECONDS
+    assert provider.allow()
+    error_rate = provider.latency(PAIR).error_rate
+    provider.record(PAIR, time.monotonic(), None)
+
+    # The probe slot is free again and the stats are untouched
+    assert provider.breaker.state == CircuitBreaker.HALF_OPEN
+    assert provider.allow()
+    assert provider.latency(PAIR).error_rate == error_rate
+    assert provider.stats["cancelled"] == 1
+
+
+def test_each_provider_has_its_own_pool(monkeypatch):
+    monkeypatch.setattr(settings, "TRANSLATION_API_KEY", None)
+    monkeypatch.setattr(settings, "TRANSLATION_PROVIDERS", [
+        {"name": "main", "url": "http://main/"},
+        {"name": "small", "url": "http://small/", "max_connections": 3, "max_keepalive": 1},
+    ])
+    main, small = load_providers()
+    try:
+        assert main.client() is not small.client()
+        assert main.client() is main.client()
+        pools = [provider.client()._transport._pool for provider in (main, small)]
+        assert [(pool._max_connections, pool._max_keepalive_connections) for pool in pools] == [(10, 4), (3, 1)]
+    finally:
+        asyncio.run(main.close())
+        asyncio.run(small.close())
+
+
+def make_service(upstreams: dict):
+    """
+    TranslationService over fake providers; upstreams maps a name to the
+    seconds it takes to answer, or to an HTTP status it fails with at once
+    """
+    requests = {name: 0 for name in upstreams}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        name = request.url.host
+        requests[name] += 1
+        behaviour = upstreams[name]
+        if isinstance(behaviour, int):
+            return httpx.Response(behaviour)
+        # Like a real transport, give up at the request's timeout (the call's deadline)
+        timeout = request.extensions["timeout"]["read"]
+        if behaviour > timeout:
+            await asyncio.sleep(timeout)
+            raise httpx.ReadTimeout("timed out", request=request)
+        await asyncio.sleep(behaviour)
+        return httpx.Response(200, json={"translated_text": name})
+
+    service = TranslationService()
+    service.cache = None
+    service.batcher = None
+    service.providers = [TranslationProvider(name, f"http://{name}/", "test") for name in upstreams]
+    for provider in service.providers:
+        provider._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return service, requests
+
+
+def hedged_call(service: TranslationService, budget: float = 1.0):
+    async def run():
+        try:
+            result = await service._hedged_call({"text": "hello"}, PAIR, time.monotonic() + budget)
+            # Let the cancelled loser run its cleanup
+            await asyncio.sleep(0.01)
+            return result
+        finally:
+            await service.shutdown()
+
+    return asyncio.run(run())
+
+
+def test_hedged_call_primary_answers_before_delay():
+    service, requests = make_service({"primary": 0.001, "backup": 0.001})
+    assert hedged_call(service) == {"translated_text": "primary"}
+    assert requests == {"primary": 1, "backup": 0}
+    assert service._hedge_counters == {"hedged": 0, "hedge_wins": 0}
+
+    pool_stats = service.get_pool_stats()
+    assert [(stats["name"], stats["requests"]) for stats in pool_stats["providers"]] == [("primary", 1), ("backup", 0)]
+    assert pool_stats["requests"] == 1
+    assert pool_stats["max_connections"] == 20
+
+
+def test_hedged_call_hedge_wins_and_loser_is_cancelled():
+    service, requests = make_service({"primary": 0.5, "backup": 0.001})
+    assert hedged_call(service) == {"translated_text": "backup"}
+    assert requests == {"primary": 1, "backup": 1}
+    assert service._hedge_counters == {"hedged": 1, "hedge_wins": 1}
+
+    primary = service.providers[0]
+    assert primary.stats["cancelled"] == 1
+    assert primary.stats["failures"] == 0
+    assert primary.breaker.consecutive_failures == 0
+
+
+def test_hedged_call_fails_over_without_waiting():
+    service, _ = make_service({"primary": 503, "backup": 0.001})
+    started = time.monotonic()
+    assert hedged_call(service) == {"translated_text": "backup"}
+    # A failed primary hedges right away instead of after the hedge delay
+    assert time.monotonic() - started < settings.TRANSLATION_HEDGE_DEFAULT_DELAY_MS / 1000
+    assert service.providers[0].stats["failures"] == 1
+    assert service._hedge_counters == {"hedged": 1, "hedge_wins": 1}
+
+
+def test_hedged_call_returns_none_when_all_fail():
+    service, requests = make_service({"primary": 503, "backup": 500})
+    assert hedged_call(service) is None
+    assert requests == {"primary": 1, "backup": 1}
+
+
+def test_hedged_call_without_hedging_uses_primary_only(monkeypatch):
+    monkeypatch.setattr(settings, "TRANSLATION_HEDGING_ENABLED", False)
+    service, requests = make_service({"primary": 0.1, "backup": 0.001})
+    assert hedged_call(service) == {"translated_text": "primary"}
+    assert requests == {"primary": 1, "backup": 0}
+
+
+def test_hedged_call_respects_deadline():
+    service, _ = make_service({"primary": 0.5, "backup": 0.5})
+    started = time.monotonic()
+    assert hedged_call(service, budget=0.1) is None
+    assert time.monotonic() - started < 0.3
+    assert [provider.stats["failures"] for provider in service.providers] == [1, 1]
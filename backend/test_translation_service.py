@@ -0,0 +1,147 @@
+"""
+Tests for TranslationService's single-flight sharing of identical requests
+"""
+
+import asyncio
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.services.translation_cache import TranslationCache
+from app.services.translation_providers import TranslationProvider
+from app.services.translation_service import TranslationService
+
+
+@pytest.fixture(autouse=True)
+def service_settings(monkeypatch):
+    for name, value in {
+        "TRANSLATION_BREAKER_ENABLED": True,
+        "TRANSLATION_BREAKER_FAILURES": 5,
+        "TRANSLATION_BREAKER_SLOW_CALL_MS": 5000.0,
+        "TRANSLATION_HEDGING_ENABLED": False,
+        "TRANSLATION_LATENCY_BUDGET_MS": 1000.0,
+    }.items():
+        monkeypatch.setattr(settings, name, value)
+
+
+class Upstream:
+    """One fake provider; answers once released, or with a fixed status"""
+
+    def __init__(self, status: int = 200):
+        self.status = status
+        self.requests = 0
+        self.cancelled = 0
+        self.release = asyncio.Event()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.status != 200:
+            return httpx.Response(self.status)
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return httpx.Response(200, json={"translated_text": "xin chào"})
+
+
+def make_service(upstream: Upstream) -> TranslationService:
+    service = TranslationService()
+    service.batcher = None
+    service.cache = TranslationCache(max_entries=100, ttl_seconds=60)
+    provider = TranslationProvider("provider", "http://provider/", "test")
+    provider._client = httpx.AsyncClient(transport=httpx.MockTransport(upstream.handler))
+    service.providers = [provider]
+    return service
+
+
+def translate(service: TranslationService, budget_ms: float = None):
+    return asyncio.create_task(service.translate_text("hello", "en", "vi", budget_ms=budget_ms))
+
+
+def test_identical_requests_share_one_call():
+    async def run():
+        upstream = Upstream()
+        service = make_service(upstream)
+        try:
+            waiters = [translate(service) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            upstream.release.set()
+            assert await asyncio.gather(*waiters) == ["xin chào"] * 3
+            assert upstream.requests == 1
+            assert service.get_single_flight_stats() == {"upstream_calls": 1, "coalesced": 2, "in_flight": 0}
+        finally:
+            await service.shutdown()
+
+    asyncio.run(run())
+
+
+def test_cancelled_waiter_does_not_cancel_shared_call():
+    async def run():
+        upstream = Upstream()
+        service = make_service(upstream)
+        try:
+            # The waiter that started the upstream call goes away
+            first = translate(service)
+            await asyncio.sleep(0.01)
+            second = translate(service)
+            await asyncio.sleep(0.01)
+            first.cancel()
+            await asyncio.sleep(0.01)
+
+            upstream.release.set()
+            assert await second == "xin chào"
+            assert first.cancelled()
+            assert (upstream.requests, upstream.cancelled) == (1, 0)
+            # The shared call still filled the cache
+            assert await translate(service) == "xin chào"
+            assert upstream.requests == 1
+        finally:
+            await service.shutdown()
+
+    asyncio.run(run())
+
+
+def test_timed_out_waiter_gets_fallback_while_call_goes_on():
+    async def run():
+        upstream = Upstream()
+        service = make_service(upstream)
+        try:
+            patient = translate(service)
+            await asyncio.sleep(0.01)
+            hurried = translate(service, budget_ms=20)
+            assert await hurried == "[English -> Vietnamese] hello"
+            assert service._deadline_counters["budget_exceeded"] == 1
+
+            upstream.release.set()
+            assert await patient == "xin chào"
+            assert (upstream.requests, upstream.cancelled) == (1, 0)
+        finally:
+            await service.shutdown()
+
+    asyncio.run(run())
+
+
+def test_fallback_is_not_cached():
+    async def run():
+        upstream = Upstream(status=503)
+        service = make_service(upstream)
+        try:
+            waiters = [translate(service) for _ in range(2)]
+            assert await asyncio.gather(*waiters) == ["[English -> Vietnamese] hello"] * 2
+            assert upstream.requests == 1
+
+            # The next request asks the provider again and caches its real answer
+            upstream.status = 200
+            upstream.release.set()
+            assert await translate(service) == "xin chào"
+            assert upstream.requests == 2
+            assert await service.cache.get(TranslationCache.make_key("hello", "en", "vi")) == "xin chào"
+        finally:
+            await service.shutdown()
+
+    asyncio.run(run())
@@ -57,6 +57,14 @@ export interface ConferenceWithParticipants extends Conference {
   participant_count: number;
 }
 
+export interface ConferenceList {
+  conferences: ConferenceWithParticipants[];
+  total: number;
+  page: number;
+  size: number;
+  next_cursor: string | null;
+}
+
 export interface ConferenceStats {
   total_conferences: number;
   active_conferences: number;
@@ -143,9 +151,18 @@ class ConferenceService {
   }
 
   async getMyConferences(skip = 0, limit = 100): Promise<ConferenceWithParticipants[]> {
+    const page = await this.getMyConferencesPage(skip, limit);
+    return page.conferences;
+  }
+
+  // Pass the previous page's next_cursor to continue; skip is ignored when a cursor is given
+  async getMyConferencesPage(skip = 0, limit = 100, cursor?: string | null): Promise<ConferenceList> {
     try {
+      const query = cursor
+        ? `cursor=${encodeURIComponent(cursor)}&limit=${limit}`
+        : `skip=${skip}&limit=${limit}`;
       const response = await axios.get(
-        `${API_BASE_URL}/api/v1/conferences/?skip=${skip}&limit=${limit}`,
+        `${API_BASE_URL}/api/v1/conferences/?${query}`,
         { headers: this.getAuthHeaders() }
       );
       return response.data;